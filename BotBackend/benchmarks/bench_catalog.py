@@ -0,0 +1,89 @@
+"""
+Bulk-load time and query latency of db/job_catalog.py at catalog sizes of
+100k+ synthetic jobs.
+
+    python -m benchmarks.bench_catalog --rows 100000 250000 --queries 200
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from db.job_catalog import JobCatalog
+from scraper.job_scraper import JobData
+
+ROLES = [
+    "Software Engineer", "Senior Software Engineer", "Data Scientist", "Data Engineer", "AI/ML Engineer",
+    "Frontend Developer", "Backend Developer", "DevOps Engineer", "Product Manager", "QA Engineer",
+    "Site Reliability Engineer", "Mobile Developer", "Security Analyst", "Cloud Architect", "Business Analyst",
+]
+CITIES = [
+    "London, England, United Kingdom", "Manchester, England, United Kingdom", "Bangalore, Karnataka, India",
+    "Berlin, Germany", "Paris, Ile-de-France, France", "New York, NY", "San Francisco, CA", "Remote",
+    "Toronto, Ontario, Canada", "Amsterdam, North Holland, Netherlands",
+]
+SKILLS = ["python", "java", "kubernetes", "react", "sql", "spark", "aws", "terraform", "pytorch", "go", "rust", "kafka"]
+
+
+def synthetic_jobs(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    for i in range(n):
+        role = rng.choice(ROLES)
+        yield JobData(
+            title=role,
+            company=f"Company {rng.randrange(5000)}",
+            location=rng.choice(CITIES),
+            job_link=f"https://www.linkedin.com/jobs/view/{4_000_000_000 + i}",
+            posted_date=f"{rng.randrange(1, 30)} days ago",
+            description=f"We are hiring a {role}. " + " ".join(rng.choices(SKILLS, k=60)),
+            job_id=str(4_000_000_000 + i),
+        )
+
+
+def percentile(samples, fraction):
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    directory = tempfile.mkdtemp()
+    rng = random.Random(1)
+
+    print(f"{'rows':>8} {'load s':>8} {'rows/s':>9} {'query':>22} {'p50 ms':>8} {'p95 ms':>8}")
+    for rows in args.rows:
+        catalog = JobCatalog(os.path.join(directory, f"catalog_{rows}.db"))
+        started = time.perf_counter()
+        batch = []
+        for job in synthetic_jobs(rows):
+            batch.append(job)
+            if len(batch) == 10000:
+                catalog.add_jobs(batch)
+                batch = []
+        catalog.add_jobs(batch)
+        load = time.perf_counter() - started
+
+        cases = {
+            "role + location": lambda: catalog.search(rng.choice(ROLES), rng.choice(CITIES).split(",")[0], args.limit),
+            "role only": lambda: catalog.search(rng.choice(ROLES), None, args.limit),
+            "skill + location": lambda: catalog.search(rng.choice(SKILLS), rng.choice(CITIES), args.limit),
+            "location only": lambda: catalog.latest(rng.choice(CITIES), args.limit),
+        }
+        for i, (name, query) in enumerate(cases.items()):
+            samples = []
+            for _ in range(args.queries):
+                started = time.perf_counter()
+                query()
+                samples.append((time.perf_counter() - started) * 1000)
+            prefix = f"{rows:>8} {load:>8.2f} {rows / load:>9.0f}" if i == 0 else " " * 27
+            print(f"{prefix} {name:>22} {statistics.median(samples):>8.2f} {percentile(samples, 0.95):>8.2f}")
+        catalog.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Latency and throughput of structuring staff records into Contacts: every
+record through the LLM (abatch) vs the deterministic mapper
+(scraper/contact_mapper.py) with abatch only for the records it can't map.
+The model is simulated (`--latency` seconds per call, `--concurrency` calls
+in flight) unless --live is given, which calls Gemini through reviewerAgent
+and needs its API keys. Records are synthetic staffspy records, so staffspy
+must be installed.
+
+    python -m benchmarks.bench_contact_mapper --sizes 10 100 1000 --incomplete 0.1
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Dict, List
+
+from benchmarks.bench_staff_records import synthetic_staff
+from scraper.contact_mapper import map_staff_records
+from state.contactState import Contacts
+
+
+class SimulatedModel:
+    """
+    Stand-in for model.with_structured_output(Contacts): each call takes
+    `latency` seconds, at most `concurrency` at a time
+    """
+
+    def __init__(self, latency: float, concurrency: int):
+        self.latency = latency
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.calls = 0
+
+    async def _call(self, record: Dict[str, Any]) -> Contacts:
+        async with self.semaphore:
+            self.calls += 1
+            await asyncio.sleep(self.latency)
+            return Contacts(
+                profile_link=record["profile_link"],
+                profile_id=record.get("profile_id") or "",
+                name=record["name"],
+                current_position="Engineer",
+                current_company="Company",
+                bio=record.get("bio") or "",
+                email=None,
+                skills=[],
+            )
+
+    async def abatch(self, records: List[Dict[str, Any]], return_exceptions: bool = False):
+        return await asyncio.gather(*(self._call(record) for record in records), return_exceptions=return_exceptions)
+
+
+def synthetic_records(n: int, incomplete: float, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    records = [staff.to_dict() for staff in synthetic_staff(n)]
+    for record in records:
+        if rng.random() < incomplete:
+            # nothing left to read a position or company from
+            record.update(current_position=None, current_company=None, headline="Open to opportunities", experiences=None)
+    return records
+
+
+async def llm_only(model, records):
+    mappable = [record for record in records if record.get("profile_link") and record.get("name") != "LinkedIn Member"]
+    return await model.abatch(mappable, return_exceptions=True)
+
+
+async def mapper_first(model, records):
+    contacts, unmapped = map_staff_records(records)
+    if unmapped:
+        contacts += await model.abatch(unmapped, return_exceptions=True)
+    return contacts
+
+
+def live_model():
+    from langchain_core.prompts import PromptTemplate
+
+    from reviewerAgent import model
+
+    structured = model.with_structured_output(Contacts)
+    template = PromptTemplate(
+        template="Extract all the details from the linkedin profile data \n Data:{rawtext}", input_variables=["rawtext"]
+    )
+
+    class Live:
+        calls = 0
+
+        async def abatch(self, records, return_exceptions=False):
+            self.calls += len(records)
+            prompts = [template.invoke({"rawtext": record}) for record in records]
+            return await structured.abatch(prompts, return_exceptions=return_exceptions)
+
+    return Live()
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--incomplete", type=float, default=0.1, help="fraction of records the mapper can't map")
+    parser.add_argument("--latency", type=float, default=2.0, help="seconds per simulated LLM call")
+    parser.add_argument("--concurrency", type=int, default=10, help="simulated LLM calls in flight")
+    parser.add_argument("--live", action="store_true", help="call Gemini instead of the simulated model")
+    args = parser.parse_args()
+
+    print(f"{'records':>8} {'path':>13} {'seconds':>8} {'records/s':>10} {'LLM calls':>10}")
+    for size in args.sizes:
+        records = synthetic_records(size, args.incomplete)
+        for name, path in [("llm", llm_only), ("mapper + llm", mapper_first)]:
+            model = live_model() if args.live else SimulatedModel(args.latency, args.concurrency)
+            started = time.perf_counter()
+            contacts = await path(model, records)
+            elapsed = time.perf_counter() - started
+            print(f"{size:>8} {name:>13} {elapsed:>8.3f} {len(contacts) / elapsed:>10.0f} {model.calls:>10}")
+
+    records = synthetic_records(max(args.sizes), 0.0)
+    started = time.perf_counter()
+    contacts, _ = map_staff_records(records)
+    elapsed = time.perf_counter() - started
+    print(f"\nmapper alone: {len(contacts)} records in {elapsed * 1000:.1f} ms ({len(contacts) / elapsed:.0f} records/s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
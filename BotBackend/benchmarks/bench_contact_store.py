@@ -0,0 +1,88 @@
+"""
+Contact persistence throughput against the in-process LocalDatabase, with
+`--latency` seconds per round trip standing in for Supabase. Compares the
+old Store node (read every saved profile link, then one insert per new
+contact), one bulk upsert per run, and concurrent runs coalesced by the
+write-behind ContactWriter.
+
+    python -m benchmarks.bench_contact_store --sizes 1 50 1000 --history 2000 --latency 0.05
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from typing import List
+
+from db.database import LocalDatabase
+from state.contactState import Contacts
+
+
+def synthetic_contacts(n: int, offset: int = 0) -> List[Contacts]:
+    return [
+        Contacts(
+            profile_link=f"https://www.linkedin.com/in/person-{offset + i}",
+            profile_id=f"person-{offset + i}",
+            name=f"Person {offset + i}",
+            current_position="Software Engineer",
+            current_company="Company",
+            bio="Building distributed systems.",
+            email=None,
+            skills=["python", "sql"],
+        )
+        for i in range(n)
+    ]
+
+
+def seeded_database(args) -> LocalDatabase:
+    db = LocalDatabase(latency=args.latency)
+    db.contacts["user"] = {
+        contact.profile_link: {"user_id": "user", **contact.model_dump()}
+        for contact in synthetic_contacts(args.history, offset=10_000_000)
+    }
+    return db
+
+
+async def per_row(db: LocalDatabase, user_id: str, contacts: List[Contacts]) -> int:
+    # what Store did before the bulk upsert
+    loop = asyncio.get_running_loop()
+    links = await loop.run_in_executor(None, db._contact_links, user_id)
+    stored = 0
+    for contact in contacts:
+        if contact.profile_link not in links:
+            row = {"id": str(uuid.uuid4()), "user_id": user_id, **contact.model_dump()}
+            await loop.run_in_executor(None, db._upsert_contacts, [row])
+            stored += 1
+    return stored
+
+
+async def run(args, size: int, path: str):
+    db = seeded_database(args)
+    runs = args.runs if path == "write-behind" else 1
+    batches = [synthetic_contacts(size // runs + (i < size % runs), offset=i * size) for i in range(runs)]
+    started = time.perf_counter()
+    if path == "per-row":
+        stored = await per_row(db, "user", batches[0])
+    else:
+        stored = sum(await asyncio.gather(*(db.add_contacts("user", batch) for batch in batches)))
+    elapsed = time.perf_counter() - started
+    db.close()
+    return elapsed, stored, db.round_trips
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 50, 1000])
+    parser.add_argument("--history", type=int, default=2000, help="contacts the user already has")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per database round trip")
+    parser.add_argument("--runs", type=int, default=10, help="concurrent graph runs sharing the write-behind queue")
+    args = parser.parse_args()
+
+    print(f"{'contacts':>8} {'path':>12} {'seconds':>8} {'contacts/s':>11} {'round trips':>12}")
+    for size in args.sizes:
+        for path in ("per-row", "bulk", "write-behind"):
+            elapsed, stored, round_trips = await run(args, size, path)
+            print(f"{size:>8} {path:>12} {elapsed:>8.3f} {stored / elapsed:>11.0f} {round_trips:>12}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""
+Memory of job records and cost of writing them out as the crawl grows:
+the old plain dataclasses + one json.dump blob vs slotted/interned records
+streamed to a JSON array, JSONL and Parquet.
+
+    python -m benchmarks.bench_export --sizes 1000 10000 50000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional
+
+from scraper.export import export_jobs, pa
+from scraper.job_scraper import JobData, job_from_dict
+
+COMPANIES = [f"Company {i}" for i in range(200)]
+LOCATIONS = [f"City {i}, Country" for i in range(50)]
+DESCRIPTION = "Build and operate backend services. " * 30
+
+
+@dataclass
+class LegacyEmployeeData:
+    name: str
+    title: str
+    profile_link: str
+
+
+@dataclass
+class LegacyJobData:
+    title: str
+    company: str
+    location: str
+    job_link: str
+    posted_date: str
+    description: Optional[str] = None
+    job_id: Optional[str] = None
+    employees: List[LegacyEmployeeData] = field(default_factory=list)
+
+
+def raw_rows(n: int):
+    # fresh strings per row, as parsed HTML produces them
+    for i in range(n):
+        yield {
+            "title": f"Software Engineer {i}",
+            "company": "".join(COMPANIES[i % len(COMPANIES)]),
+            "location": "".join(LOCATIONS[i % len(LOCATIONS)]),
+            "job_link": f"https://www.linkedin.com/jobs/view/{4_000_000_000 + i}",
+            "posted_date": f"{i % 30 + 1} days ago",
+            "description": "".join(DESCRIPTION),
+            "job_id": str(4_000_000_000 + i),
+            "employees": [],
+        }
+
+
+def measure(fn):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+
+def legacy_save(jobs, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json_output = [vars(job) for job in jobs]
+        for job_dict in json_output:
+            job_dict["employees"] = [vars(emp) for emp in job_dict["employees"]]
+        json.dump(json_output, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+    directory = tempfile.mkdtemp()
+
+    print(f"{'size':>7} {'step':>24} {'seconds':>8} {'peak MB':>8} {'file MB':>8}")
+    for size in args.sizes:
+        legacy, seconds, peak = measure(lambda: [LegacyJobData(**row) for row in raw_rows(size)])
+        print(f"{size:>7} {'build legacy records':>24} {seconds:>8.2f} {peak:>8.1f} {'':>8}")
+        jobs, seconds, peak = measure(lambda: [job_from_dict(row) for row in raw_rows(size)])
+        print(f"{size:>7} {'build slotted records':>24} {seconds:>8.2f} {peak:>8.1f} {'':>8}")
+
+        legacy_path = os.path.join(directory, "legacy.json")
+        _, seconds, peak = measure(lambda: legacy_save(legacy, legacy_path))
+        print(f"{size:>7} {'legacy json.dump':>24} {seconds:>8.2f} {peak:>8.1f} {os.path.getsize(legacy_path) / 1e6:>8.1f}")
+        del legacy
+
+        for name in ["jobs.json", "jobs.jsonl"] + (["jobs.parquet"] if pa is not None else []):
+            path = os.path.join(directory, name)
+            _, seconds, peak = measure(lambda: export_jobs(jobs, path))
+            print(f"{size:>7} {'stream ' + name:>24} {seconds:>8.2f} {peak:>8.1f} {os.path.getsize(path) / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
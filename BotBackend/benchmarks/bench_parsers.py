@@ -0,0 +1,73 @@
+"""
+Parse throughput of each ParserBackend over the HTML fixtures in
+benchmarks/fixtures: search_*.html files feed parse_cards and job_*.html
+files feed parse_description. Outputs are checked against the
+BeautifulSoup reference backend before timing.
+
+    python -m benchmarks.bench_parsers --seconds 2
+"""
+import argparse
+import time
+from pathlib import Path
+
+from scraper.parsers import PARSER_BACKENDS, SoupParserBackend, get_parser_backend
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def load(pattern: str):
+    return [path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob(pattern))]
+
+
+def measure(fn, pages, seconds: float):
+    """
+    Run fn over every page repeatedly for about `seconds`; returns
+    (rounds, elapsed, items produced per round)
+    """
+    items = 0
+    for page in pages:
+        result = fn(page)
+        items += len(result) if isinstance(result, list) else 1
+    rounds = 0
+    started = time.perf_counter()
+    while True:
+        for page in pages:
+            fn(page)
+        rounds += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= seconds:
+            return rounds, elapsed, items
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--backends", nargs="+", default=list(PARSER_BACKENDS))
+    args = parser.parse_args()
+
+    search_pages = load("search_*.html")
+    job_pages = load("job_*.html")
+    search_mb = sum(len(page.encode()) for page in search_pages) / 1e6
+    job_mb = sum(len(page.encode()) for page in job_pages) / 1e6
+    reference = SoupParserBackend()
+
+    print(f"{len(search_pages)} search page(s) {search_mb:.2f} MB, {len(job_pages)} job page(s) {job_mb:.2f} MB")
+    print(f"{'backend':>10} {'cards/s':>10} {'search MB/s':>12} {'descs/s':>10} {'job MB/s':>10}")
+    for name in args.backends:
+        backend = get_parser_backend(name)
+        for page in search_pages:
+            assert backend.parse_cards(page) == reference.parse_cards(page), f"{name} cards differ from soup"
+        for page in job_pages:
+            assert backend.parse_description(page) == reference.parse_description(page), f"{name} description differs"
+
+        rounds, elapsed, cards = measure(backend.parse_cards, search_pages, args.seconds)
+        cards_per_sec = rounds * cards / elapsed
+        search_mb_per_sec = rounds * search_mb / elapsed
+        rounds, elapsed, _ = measure(backend.parse_description, job_pages, args.seconds)
+        descs_per_sec = rounds * len(job_pages) / elapsed
+        job_mb_per_sec = rounds * job_mb / elapsed
+        print(f"{backend.name:>10} {cards_per_sec:>10.0f} {search_mb_per_sec:>12.2f} {descs_per_sec:>10.1f} {job_mb_per_sec:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
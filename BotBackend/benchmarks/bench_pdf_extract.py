@@ -0,0 +1,128 @@
+"""
+Resume PDF text extraction, before and after pdf_extract.py: pdfplumber
+page by page on the event loop (what loadResume did) vs the PdfExtractor
+process pool with each backend. Reports pages/sec and the longest event
+loop stall while a document is parsed. PDFs are generated, with
+`--lines` lines of text per page.
+
+    python -m benchmarks.bench_pdf_extract --pages 2 20 50 --workers 4
+"""
+import argparse
+import asyncio
+import time
+from io import BytesIO
+from typing import List
+
+import pdfplumber
+
+from pdf_extract import BACKENDS, PdfExtractor, pypdf, pypdfium2
+
+
+def synthetic_pdf(pages: int, lines: int) -> bytes:
+    """
+    A minimal valid PDF: one Helvetica text stream per page
+    """
+    objects: List[bytes] = []
+    page_ids = [4 + 2 * i for i in range(pages)]
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {pages} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for page in range(pages):
+        text = "".join(
+            f"({f'Page {page + 1} line {line + 1}: Python, SQL, Kubernetes, led a team of five engineers'}) Tj T* "
+            for line in range(lines)
+        )
+        stream = f"BT /F1 9 Tf 11 TL 40 800 Td {text}ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Resources << /Font << /F1 3 0 R >> >> "
+            f"/Contents {page_ids[page] + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+async def on_loop(pdf_bytes: bytes) -> str:
+    # what loadResume did before pdf_extract.py
+    raw_text = ""
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        for page in pdf.pages:
+            raw_text += page.extract_text() or ""
+    return raw_text
+
+
+async def measure(extract, pdf_bytes: bytes, repeat: int):
+    """
+    Seconds per document and the longest gap between event loop ticks
+    """
+    longest = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal longest
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            longest = max(longest, now - last - 0.001)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        text = await extract(pdf_bytes)
+        # let the ticker run between documents so stalls are per document
+        await asyncio.sleep(0)
+    elapsed = (time.perf_counter() - started) / repeat
+    running = False
+    await task
+    if not text:
+        raise RuntimeError("no text extracted")
+    return elapsed, longest
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[2, 20, 50])
+    parser.add_argument("--lines", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    available = {"pdfium": pypdfium2 is not None, "pypdf": pypdf is not None, "pdfplumber": True}
+    extractors = {
+        backend: PdfExtractor(args.workers, backend, max_pages=max(args.pages))
+        for backend in BACKENDS
+        if available[backend]
+    }
+    for extractor in extractors.values():
+        # start the worker processes outside the timings
+        await extractor.warm_up()
+
+    print(f"{'pages':>6} {'path':>18} {'ms/doc':>9} {'pages/s':>9} {'max stall ms':>13}")
+    for pages in args.pages:
+        pdf_bytes = synthetic_pdf(pages, args.lines)
+        paths = [("on loop pdfplumber", on_loop)]
+        paths += [(f"pool {backend}", extractor.extract_text) for backend, extractor in extractors.items()]
+        for name, extract in paths:
+            elapsed, stall = await measure(extract, pdf_bytes, args.repeat)
+            print(f"{pages:>6} {name:>18} {elapsed * 1000:>9.1f} {pages / elapsed:>9.0f} {stall * 1000:>13.1f}")
+
+    for extractor in extractors.values():
+        extractor.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
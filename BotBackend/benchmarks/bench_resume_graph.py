@@ -0,0 +1,69 @@
+"""
+Critical path of the job matching graph (resume_graph.py): the original
+sequential chain vs the job search running alongside the resume branch,
+for a new resume and for one already processed (resume memo hit). Nodes
+sleep for the given seconds instead of calling Supabase, Gemini, Pinecone
+and LinkedIn.
+
+    python -m benchmarks.bench_resume_graph --load 0.5 --extract 4 --embed 1 --jobs 6
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+
+from resume_graph import build_resume_graph
+from state.resumeState import ProfileSchema
+
+PROFILE = ProfileSchema(
+    skills=["python"], experience_years=3, education=[], projects=[], achievements=[], location="London", role="Engineer"
+)
+
+
+def simulated_nodes(args, memo_hit: bool):
+    async def load(state):
+        await asyncio.sleep(args.load)
+        if memo_hit:
+            return {"resume_hash": "h", "embedded_hash": "h", "extracted_data": PROFILE, "status": "STRUCTURED"}
+        return {"raw_text": "resume", "resume_hash": "h", "embedded_hash": None, "status": "TEXT_EXTRACTED"}
+
+    async def extract(state):
+        await asyncio.sleep(args.extract)
+        return {"extracted_data": PROFILE, "status": "STRUCTURED"}
+
+    async def embed(state):
+        await asyncio.sleep(args.embed)
+        return {"embedded_hash": state["resume_hash"], "status": "EMBEDDING_GENERATED"}
+
+    async def jobs(state):
+        await asyncio.sleep(args.jobs)
+        return {"ScrapedJobs": [], "status": "COMPLETED"}
+
+    return load, extract, embed, jobs
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--load", type=float, default=0.5, help="seconds to fetch and parse the resume")
+    parser.add_argument("--extract", type=float, default=4.0, help="seconds for the profile LLM call")
+    parser.add_argument("--embed", type=float, default=1.0, help="seconds to embed and upsert to Pinecone")
+    parser.add_argument("--jobs", type=float, default=6.0, help="seconds to search LinkedIn")
+    args = parser.parse_args()
+    state = {"user_id": "user", "prefered_role": "Engineer", "prefered_location": "London", "extracted_data": None}
+
+    print(f"{'resume':>8} {'graph':>11} {'wall s':>7} {'sequential s':>13} {'saved s':>8}")
+    for memo_hit in (False, True):
+        for parallel in (False, True):
+            graph = build_resume_graph(*simulated_nodes(args, memo_hit), parallel=parallel)
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = await graph.ainvoke(state)
+            breakdown = result["timing_breakdown"]
+            print(
+                f"{'memo hit' if memo_hit else 'new':>8} {'parallel' if parallel else 'sequential':>11} "
+                f"{breakdown['wall']:>7.2f} {breakdown['sequential']:>13.2f} {breakdown['saved']:>8.2f}"
+            )
+    print("\nlast run:", {name: seconds for name, seconds in breakdown.items() if name not in ("sequential", "wall", "saved")})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+"""
+Wall-clock time of LinkedInJobsScraper.scrape_jobs against a local fake
+LinkedIn server, sequential (max_concurrency=1) vs concurrent descriptions.
+
+    python -m benchmarks.bench_scrape_jobs --sizes 5 25 50 --latency 0.2
+
+With --server-rps the fake server answers 429 beyond that rate, which
+exercises the adaptive controller; its metrics are printed per run.
+
+    python -m benchmarks.bench_scrape_jobs --sizes 25 --server-rps 8
+
+With --cache each size is also scraped twice through a shared in-memory
+response cache, cold then warm.
+
+With --incremental each size is crawled once as a saved search, then 3 new
+postings are published and the search is refreshed incrementally.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+
+from benchmarks.fake_linkedin import FakeLinkedInServer
+from scraper.http_cache import MemoryCacheBackend, ResponseCache
+from scraper.job_index import MemoryJobIndex
+from scraper.job_scraper import LinkedInJobsScraper, ScraperConfig
+from scraper.rate_limiter import HostRateLimiter
+from scraper.search_store import MemorySearchStore
+
+
+async def run_once(
+    server: FakeLinkedInServer, max_jobs: int, concurrency: int, rps: float, burst: int, cache=None, index=None
+):
+    limiter = HostRateLimiter(rps, burst)
+    async with LinkedInJobsScraper(
+        rate_limiter=limiter,
+        max_concurrency=concurrency,
+        cache=cache,
+        use_cache=cache is not None,
+        index=index if index is not None else MemoryJobIndex(),
+    ) as scraper:
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            jobs = await scraper.scrape_jobs("Software Engineer", "London", max_jobs=max_jobs)
+        elapsed = time.perf_counter() - started
+        metrics = scraper.metrics()
+    assert len(jobs) == max_jobs
+    lost = sum(1 for job in jobs if not job.description or job.description == "N/A")
+    return elapsed, lost, metrics
+
+
+async def run_incremental(server: FakeLinkedInServer, max_jobs: int, concurrency: int, rps: float, burst: int):
+    store = MemorySearchStore()
+    runs = []
+    for publish in (0, 3):
+        server.publish(publish)
+        limiter = HostRateLimiter(rps, burst)
+        requests_before = server.request_count
+        async with LinkedInJobsScraper(
+            rate_limiter=limiter, max_concurrency=concurrency, use_cache=False, index=MemoryJobIndex(), search_store=store
+        ) as scraper:
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                jobs = await scraper.scrape_jobs("Software Engineer", "London", max_jobs=max_jobs, incremental=True)
+            elapsed = time.perf_counter() - started
+        assert len(jobs) == max_jobs
+        runs.append(f"{elapsed:.2f}s/{server.request_count - requests_before} requests")
+    return runs
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 25, 50])
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=ScraperConfig.MAX_CONCURRENT_REQUESTS)
+    parser.add_argument("--rps", type=float, default=50.0)
+    parser.add_argument("--burst", type=int, default=ScraperConfig.REQUEST_BURST)
+    parser.add_argument("--server-rps", type=int, default=None)
+    parser.add_argument("--cache", action="store_true")
+    parser.add_argument("--incremental", action="store_true")
+    args = parser.parse_args()
+
+    async with FakeLinkedInServer(latency=args.latency, max_rps=args.server_rps) as server:
+        ScraperConfig.BASE_URL = server.search_url
+        print(f"latency={args.latency}s rps={args.rps} burst={args.burst} server_rps={args.server_rps}")
+        print(f"{'max_jobs':>8} {'sequential (s)':>15} {f'concurrency={args.concurrency} (s)':>20} {'speedup':>8} {'lost':>5}")
+        for size in args.sizes:
+            sequential, _, _ = await run_once(server, size, 1, args.rps, args.burst)
+            concurrent, lost, metrics = await run_once(server, size, args.concurrency, args.rps, args.burst)
+            print(f"{size:>8} {sequential:>15.2f} {concurrent:>20.2f} {sequential / concurrent:>7.1f}x {lost:>5}")
+            print(f"         metrics: {metrics}")
+            if args.cache:
+                cache = ResponseCache(MemoryCacheBackend(), ScraperConfig.CACHE_SEARCH_TTL, ScraperConfig.CACHE_DETAIL_TTL)
+                cold, _, _ = await run_once(server, size, args.concurrency, args.rps, args.burst, cache)
+                warm, _, metrics = await run_once(server, size, args.concurrency, args.rps, args.burst, cache)
+                print(f"         cache: cold {cold:.2f}s warm {warm:.3f}s {metrics['cache']}")
+            if args.incremental:
+                full, refresh = await run_incremental(server, size, args.concurrency, args.rps, args.burst)
+                print(f"         incremental: full crawl {full}, refresh after 3 new postings {refresh}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""
+Referral (staff search) throughput of scraper/staff_pool.py as accounts are
+added. Each account answers after `latency` seconds, from a recorded staff
+cassette when one is given, otherwise with synthetic records.
+
+    python -m benchmarks.bench_staff_pool --accounts 1 2 4 --searches 40 --latency 0.5
+    python -m benchmarks.bench_staff_pool --cassette benchmarks/cassettes/staff_google.json
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+from typing import Any, Dict, List
+
+from scraper.staff_pool import StaffScraperPool
+
+
+class SleepingAccount:
+    """
+    Stand-in for LinkedInAccountScraper: blocks its thread like staffspy does
+    """
+
+    def __init__(self, latency: float, fail_every: int = 0):
+        self.latency = latency
+        self.fail_every = fail_every
+        self.calls = 0
+
+    def scrape_staff_to_dict(self, params: Any) -> List[Dict[str, Any]]:
+        self.calls += 1
+        time.sleep(self.latency)
+        if self.fail_every and self.calls % self.fail_every == 0:
+            raise RuntimeError("simulated LinkedIn failure")
+        return [{"name": f"Person {i}", "profile_link": f"https://www.linkedin.com/in/person-{i}"} for i in range(5)]
+
+    def close(self) -> None:
+        pass
+
+
+def make_accounts(args, count: int) -> List[Any]:
+    if args.cassette:
+        # needs staffspy installed, like the scraper it replays
+        from benchmarks.staff_cassette import ReplayAccountScraper
+
+        return [ReplayAccountScraper(args.cassette, latency=args.latency) for _ in range(count)]
+    return [SleepingAccount(args.latency, args.fail_every) for _ in range(count)]
+
+
+async def run(args, accounts: int) -> Dict[str, float]:
+    pool = StaffScraperPool(
+        make_accounts(args, accounts),
+        strategy=args.strategy,
+        max_queue=args.max_queue,
+        request_interval=args.interval,
+        failure_cooldown=args.failure_cooldown,
+    )
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = await asyncio.gather(*(pool.scrape(i) for i in range(args.searches)), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    pool.close()
+    failed = sum(1 for result in results if isinstance(result, Exception))
+    return {"seconds": elapsed, "searches_per_sec": args.searches / elapsed, "failed": failed}
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--accounts", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--searches", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds per staff search")
+    parser.add_argument("--interval", type=float, default=0.1, help="per-account cooldown between searches")
+    parser.add_argument("--failure-cooldown", type=float, default=1.0)
+    parser.add_argument("--fail-every", type=int, default=0, help="every Nth search on an account fails")
+    parser.add_argument("--strategy", default="least_loaded")
+    parser.add_argument("--max-queue", type=int, default=10)
+    parser.add_argument("--cassette", default=None)
+    args = parser.parse_args()
+
+    print(f"{'accounts':>8} {'seconds':>8} {'searches/s':>11} {'failed':>7}")
+    for accounts in args.accounts:
+        result = await run(args, accounts)
+        print(f"{accounts:>8} {result['seconds']:>8.2f} {result['searches_per_sec']:>11.2f} {result['failed']:>7}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
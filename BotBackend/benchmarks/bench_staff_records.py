@@ -0,0 +1,114 @@
+"""
+Cost of turning a staffspy search into records: the DataFrame path
+(LinkedInAccount.scrape_staff + to_dict('records')) vs
+LinkedInAccountScraper.iter_staff, plus the import time saved by loading
+staffspy/pandas lazily. Staff search results are synthetic, so no account
+is needed, but staffspy and pandas must be installed.
+
+    python -m benchmarks.bench_staff_records --sizes 50 1000
+"""
+import argparse
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import List
+
+from staffspy import LinkedInAccount
+from staffspy.linkedin.linkedin import LinkedInScraper
+from staffspy.utils.models import Experience, School, Skill, Staff
+
+from scraper.profile_scraper import LinkedInAccountScraper, LinkedInScraperConfig, StaffSearchParams
+
+
+def synthetic_staff(n: int) -> List[Staff]:
+    staff = []
+    for i in range(n):
+        staff.append(
+            Staff(
+                search_term="software engineer",
+                id=str(i),
+                name="LinkedIn Member" if i % 7 == 0 else f"Person {i}",
+                headline=f"Software Engineer at Company {i % 20}",
+                profile_id=f"person-{i}",
+                profile_link=f"https://www.linkedin.com/in/person-{i}",
+                bio="Building distributed systems. " * 10,
+                followers=i * 3 if i % 2 else None,
+                connections=500,
+                location="London, England, United Kingdom",
+                skills=[Skill(name=f"skill {j}", endorsements=j) for j in range(8)],
+                experiences=[Experience(title="Engineer", company=f"Company {(i + j) % 20}") for j in range(4)],
+                schools=[School(school="University of London", degree="BSc")],
+            )
+        )
+    return staff
+
+
+class StubAccountScraper(LinkedInAccountScraper):
+    """
+    LinkedInAccountScraper over a LinkedInAccount whose search returns the
+    given staff instead of calling LinkedIn
+    """
+
+    def __init__(self, staff: List[Staff]):
+        super().__init__(LinkedInScraperConfig())
+        LinkedInScraper.scrape_staff = lambda scraper, **kwargs: staff
+        account = LinkedInAccount.__new__(LinkedInAccount)
+        account.session = None
+        account.on_block = False
+        self.account = account
+        self.isInitialized = True
+
+
+def dataframe_records(scraper: LinkedInAccountScraper, params: StaffSearchParams):
+    # what scrape_staff_to_dict did before iter_staff
+    df = scraper.scrape_staff(params)
+    return df.to_dict("records") if not df.empty else []
+
+
+def measure(fn, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - started) / repeat
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def import_seconds(statement: str, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        samples.append(time.perf_counter() - started)
+    return min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'records':>8} {'path':>10} {'ms':>8} {'peak MB':>8}")
+    for size in args.sizes:
+        scraper = StubAccountScraper(synthetic_staff(size))
+        params = StaffSearchParams(company_name="Company", max_results=min(size, 1000))
+        for name, fn in [
+            ("dataframe", lambda: dataframe_records(scraper, params)),
+            ("iter", lambda: list(scraper.iter_staff(params))),
+        ]:
+            seconds, peak = measure(fn, args.repeat)
+            print(f"{size:>8} {name:>10} {seconds * 1000:>8.1f} {peak:>8.2f}")
+
+    interpreter = import_seconds("pass", args.repeat)
+    lazy = import_seconds("import scraper.profile_scraper", args.repeat) - interpreter
+    eager = import_seconds("import scraper.profile_scraper, staffspy, pandas", args.repeat) - interpreter
+    print(f"\nimport scraper.profile_scraper: {lazy * 1000:.0f} ms lazy, {eager * 1000:.0f} ms with staffspy/pandas at load")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+End-to-end scraper benchmark over replayed LinkedIn pages, no network needed.
+For each size it reports scrape_jobs throughput, time spent in the HTML
+parser and peak traced memory.
+
+    python -m benchmarks.bench_suite --sizes 5 100 1000
+    python -m benchmarks.bench_suite --cassette benchmarks/cassettes/software_engineer_london.json
+
+Save a baseline and check later runs against it (exits 1 on regression):
+
+    python -m benchmarks.bench_suite --save baseline.json
+    python -m benchmarks.bench_suite --compare baseline.json --tolerance 0.2
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from benchmarks.cassette import Cassette
+from benchmarks.fake_linkedin import ReplayLinkedInServer
+from scraper.job_index import MemoryJobIndex
+from scraper.job_scraper import LinkedInJobsScraper, ScraperConfig
+from scraper.parsers import ParserBackend, get_parser_backend
+from scraper.rate_limiter import HostRateLimiter
+from scraper.search_store import MemorySearchStore
+
+
+class TimedParser(ParserBackend):
+    """
+    Wraps a backend and accumulates the seconds spent parsing
+    """
+
+    def __init__(self, inner: ParserBackend):
+        self.inner = inner
+        self.name = inner.name
+        self.seconds = 0.0
+
+    def parse_cards(self, text: str) -> List[Dict[str, str]]:
+        started = time.perf_counter()
+        try:
+            return self.inner.parse_cards(text)
+        finally:
+            self.seconds += time.perf_counter() - started
+
+    def parse_description(self, text: str) -> Optional[str]:
+        started = time.perf_counter()
+        try:
+            return self.inner.parse_description(text)
+        finally:
+            self.seconds += time.perf_counter() - started
+
+
+async def scrape(args, size: int, trace_memory: bool) -> Dict[str, float]:
+    cassette = Cassette.load(args.cassette) if args.cassette else Cassette.from_fixtures()
+    async with ReplayLinkedInServer(
+        cassette, total_jobs=size, latency=args.latency, throttle_every=args.throttle_every
+    ) as server:
+        ScraperConfig.BASE_URL = server.search_url
+        parser = TimedParser(get_parser_backend(args.parser))
+        scraper = LinkedInJobsScraper(
+            rate_limiter=HostRateLimiter(args.rps, args.burst),
+            max_concurrency=args.concurrency,
+            use_cache=False,
+            parser=parser,
+            index=MemoryJobIndex(),
+            search_store=MemorySearchStore(),
+        )
+        if trace_memory:
+            tracemalloc.start()
+        async with scraper:
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                jobs = await scraper.scrape_jobs("Software Engineer", "London", max_jobs=size)
+            elapsed = time.perf_counter() - started
+        peak = 0
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return {
+        "jobs": len(jobs),
+        "seconds": round(elapsed, 3),
+        "jobs_per_sec": round(len(jobs) / elapsed, 1),
+        "parse_seconds": round(parser.seconds, 3),
+        "parse_share": round(parser.seconds / elapsed, 3),
+        "peak_mb": round(peak / 1e6, 2),
+        "requests": server.request_count,
+        "throttled": server.throttled_count,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 100, 1000])
+    parser.add_argument("--cassette", default=None, help="recorded cassette, defaults to benchmarks/fixtures")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--throttle-every", type=int, default=None, help="answer every Nth request with 429")
+    parser.add_argument("--parser", default=ScraperConfig.PARSER_BACKEND)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rps", type=float, default=1000.0)
+    parser.add_argument("--burst", type=int, default=50)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--save", default=None)
+    parser.add_argument("--compare", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+    if args.throttle_every:
+        # injected 429s carry Retry-After: 1, keep the no-header fallback short too
+        ScraperConfig.RATE_LIMIT_DELAY = 1
+
+    results = {}
+    print(f"{'size':>6} {'jobs':>6} {'seconds':>8} {'jobs/s':>8} {'parse s':>8} {'parse %':>8} {'peak MB':>8} {'reqs':>6} {'429s':>5}")
+    for size in args.sizes:
+        result = await scrape(args, size, trace_memory=False)
+        if not args.no_memory:
+            result["peak_mb"] = (await scrape(args, size, trace_memory=True))["peak_mb"]
+        results[str(size)] = result
+        print(
+            f"{size:>6} {result['jobs']:>6} {result['seconds']:>8.2f} {result['jobs_per_sec']:>8.1f} "
+            f"{result['parse_seconds']:>8.3f} {result['parse_share'] * 100:>7.1f}% {result['peak_mb']:>8.2f} "
+            f"{result['requests']:>6} {result['throttled']:>5}"
+        )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved results to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = []
+        for size, result in results.items():
+            if size not in baseline:
+                continue
+            before, after = baseline[size]["jobs_per_sec"], result["jobs_per_sec"]
+            change = (after - before) / before
+            print(f"size {size}: {before} -> {after} jobs/s ({change:+.1%})")
+            if change < -args.tolerance:
+                regressions.append(size)
+        if regressions:
+            print(f"Throughput regressed beyond {args.tolerance:.0%} for sizes {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
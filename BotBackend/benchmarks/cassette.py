@@ -0,0 +1,124 @@
+"""
+Record/replay of LinkedIn responses ("cassettes") for offline tests and
+benchmarks. A cassette is a JSON list of {url, body} interactions as the
+scraper consumed them.
+
+Record a live crawl:
+
+    python -m benchmarks.cassette --keywords "Software Engineer" --location London \\
+        --max-jobs 25 --out benchmarks/cassettes/software_engineer_london.json
+
+Replay it with benchmarks.fake_linkedin.ReplayLinkedInServer. Without a
+recorded cassette, Cassette.from_fixtures() builds one from the HTML in
+benchmarks/fixtures.
+"""
+import argparse
+import asyncio
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from scraper.job_index import MemoryJobIndex, canonical_job_id
+from scraper.job_scraper import LinkedInJobsScraper
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@dataclass
+class Interaction:
+    url: str
+    body: str
+
+
+@dataclass
+class Cassette:
+    interactions: List[Interaction] = field(default_factory=list)
+
+    def record(self, url: str, body: str) -> None:
+        self.interactions.append(Interaction(url, body))
+
+    def save(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"interactions": [asdict(i) for i in self.interactions]}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls([Interaction(**i) for i in data["interactions"]])
+
+    @classmethod
+    def from_fixtures(cls, directory: Path = FIXTURES) -> "Cassette":
+        cassette = cls()
+        for i, path in enumerate(sorted(directory.glob("search_*.html"))):
+            cassette.record(
+                f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?start={i * 25}",
+                path.read_text(encoding="utf-8"),
+            )
+        for i, path in enumerate(sorted(directory.glob("job_*.html"))):
+            cassette.record(f"https://www.linkedin.com/jobs/view/fixture-{i}", path.read_text(encoding="utf-8"))
+        return cassette
+
+    def search_pages(self) -> List[str]:
+        """
+        Recorded search-result bodies ordered by their `start` offset
+        """
+        pages = []
+        for interaction in self.interactions:
+            parts = urlsplit(interaction.url)
+            if parts.path.endswith("seeMoreJobPostings/search"):
+                start = int(parse_qs(parts.query).get("start", ["0"])[0])
+                pages.append((start, interaction.body))
+        return [body for _, body in sorted(pages, key=lambda page: page[0])]
+
+    def job_pages(self) -> Dict[str, str]:
+        """
+        Recorded job-view bodies keyed by canonical job ID
+        """
+        pages = {}
+        for interaction in self.interactions:
+            if "/jobs/view/" in interaction.url:
+                pages[canonical_job_id(interaction.url) or interaction.url] = interaction.body
+        return pages
+
+
+class RecordingJobsScraper(LinkedInJobsScraper):
+    """
+    LinkedInJobsScraper that appends every page body it fetches to a cassette.
+    The response cache and the shared job index are bypassed so every page
+    really comes off the network.
+    """
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        kwargs.setdefault("use_cache", False)
+        kwargs.setdefault("index", MemoryJobIndex())
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    async def _fetch_text(self, url: str, cached=None) -> Optional[str]:
+        text = await super()._fetch_text(url, cached)
+        if text is not None:
+            self.cassette.record(url, text)
+        return text
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keywords", required=True)
+    parser.add_argument("--location", required=True)
+    parser.add_argument("--max-jobs", type=int, default=25)
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args()
+
+    cassette = Cassette()
+    async with RecordingJobsScraper(cassette) as scraper:
+        jobs = await scraper.scrape_jobs(args.keywords, args.location, max_jobs=args.max_jobs)
+    cassette.save(args.out)
+    print(f"Recorded {len(cassette.interactions)} responses ({len(jobs)} jobs) to {args.out}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,211 @@
+import asyncio
+import math
+import re
+from collections import deque
+from typing import Optional
+from aiohttp import web
+
+from benchmarks.cassette import Cassette
+from scraper.job_index import canonical_job_id
+
+
+JOB_CARD = """
+<div class="base-card">
+    <a class="base-card__full-link" href="{base}/jobs/view/{job_id}?refId=bench"></a>
+    <h3 class="base-search-card__title">Software Engineer {job_id}</h3>
+    <h4 class="base-search-card__subtitle">Company {company}</h4>
+    <span class="job-search-card__location">London, England, United Kingdom</span>
+    <time class="job-search-card__listdate">{days} days ago</time>
+</div>
+"""
+
+JOB_PAGE = """
+<html><body>
+<div class="show-more-less-html__markup">
+    <p>Job {job_id} at Company {company}.</p>
+    {body}
+</div>
+</body></html>
+"""
+
+
+EMPLOYEE_CARD = """
+<li class="reusable-search__result-container">
+    <a class="app-aware-link" href="https://www.linkedin.com/in/{slug}-{i}"><span aria-hidden="true">Person {i} at {company}</span></a>
+    <div class="entity-result__primary-subtitle">Engineer at {company}</div>
+</li>
+"""
+
+
+class FakeLinkedInServer:
+    """
+    Local stand-in for the guest jobs API: a search endpoint that pages
+    through `total_jobs` cards and a job view page per card, each response
+    delayed by `latency` seconds. With `max_rps` set, requests beyond that
+    many per second get a 429 with Retry-After; with `throttle_every` set,
+    every Nth request does.
+
+    Like LinkedIn, job IDs increase with posting time and results come in
+    relevance order (a fixed shuffle here) unless the search asks for
+    sortBy=DD, which lists them newest first; `publish(n)` adds n postings
+    with new IDs.
+    """
+
+    def __init__(
+        self,
+        total_jobs: int = 1000,
+        latency: float = 0.1,
+        jobs_per_page: int = 25,
+        max_rps: Optional[int] = None,
+        throttle_every: Optional[int] = None,
+    ):
+        self.total_jobs = total_jobs
+        self.latency = latency
+        self.jobs_per_page = jobs_per_page
+        self.max_rps = max_rps
+        self.throttle_every = throttle_every
+        self.request_count = 0
+        self.throttled_count = 0
+        self.newest_id = 4_000_000_000 + total_jobs
+        self._recent = deque()
+        self.base_url = ""
+        self._runner = None
+
+    @property
+    def search_url(self) -> str:
+        return f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+    @property
+    def people_search_url(self) -> str:
+        return f"{self.base_url}/search/results/people/"
+
+    def _throttle(self) -> Optional[web.Response]:
+        if self.throttle_every and self.request_count % self.throttle_every == 0:
+            self.throttled_count += 1
+            return web.Response(status=429, headers={"Retry-After": "1"})
+        if self.max_rps is None:
+            return None
+        now = asyncio.get_running_loop().time()
+        while self._recent and now - self._recent[0] > 1:
+            self._recent.popleft()
+        if len(self._recent) >= self.max_rps:
+            self.throttled_count += 1
+            return web.Response(status=429, headers={"Retry-After": "1"})
+        self._recent.append(now)
+        return None
+
+    def publish(self, count: int) -> None:
+        self.newest_id += count
+        self.total_jobs += count
+
+    def _age_rank(self, position: int, newest_first: bool) -> int:
+        if newest_first:
+            return position
+        # a stride coprime with the total visits every posting once, out of date order
+        stride = 7919
+        while math.gcd(stride, self.total_jobs) != 1:
+            stride += 2
+        return position * stride % self.total_jobs
+
+    def search_page(self, start: int, newest_first: bool = True) -> str:
+        end = min(start + self.jobs_per_page, self.total_jobs)
+        ranks = (self._age_rank(p, newest_first) for p in range(start, end))
+        return "".join(
+            JOB_CARD.format(base=self.base_url, job_id=self.newest_id - rank, company=(self.newest_id - rank) % 40, days=rank * 28 // self.total_jobs + 1)
+            for rank in ranks
+        )
+
+    def job_page(self, job_id: str) -> str:
+        body = "<p>Responsibilities include building scalable systems.</p>" * 20
+        return JOB_PAGE.format(job_id=job_id, company=int(job_id) % 40, body=body)
+
+    async def _search(self, request: web.Request) -> web.Response:
+        self.request_count += 1
+        throttled = self._throttle()
+        if throttled:
+            return throttled
+        await asyncio.sleep(self.latency)
+        start = int(request.query.get("start", 0))
+        newest_first = request.query.get("sortBy") == "DD"
+        return web.Response(text=self.search_page(start, newest_first), content_type="text/html")
+
+    async def _job(self, request: web.Request) -> web.Response:
+        self.request_count += 1
+        throttled = self._throttle()
+        if throttled:
+            return throttled
+        await asyncio.sleep(self.latency)
+        job_id = canonical_job_id(request.path)
+        if job_id is None:
+            return web.Response(status=404)
+        etag = f'"job-{job_id}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(text=self.job_page(job_id), content_type="text/html", headers={"ETag": etag})
+
+    async def _people(self, request: web.Request) -> web.Response:
+        self.request_count += 1
+        throttled = self._throttle()
+        if throttled:
+            return throttled
+        await asyncio.sleep(self.latency)
+        company = request.query.get("keywords", "")
+        slug = "-".join(company.lower().split())
+        cards = "".join(EMPLOYEE_CARD.format(slug=slug, i=i, company=company) for i in range(10))
+        return web.Response(text=f"<ul>{cards}</ul>", content_type="text/html")
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_get("/jobs-guest/jobs/api/seeMoreJobPostings/search", self._search)
+        app.router.add_get("/jobs/view/{slug}", self._job)
+        app.router.add_get("/search/results/people/", self._people)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._runner:
+            await self._runner.cleanup()
+
+
+LINKEDIN_HOST = re.compile(r"https?://(?:[a-z]{2,3}\.)?linkedin\.com")
+JOB_VIEW_ID = re.compile(r"(/jobs/view/(?:[^/?\"'#\s]*-)?)(\d+)")
+CYCLE_ID_OFFSET = 10 ** 10
+
+
+class ReplayLinkedInServer(FakeLinkedInServer):
+    """
+    Serves recorded pages from a Cassette instead of synthetic ones. LinkedIn
+    links in the bodies are pointed back at this server. Past the last
+    recorded search page the pages are replayed again with shifted job IDs,
+    so any `total_jobs` can be crawled from a small cassette.
+    """
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.search_pages = cassette.search_pages()
+        self.job_pages = cassette.job_pages()
+        self._job_bodies = list(self.job_pages.values())
+        if not self.search_pages or not self._job_bodies:
+            raise ValueError("cassette needs at least one search page and one job page")
+
+    def search_page(self, start: int, newest_first: bool = True) -> str:
+        # recorded pages are served in the order they were recorded
+        if start >= self.total_jobs:
+            return ""
+        page_index = start // self.jobs_per_page
+        cycle, recorded = divmod(page_index, len(self.search_pages))
+        body = LINKEDIN_HOST.sub(self.base_url, self.search_pages[recorded])
+        if cycle:
+            body = JOB_VIEW_ID.sub(lambda m: m.group(1) + str(int(m.group(2)) + cycle * CYCLE_ID_OFFSET), body)
+        return body
+
+    def job_page(self, job_id: str) -> str:
+        recorded_id = str(int(job_id) % CYCLE_ID_OFFSET)
+        if recorded_id in self.job_pages:
+            return self.job_pages[recorded_id]
+        return self._job_bodies[int(job_id) % len(self._job_bodies)]
@@ -0,0 +1,79 @@
+"""
+Record/replay for LinkedInAccountScraper, which talks to LinkedIn through
+staffspy rather than aiohttp, so it is recorded at the records level.
+
+Record (needs a logged-in session file):
+
+    python -m benchmarks.staff_cassette --company Google --search-term "software engineer" \\
+        --location london --max-results 50 --out benchmarks/cassettes/staff_google.json
+
+ReplayAccountScraper(path) then stands in for LinkedInAccountScraper offline.
+"""
+import argparse
+import json
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from scraper.profile_scraper import LinkedInAccountScraper, LinkedInScraperConfig, StaffSearchParams
+
+
+def record_staff(scraper: LinkedInAccountScraper, params: StaffSearchParams, path: str) -> List[Dict[str, Any]]:
+    records = scraper.scrape_staff_to_dict(params)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        # staffspy rows can carry dates, store them as strings
+        json.dump({"params": asdict(params), "records": records}, f, ensure_ascii=False, default=str)
+    return records
+
+
+class ReplayAccountScraper(LinkedInAccountScraper):
+    """
+    Returns recorded staff records (up to params.max_results) after
+    `latency` seconds, without a LinkedIn account
+    """
+
+    def __init__(self, path: str, latency: float = 0.0):
+        super().__init__(LinkedInScraperConfig())
+        with open(path, encoding="utf-8") as f:
+            self.records: List[Dict[str, Any]] = json.load(f)["records"]
+        self.latency = latency
+
+    def init_account(self):
+        self.isInitialized = True
+        return None
+
+    def iter_staff(self, params: StaffSearchParams) -> Iterator[Dict[str, Any]]:
+        if self.latency:
+            time.sleep(self.latency)
+        yield from self.records[: params.max_results]
+
+    def scrape_staff_to_dict(self, params: StaffSearchParams) -> List[Dict[str, Any]]:
+        return list(self.iter_staff(params))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--company", required=True)
+    parser.add_argument("--search-term", default=None)
+    parser.add_argument("--location", default=None)
+    parser.add_argument("--max-results", type=int, default=50)
+    parser.add_argument("--session-file", default="scraper/session.pkl")
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args()
+
+    scraper = LinkedInAccountScraper(LinkedInScraperConfig(session_file=args.session_file))
+    params = StaffSearchParams(
+        company_name=args.company,
+        search_term=args.search_term,
+        location=args.location,
+        extra_profile_data=True,
+        max_results=args.max_results,
+    )
+    records = record_staff(scraper, params, args.out)
+    print(f"Recorded {len(records)} staff records to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,17 @@
+import asyncio
 import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
 from dotenv import load_dotenv
+from postgrest.exceptions import APIError
 from supabase import create_client, Client
+
+from db.job_catalog import JobCatalog, default_job_catalog
+from scraper.job_scraper import JobData
+from state.contactState import Contacts
 load_dotenv()
 
 
@@ -9,4 +20,346 @@ supabase_key = os.getenv("SUPABASE_API_KEY")
 
 supabase: Client = None # type: ignore
 if supabase_url and supabase_key:
-    supabase = create_client(supabase_url, supabase_key)
\ No newline at end of file
+    supabase = create_client(supabase_url, supabase_key)
+
+RESUME_BUCKET = "JobNexusBucket"
+# calls slower than this are logged
+SLOW_CALL_SECONDS = 1.0
+# contacts are unique per user by profile link
+CONTACT_CONFLICT = "user_id,profile_link"
+# Postgres: no unique constraint matches the ON CONFLICT columns
+NO_CONFLICT_TARGET = "42P10"
+
+
+class DatabaseConfigError(RuntimeError):
+    pass
+
+
+def _contact_key(row: Dict[str, Any]) -> Tuple[str, str]:
+    return str(row["user_id"]), row["profile_link"]
+
+
+class ContactWriter:
+    """
+    Write-behind queue for contacts. Rows added by concurrent graph runs
+    within `flush_interval` seconds, or until `max_batch` rows are waiting,
+    are written together in one upsert; each add() resolves with how many of
+    its rows were new, or with the write's error.
+    """
+
+    def __init__(self, database: "Database", flush_interval: float, max_batch: int):
+        self.database = database
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._pending: List[Tuple[List[Dict[str, Any]], asyncio.Future]] = []
+        self._pending_rows = 0
+        self._timer: Optional[asyncio.Task] = None
+        self._flushes: set = set()
+        self.batches = 0
+
+    async def add(self, rows: List[Dict[str, Any]]) -> int:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((rows, future))
+        self._pending_rows += len(rows)
+        if self._pending_rows >= self.max_batch:
+            task = asyncio.create_task(self._flush())
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+        return await future
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._timer = None
+        await self._flush()
+
+    async def _flush(self) -> None:
+        # at most max_batch rows per write (whole add() calls, at least one)
+        taken = 0
+        count = 0
+        while count < len(self._pending) and (count == 0 or taken + len(self._pending[count][0]) <= self.max_batch):
+            taken += len(self._pending[count][0])
+            count += 1
+        pending, self._pending = self._pending[:count], self._pending[count:]
+        self._pending_rows -= taken
+        if self._pending and self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+        if not pending:
+            return
+        rows = list({_contact_key(row): row for batch, _ in pending for row in batch}.values())
+        self.batches += 1
+        try:
+            inserted = await self.database._call("upsert_contacts", self.database._upsert_contacts, rows)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        new = {_contact_key(row) for row in inserted}
+        for batch, future in pending:
+            keys = {_contact_key(row) for row in batch} & new
+            # a row queued twice counts once, for the first caller
+            new -= keys
+            if not future.done():
+                future.set_result(len(keys))
+
+
+class Database:
+    """
+    Async repository for resumes, contacts and jobs. Implementations do their
+    I/O synchronously; every call runs on a bounded thread pool shared by the
+    process, so graph nodes never block the event loop, and is timed per
+    operation (see stats()).
+    """
+
+    # write-behind window and batch size for add_contacts
+    CONTACT_FLUSH_INTERVAL = 0.02
+    CONTACT_MAX_BATCH = 500
+
+    def __init__(self, catalog: Optional[JobCatalog] = None, max_workers: int = 8):
+        self.catalog = catalog
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db")
+        self._timings: Dict[str, Dict[str, float]] = {}
+        self._writers: Dict[asyncio.AbstractEventLoop, ContactWriter] = {}
+
+    async def _call(self, operation: str, fn: Callable[..., Any], *args: Any) -> Any:
+        started = time.perf_counter()
+        failed = False
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            timing = self._timings.setdefault(operation, {"calls": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            timing["calls"] += 1
+            timing["errors"] += failed
+            timing["total_seconds"] += elapsed
+            timing["max_seconds"] = max(timing["max_seconds"], elapsed)
+            if elapsed > SLOW_CALL_SECONDS:
+                print(f"Slow database call {operation}: {elapsed:.2f}s")
+
+    # resumes
+
+    async def resume_path(self, user_id: str) -> str:
+        """
+        Storage path of the user's latest resume upload; raises LookupError
+        if there is none
+        """
+        return await self._call("resume_path", self._resume_path, user_id)
+
+    async def download_resume(self, path: str) -> bytes:
+        return await self._call("download_resume", self._download_resume, path)
+
+    async def resume_pdf(self, user_id: str) -> bytes:
+        """
+        The user's uploaded resume PDF; raises LookupError if there is none
+        """
+        return await self.download_resume(await self.resume_path(user_id))
+
+    def _resume_path(self, user_id: str) -> str:
+        raise NotImplementedError
+
+    def _download_resume(self, path: str) -> bytes:
+        raise NotImplementedError
+
+    # contacts
+
+    async def contact_links(self, user_id: str) -> Set[str]:
+        return await self._call("contact_links", self._contact_links, user_id)
+
+    async def add_contacts(self, user_id: str, contacts: List[Contacts]) -> int:
+        """
+        Store the contacts the user doesn't have yet (by profile link);
+        returns how many were new. Rows are upserted, ignoring conflicts on
+        (user_id, profile_link), through the write-behind ContactWriter, so
+        concurrent callers share one write.
+        """
+        if not contacts:
+            return 0
+        rows = [{"id": str(uuid.uuid4()), "user_id": user_id, **contact.model_dump()} for contact in contacts]
+        loop = asyncio.get_running_loop()
+        writer = self._writers.get(loop)
+        if writer is None:
+            writer = self._writers[loop] = ContactWriter(self, self.CONTACT_FLUSH_INTERVAL, self.CONTACT_MAX_BATCH)
+        return await writer.add(rows)
+
+    def _contact_links(self, user_id: str) -> Set[str]:
+        raise NotImplementedError
+
+    def _upsert_contacts(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Insert `rows` in one round trip, skipping (user_id, profile_link)
+        pairs already stored; returns the rows actually inserted
+        """
+        raise NotImplementedError
+
+    # jobs, kept in the local job catalog
+
+    def _catalog(self) -> JobCatalog:
+        return self.catalog if self.catalog is not None else default_job_catalog()
+
+    async def search_jobs(self, role: str, location: Optional[str], limit: int = 20, max_age: Optional[float] = None) -> List[JobData]:
+        return await self._call("search_jobs", self._catalog().search, role, location, limit, max_age)
+
+    async def add_jobs(self, jobs: List[JobData]) -> int:
+        return await self._call("add_jobs", self._catalog().add_jobs, jobs)
+
+    async def prune_jobs(self, max_age: float) -> int:
+        return await self._call("prune_jobs", self._catalog().prune, max_age)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            operation: {
+                "calls": timing["calls"],
+                "errors": timing["errors"],
+                "avg_ms": round(timing["total_seconds"] / timing["calls"] * 1000, 2),
+                "max_ms": round(timing["max_seconds"] * 1000, 2),
+            }
+            for operation, timing in self._timings.items()
+        }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SupabaseDatabase(Database):
+    """
+    Database over one shared Supabase client, whose HTTP connections are
+    reused across calls and threads
+    """
+
+    def __init__(self, client: Client, catalog: Optional[JobCatalog] = None, max_workers: int = 8):
+        super().__init__(catalog, max_workers)
+        self.client = client
+        # cleared once the contact table turns out to lack the unique constraint
+        self.contact_upsert = True
+
+    def _resume_path(self, user_id: str) -> str:
+        res = self.client.table("resume").select("path").eq("id", user_id).maybe_single().execute()
+        if res is None or not res.data:
+            raise LookupError(f"No resume uploaded for user {user_id}")
+        return res.data["path"]
+
+    def _download_resume(self, path: str) -> bytes:
+        return self.client.storage.from_(RESUME_BUCKET).download(path)
+
+    def _contact_links(self, user_id: str) -> Set[str]:
+        links = self.client.table("contact").select("profile_link").eq("user_id", user_id).execute()
+        return {row["profile_link"] for row in (links.data or [])}
+
+    def _upsert_contacts(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # needs the unique (user_id, profile_link) constraint from db/migrations
+        if self.contact_upsert:
+            try:
+                res = self.client.table("contact").upsert(
+                    rows, on_conflict=CONTACT_CONFLICT, ignore_duplicates=True
+                ).execute()
+                return res.data or []
+            except APIError as e:
+                if e.code != NO_CONFLICT_TARGET:
+                    raise
+                print(
+                    "contact has no unique (user_id, profile_link) constraint, run "
+                    "db/migrations/contact_unique_profile_link.sql; inserting only links not yet stored"
+                )
+                self.contact_upsert = False
+        return self._insert_new_contacts(rows)
+
+    def _insert_new_contacts(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Select-then-insert per user, for a contact table without the
+        constraint; concurrent writers can still store a link twice
+        """
+        by_user: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_user.setdefault(str(row["user_id"]), []).append(row)
+        inserted = []
+        for user_rows in by_user.values():
+            stored = self._contact_links(user_rows[0]["user_id"])
+            new = [row for row in user_rows if row["profile_link"] not in stored]
+            if new:
+                res = self.client.table("contact").insert(new).execute()
+                inserted.extend(res.data or new)
+        return inserted
+
+
+class LocalDatabase(Database):
+    """
+    In-process stand-in for tests and benchmarks. `latency` seconds are
+    slept per round trip to stand in for the network.
+    """
+
+    def __init__(self, latency: float = 0.0, catalog: Optional[JobCatalog] = None, max_workers: int = 8):
+        super().__init__(catalog if catalog is not None else JobCatalog(), max_workers)
+        self.latency = latency
+        # user_id -> path of the latest upload, path -> PDF bytes
+        self.resumes: Dict[str, str] = {}
+        self.files: Dict[str, bytes] = {}
+        self.contacts: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.round_trips = 0
+
+    def _round_trip(self) -> None:
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def upload_resume(self, user_id: str, pdf_bytes: bytes) -> str:
+        # a new path per upload, like the frontend
+        path = f"resumes/{user_id}/{time.time_ns()}_resume.pdf"
+        self.files[path] = pdf_bytes
+        self.resumes[user_id] = path
+        return path
+
+    def _resume_path(self, user_id: str) -> str:
+        self._round_trip()
+        if user_id not in self.resumes:
+            raise LookupError(f"No resume uploaded for user {user_id}")
+        return self.resumes[user_id]
+
+    def _download_resume(self, path: str) -> bytes:
+        self._round_trip()
+        if path not in self.files:
+            raise LookupError(f"No file at {path}")
+        return self.files[path]
+
+    def _contact_links(self, user_id: str) -> Set[str]:
+        self._round_trip()
+        return set(self.contacts.get(user_id, {}))
+
+    def _upsert_contacts(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        self._round_trip()
+        inserted = []
+        for row in rows:
+            stored = self.contacts.setdefault(row["user_id"], {})
+            if row["profile_link"] not in stored:
+                stored[row["profile_link"]] = row
+                inserted.append(row)
+        return inserted
+
+
+_default_database: Optional[Database] = None
+
+
+def default_database() -> Database:
+    """
+    Process-wide repository over the Supabase client. Raises
+    DatabaseConfigError when SUPABASE_URL/SUPABASE_API_KEY are not set,
+    unless DB_BACKEND=local asks for an in-process LocalDatabase (nothing
+    is persisted). DB_MAX_WORKERS bounds the thread pool (8 by default).
+    """
+    global _default_database
+    if _default_database is None:
+        max_workers = int(os.getenv("DB_MAX_WORKERS", "8"))
+        if os.getenv("DB_BACKEND") == "local":
+            print("DB_BACKEND=local, using an in-process database; nothing is persisted")
+            _default_database = LocalDatabase(max_workers=max_workers)
+        elif supabase is not None:
+            _default_database = SupabaseDatabase(supabase, max_workers=max_workers)
+        else:
+            raise DatabaseConfigError(
+                "SUPABASE_URL and SUPABASE_API_KEY must be set (or DB_BACKEND=local for an in-process database)"
+            )
+    return _default_database
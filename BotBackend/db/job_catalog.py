@@ -0,0 +1,255 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from scraper.job_scraper import JobData, ScraperConfig
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# the postings prune() keeps: posted since the cutoff, undated ones by when
+# they were ingested; takes the cutoff twice
+POSTED_WITHIN = "(jobs.posted_at >= ? OR (jobs.posted_at IS NULL AND jobs.ingested_at >= ?))"
+
+# columns in the order of the jobs table, minus rowid
+COLUMNS = (
+    "job_id", "title", "company", "location", "location_key", "job_link", "posted_date", "posted_at", "description",
+    "ingested_at",
+)
+
+
+def normalize_location(location: str) -> str:
+    """
+    "London, England, United Kingdom" -> "london"; the first component,
+    lowercased with extra whitespace removed
+    """
+    return " ".join(location.split(",")[0].lower().split())
+
+
+def fts_query(text: str) -> str:
+    """
+    Every word of `text` as a quoted FTS5 term (implicit AND), the last one a
+    prefix so "engine" matches "engineer"
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if not tokens:
+        return ""
+    return " ".join(f'"{token}"' for token in tokens[:-1]) + f' "{tokens[-1]}"*'
+
+
+class JobCatalog:
+    """
+    SQLite catalog of scraped jobs, keyed by canonical job ID. Title and
+    description are indexed with FTS5 (title weighted higher in ranking) and
+    the normalized city with a plain B-tree index.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                company TEXT NOT NULL,
+                location TEXT NOT NULL,
+                location_key TEXT NOT NULL,
+                job_link TEXT NOT NULL,
+                posted_date TEXT NOT NULL,
+                posted_at REAL,
+                description TEXT,
+                ingested_at REAL NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, description, content='jobs', content_rowid='rowid'
+            );
+            CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description);
+            END;
+            CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_fts (jobs_fts, rowid, title, description)
+                VALUES ('delete', old.rowid, old.title, old.description);
+            END;
+            CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+                INSERT INTO jobs_fts (jobs_fts, rowid, title, description)
+                VALUES ('delete', old.rowid, old.title, old.description);
+                INSERT INTO jobs_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description);
+            END;
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "posted_at" not in columns:
+            # catalogs created before posted dates were parsed
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN posted_at REAL")
+        self._conn.executescript(
+            """
+            CREATE INDEX IF NOT EXISTS jobs_location_posted ON jobs (location_key, posted_at);
+            CREATE INDEX IF NOT EXISTS jobs_posted_at ON jobs (posted_at);
+            """
+        )
+        self._conn.commit()
+
+    def add_jobs(self, jobs: Iterable[JobData]) -> int:
+        """
+        Insert or update jobs in one transaction; returns how many were written
+        """
+        now = time.time()
+        rows = [
+            (
+                job.key,
+                job.title,
+                job.company,
+                job.location,
+                normalize_location(job.location),
+                job.job_link,
+                job.posted_date,
+                job.posted_at,
+                job.description if job.description != "N/A" else None,
+                now,
+            )
+            for job in jobs
+        ]
+        with self._lock:
+            # an update keeps an already fetched description if this copy has none
+            self._conn.executemany(
+                f"""
+                INSERT INTO jobs ({", ".join(COLUMNS)}) VALUES ({", ".join("?" for _ in COLUMNS)})
+                ON CONFLICT (job_id) DO UPDATE SET
+                    title = excluded.title,
+                    company = excluded.company,
+                    location = excluded.location,
+                    location_key = excluded.location_key,
+                    job_link = excluded.job_link,
+                    posted_date = excluded.posted_date,
+                    posted_at = COALESCE(excluded.posted_at, jobs.posted_at),
+                    description = COALESCE(excluded.description, jobs.description),
+                    ingested_at = excluded.ingested_at
+                """,
+                rows,
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def search(
+        self,
+        role: str,
+        location: Optional[str] = None,
+        limit: int = 20,
+        max_age: Optional[float] = None,
+        max_posted_age: float = ScraperConfig.JOB_MAX_AGE,
+    ) -> List[JobData]:
+        """
+        Top `limit` jobs matching every word of `role` in the title or
+        description, best match first and most recently posted among equal
+        matches, optionally in `location`'s city and ingested within
+        `max_age` seconds. Postings older than `max_posted_age` are left out
+        even before prune() deletes them.
+        """
+        query = fts_query(role)
+        if not query:
+            return self.latest(location, limit, max_age, max_posted_age)
+        sql = f"""
+            SELECT {", ".join("jobs." + column for column in COLUMNS)} FROM jobs_fts
+            JOIN jobs ON jobs.rowid = jobs_fts.rowid
+            WHERE jobs_fts MATCH ?
+        """
+        params: list = [query]
+        if location:
+            sql += " AND jobs.location_key = ?"
+            params.append(normalize_location(location))
+        if max_age is not None:
+            sql += " AND jobs.ingested_at >= ?"
+            params.append(time.time() - max_age)
+        sql += f" AND {POSTED_WITHIN}"
+        posted_cutoff = time.time() - max_posted_age
+        params += [posted_cutoff, posted_cutoff]
+        sql += " ORDER BY bm25(jobs_fts, 10.0, 1.0), jobs.posted_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._job(row) for row in rows]
+
+    def latest(
+        self,
+        location: Optional[str] = None,
+        limit: int = 20,
+        max_age: Optional[float] = None,
+        max_posted_age: float = ScraperConfig.JOB_MAX_AGE,
+    ) -> List[JobData]:
+        """
+        Most recently posted jobs, optionally in `location`'s city
+        """
+        posted_cutoff = time.time() - max_posted_age
+        conditions = [POSTED_WITHIN]
+        params: list = [posted_cutoff, posted_cutoff]
+        if location:
+            conditions.append("location_key = ?")
+            params.append(normalize_location(location))
+        if max_age is not None:
+            conditions.append("ingested_at >= ?")
+            params.append(time.time() - max_age)
+        sql = f"SELECT {', '.join(COLUMNS)} FROM jobs WHERE " + " AND ".join(conditions)
+        # served from the (location_key, posted_at) index, no sort
+        sql += " ORDER BY posted_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._job(row) for row in rows]
+
+    @staticmethod
+    def _job(row) -> JobData:
+        job_id, title, company, location, _, job_link, posted_date, posted_at, description, _ = row
+        return JobData(
+            title=title,
+            company=company,
+            location=location,
+            job_link=job_link,
+            posted_date=posted_date,
+            description=description,
+            job_id=job_id if job_id != job_link else None,
+            posted_at=posted_at,
+        )
+
+    def prune(self, max_age: float) -> int:
+        """
+        Delete postings posted more than `max_age` seconds ago (undated ones by
+        when they were ingested) in one statement; returns how many
+        """
+        cutoff = time.time() - max_age
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE posted_at < ? OR (posted_at IS NULL AND ingested_at < ?)", (cutoff, cutoff)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_default_catalog: Optional[JobCatalog] = None
+
+
+def default_job_catalog() -> JobCatalog:
+    """
+    Process-wide catalog; set JOB_CATALOG_PATH to keep it on disk (shared
+    with the ingestion worker), otherwise it lives in memory
+    """
+    global _default_catalog
+    if _default_catalog is None:
+        _default_catalog = JobCatalog(os.getenv("JOB_CATALOG_PATH") or ":memory:")
+    return _default_catalog
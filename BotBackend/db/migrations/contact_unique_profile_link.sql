@@ -0,0 +1,26 @@
+-- Unique (user_id, profile_link) on contact, which Database.add_contacts
+-- upserts against. Rows stored twice by the old select-then-insert path are
+-- removed first, keeping one copy of each, so the constraint can be added.
+-- Safe to run more than once.
+
+begin;
+
+lock table contact in share row exclusive mode;
+
+delete from contact newer
+using contact older
+where newer.user_id = older.user_id
+  and newer.profile_link = older.profile_link
+  and newer.ctid > older.ctid;
+
+do $$
+begin
+  if not exists (
+    select 1 from pg_constraint where conname = 'contact_user_id_profile_link_key'
+  ) then
+    alter table contact
+      add constraint contact_user_id_profile_link_key unique (user_id, profile_link);
+  end if;
+end $$;
+
+commit;
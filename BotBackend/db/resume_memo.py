@@ -0,0 +1,137 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from state.resumeState import ProfileSchema
+
+
+def content_hash(pdf_bytes: bytes) -> str:
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+
+@dataclass
+class ResumeFingerprint:
+    """
+    A user's latest resume upload: its storage path, the hash of its bytes
+    and the hash of the resume currently embedded for the user (None if
+    none yet)
+    """
+
+    path: str
+    content_hash: str
+    embedded_hash: Optional[str] = None
+
+    @property
+    def embedded(self) -> bool:
+        return self.embedded_hash == self.content_hash
+
+
+class ResumeMemo:
+    """
+    SQLite memo of resume processing. Extracted profiles are keyed by the
+    SHA-256 of the PDF bytes, so identical uploads are only sent to the LLM
+    once; each user's upload path maps to its hash, so an unchanged upload
+    (the frontend gives every upload a new path) isn't even downloaded again.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS resume_profiles (
+                content_hash TEXT PRIMARY KEY,
+                profile TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS resume_uploads (
+                user_id TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                embedded_hash TEXT,
+                updated_at REAL NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def fingerprint(self, user_id: str, path: str) -> Optional[ResumeFingerprint]:
+        """
+        The fingerprint recorded for the user's upload at `path`; None if the
+        user has uploaded a different resume since
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, embedded_hash FROM resume_uploads WHERE user_id = ? AND path = ?",
+                (str(user_id), path),
+            ).fetchone()
+        return ResumeFingerprint(path, row[0], row[1]) if row else None
+
+    def record_upload(self, user_id: str, path: str, pdf_bytes: bytes) -> ResumeFingerprint:
+        """
+        Fingerprint a downloaded upload; the embedding recorded for the user
+        stays valid if the new upload has the same bytes
+        """
+        digest = content_hash(pdf_bytes)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO resume_uploads (user_id, path, content_hash, updated_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (user_id) DO UPDATE SET
+                    path = excluded.path,
+                    content_hash = excluded.content_hash,
+                    updated_at = excluded.updated_at
+                """,
+                (str(user_id), path, digest, time.time()),
+            )
+            embedded_hash = self._conn.execute(
+                "SELECT embedded_hash FROM resume_uploads WHERE user_id = ?", (str(user_id),)
+            ).fetchone()[0]
+            self._conn.commit()
+        return ResumeFingerprint(path, digest, embedded_hash)
+
+    def profile(self, digest: str) -> Optional[ProfileSchema]:
+        with self._lock:
+            row = self._conn.execute("SELECT profile FROM resume_profiles WHERE content_hash = ?", (digest,)).fetchone()
+        return ProfileSchema.model_validate_json(row[0]) if row else None
+
+    def save_profile(self, digest: str, profile: ProfileSchema) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resume_profiles (content_hash, profile, created_at) VALUES (?, ?, ?)",
+                (digest, profile.model_dump_json(), time.time()),
+            )
+            self._conn.commit()
+
+    def mark_embedded(self, user_id: str, digest: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE resume_uploads SET embedded_hash = ? WHERE user_id = ?", (digest, str(user_id))
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_default_memo: Optional[ResumeMemo] = None
+
+
+def default_resume_memo() -> ResumeMemo:
+    """
+    Process-wide memo; set RESUME_MEMO_PATH to keep it on disk across
+    restarts, otherwise it lives in memory
+    """
+    global _default_memo
+    if _default_memo is None:
+        _default_memo = ResumeMemo(os.getenv("RESUME_MEMO_PATH") or ":memory:")
+    return _default_memo
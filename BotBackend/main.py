@@ -1,12 +1,73 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from server.apis.main import router as ChatRouter
+from server.apis.jobroutes import router as JobRouter
+from server.apis.referralroutes import router as ReferralRouter
+from db.database import default_database
+from scraper.job_scraper import ScraperConfig, create_session_pool
+from scraper.search_store import default_search_store
+from scraper.session_pool import close_shared_pool, start_shared_pool
+from scraper.profile_scraper import LinkedInScraperService, session_configs
+from pdf_extract import close_default_pdf_extractor, default_pdf_extractor
 import uvicorn
 
+
+async def warm_up_staff_scraper():
+    try:
+        await LinkedInScraperService().ainitialize(session_configs())
+    except Exception as e:
+        print(f"LinkedIn scraper warm-up failed, retrying on first referral search: {e}")
+
+
+async def warm_up_pdf_extractor():
+    try:
+        await default_pdf_extractor().warm_up()
+    except Exception as e:
+        print(f"PDF extractor warm-up failed, starting workers on first resume: {e}")
+
+
+async def prune_job_stores():
+    """
+    Drop expired postings from the catalog and saved searches this process
+    serves, at startup and every PRUNE_INTERVAL
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            jobs = await default_database().prune_jobs(ScraperConfig.JOB_MAX_AGE)
+            searches = await loop.run_in_executor(None, default_search_store().prune, ScraperConfig.JOB_MAX_AGE)
+            print(f"Pruned {jobs} expired jobs and {searches} saved searches")
+        except Exception as e:
+            print(f"Pruning the job catalog failed: {e}")
+        await asyncio.sleep(ScraperConfig.PRUNE_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # refuse to start without a database rather than drop every write
+    default_database()
+    # one keep-alive HTTP session for every scraper run in this process
+    await start_shared_pool(create_session_pool())
+    # log the LinkedIn accounts in while the app already serves requests
+    warm_up = asyncio.create_task(warm_up_staff_scraper())
+    pdf_warm_up = asyncio.create_task(warm_up_pdf_extractor())
+    pruning = asyncio.create_task(prune_job_stores())
+    yield
+    warm_up.cancel()
+    pdf_warm_up.cancel()
+    pruning.cancel()
+    LinkedInScraperService().shutdown()
+    close_default_pdf_extractor()
+    await close_shared_pool()
+
+
 app = FastAPI(
     title="JobNexus",
     description="API for matching resumes with LinkedIn job listings",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -18,6 +79,8 @@ app.add_middleware(
 )
 
 app.include_router(ChatRouter)
+app.include_router(JobRouter)
+app.include_router(ReferralRouter)
 @app.get("/")
 async def root():
     return {"message" : "server operational"}
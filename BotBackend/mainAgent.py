@@ -3,11 +3,11 @@ from langgraph.graph import StateGraph, START
 from langchain_google_genai import ChatGoogleGenerativeAI 
 from langgraph.checkpoint.memory import MemorySaver
 import os
-from typing import Annotated, Optional, TypedDict
+from typing import Annotated, List, Optional, TypedDict
 from db.database import supabase
 from dotenv import load_dotenv
 from resumeagent import resume_tool
-from reviewerAgent import referrals_tool
+from reviewerAgent import find_batch_referrals, referrals_tool
 from langchain_core.messages import BaseMessage
 from langgraph.graph import add_messages
 from langgraph.prebuilt import ToolNode, tools_condition
@@ -38,6 +38,16 @@ async def my_referral_tool(company_name: str, search_term:str,location: str,stat
         "Referrals":result["contacts"]
     }
 
+async def my_batch_referral_tool(company_names: List[str], search_term:str,location: str,state: Annotated[AgentState, InjectedState]):
+    """
+    Find the Referrals for the User at several companies at once
+    """
+    referrals = await find_batch_referrals(state["user_id"], company_names, search_term, location)
+
+    return{
+        "Referrals":referrals
+    }
+
 
 
 async def my_resume_tool(prefered_role: str, prefered_location: str,state: Annotated[AgentState, InjectedState]):
@@ -56,7 +66,7 @@ async def my_resume_tool(prefered_role: str, prefered_location: str,state: Annot
         "scraped_jobs": result["ScrapedJobs"]
     }
       
-tools = [my_resume_tool,my_referral_tool]
+tools = [my_resume_tool,my_referral_tool,my_batch_referral_tool]
 model = ChatGoogleGenerativeAI(
     model="gemini-2.5-flash",
     temperature=0.1,
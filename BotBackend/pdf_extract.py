@@ -0,0 +1,196 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
+
+import pdfplumber
+
+# pypdfium2 and pypdf only read the text layer but are much faster than
+# pdfplumber; either is optional, pdfplumber is always there as the fallback
+try:
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+BACKENDS = ("pdfium", "pypdf", "pdfplumber")
+# protects the pool from oversized uploads
+MAX_PDF_BYTES = 10 * 1024 * 1024
+MAX_PDF_PAGES = 50
+# documents longer than this are split into chunks of PAGES_PER_TASK pages parsed in parallel
+PARALLEL_MIN_PAGES = 8
+PAGES_PER_TASK = 4
+
+
+class PdfLimitError(ValueError):
+    pass
+
+
+def available_backend() -> str:
+    if pypdfium2 is not None:
+        return "pdfium"
+    if pypdf is not None:
+        return "pypdf"
+    return "pdfplumber"
+
+
+def _plumber_pages(pdf_bytes: bytes, start: int, stop: int) -> List[str]:
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages[start:stop]]
+
+
+def _fast_pages(pdf_bytes: bytes, start: int, stop: int, backend: str) -> List[str]:
+    if backend == "pdfium":
+        pdf = pypdfium2.PdfDocument(pdf_bytes)
+        try:
+            texts = []
+            for index in range(start, stop):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                texts.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+            return texts
+        finally:
+            pdf.close()
+    reader = pypdf.PdfReader(BytesIO(pdf_bytes))
+    return [reader.pages[index].extract_text() or "" for index in range(start, stop)]
+
+
+def page_count(pdf_bytes: bytes, backend: str) -> int:
+    if backend == "pdfium":
+        pdf = pypdfium2.PdfDocument(pdf_bytes)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    if backend == "pypdf":
+        return len(pypdf.PdfReader(BytesIO(pdf_bytes)).pages)
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        return len(pdf.pages)
+
+
+def extract_pages(pdf_bytes: bytes, start: int, stop: int, backend: str) -> Tuple[List[str], int]:
+    """
+    Text of pages [start, stop) and how many of them fell back to
+    pdfplumber because the fast backend found no text on them
+    """
+    if backend == "pdfplumber":
+        return _plumber_pages(pdf_bytes, start, stop), 0
+    texts = _fast_pages(pdf_bytes, start, stop, backend)
+    empty = [i for i, text in enumerate(texts) if not text.strip()]
+    if empty:
+        fallback = _plumber_pages(pdf_bytes, start, stop)
+        for i in empty:
+            texts[i] = fallback[i]
+    return texts, len(empty)
+
+
+class PdfExtractor:
+    """
+    PDF text extraction on a process pool, so parsing never runs on the event
+    loop and long documents are split across workers by page range. Uploads
+    over `max_bytes` or `max_pages` are rejected with PdfLimitError before
+    they reach the pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        backend: Optional[str] = None,
+        max_bytes: int = MAX_PDF_BYTES,
+        max_pages: int = MAX_PDF_PAGES,
+        pages_per_task: int = PAGES_PER_TASK,
+        parallel_min_pages: int = PARALLEL_MIN_PAGES,
+    ):
+        backend = backend or available_backend()
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown PDF backend {backend!r}, expected one of {BACKENDS}")
+        self.backend = backend
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.pages_per_task = pages_per_task
+        self.parallel_min_pages = parallel_min_pages
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.documents = 0
+        self.pages = 0
+        self.fallback_pages = 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # fresh workers rather than forks of a process already running threads
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+        return self._pool
+
+    async def warm_up(self) -> None:
+        """
+        Start every worker ahead of the first resume; each one imports the
+        app's main module once
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        await asyncio.gather(*(loop.run_in_executor(pool, available_backend) for _ in range(self.max_workers)))
+
+    async def extract_text(self, pdf_bytes: bytes) -> str:
+        if len(pdf_bytes) > self.max_bytes:
+            raise PdfLimitError(f"PDF is {len(pdf_bytes)} bytes, the limit is {self.max_bytes}")
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        pages = await loop.run_in_executor(pool, page_count, pdf_bytes, self.backend)
+        if pages > self.max_pages:
+            raise PdfLimitError(f"PDF has {pages} pages, the limit is {self.max_pages}")
+
+        step = self.pages_per_task if pages > self.parallel_min_pages else max(pages, 1)
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, extract_pages, pdf_bytes, start, min(start + step, pages), self.backend)
+                for start in range(0, pages, step)
+            )
+        )
+        self.documents += 1
+        self.pages += pages
+        self.fallback_pages += sum(fallback for _, fallback in chunks)
+        return "".join(text for texts, _ in chunks for text in texts)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "workers": self.max_workers,
+            "documents": self.documents,
+            "pages": self.pages,
+            "fallback_pages": self.fallback_pages,
+        }
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_default_extractor: Optional[PdfExtractor] = None
+
+
+def default_pdf_extractor() -> PdfExtractor:
+    """
+    Process-wide extractor; PDF_WORKERS sets the pool size and PDF_BACKEND
+    (pdfium, pypdf or pdfplumber) the text backend
+    """
+    global _default_extractor
+    if _default_extractor is None:
+        workers = os.getenv("PDF_WORKERS")
+        _default_extractor = PdfExtractor(int(workers) if workers else None, os.getenv("PDF_BACKEND") or None)
+    return _default_extractor
+
+
+def close_default_pdf_extractor() -> None:
+    if _default_extractor is not None:
+        _default_extractor.close()
@@ -0,0 +1,98 @@
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from langgraph.graph import StateGraph, START, END
+from state.resumeState import JobMatchingAgentState, ResumeProfileState
+
+Node = Callable[[JobMatchingAgentState], Awaitable[Dict[str, Any]]]
+
+
+def timed(name: str, node: Node) -> Node:
+    """
+    Record when `node` ran under state["timings"][name]
+    """
+    async def run(state:JobMatchingAgentState):
+        started = time.perf_counter()
+        update = await node(state)
+        return {**update, "timings": {name: (started, time.perf_counter())}}
+    return run
+
+
+def route_resume(state:JobMatchingAgentState):
+    """
+    Skip the LLM extraction and the embedding when the resume was already processed
+    """
+    if state.get("extracted_data") is None:
+        return "extract"
+    if state.get("embedded_hash") != state["resume_hash"]:
+        return "embed"
+    return "done"
+
+
+def timing_breakdown(timings:Dict[str, Any]) -> Dict[str, float]:
+    """
+    Seconds per node, their sum (the fully sequential cost) and the wall
+    time from the first node starting to the last finishing
+    """
+    breakdown = {name: round(end - start, 3) for name, (start, end) in timings.items()}
+    sequential = sum(end - start for start, end in timings.values())
+    wall = max(end for _, end in timings.values()) - min(start for start, _ in timings.values())
+    breakdown["sequential"] = round(sequential, 3)
+    breakdown["wall"] = round(wall, 3)
+    breakdown["saved"] = round(sequential - wall, 3)
+    return breakdown
+
+
+async def join_results(state:JobMatchingAgentState):
+    """
+    Wait for the resume branch and the job search, then log where the time went
+    """
+    if not state.get("timings"):
+        return {"timing_breakdown": {}}
+    breakdown = timing_breakdown(state["timings"])
+    stages = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in breakdown.items() if name not in ("sequential", "wall", "saved"))
+    print(f"Resume pipeline: {stages} | sequential {breakdown['sequential']:.2f}s, wall {breakdown['wall']:.2f}s")
+    return {"timing_breakdown": breakdown}
+
+
+def _add_resume_nodes(workflow:StateGraph, load:Node, extract:Node, embed:Node, done:str) -> None:
+    workflow.add_node("Resume_Loader", timed("Resume_Loader", load))
+    workflow.add_node("Profile_Extractor", timed("Profile_Extractor", extract))
+    workflow.add_node("Embbeder_and_VectorStorage", timed("Embbeder_and_VectorStorage", embed))
+    workflow.add_conditional_edges(
+        "Resume_Loader",
+        route_resume,
+        {"extract": "Profile_Extractor", "embed": "Embbeder_and_VectorStorage", "done": done},
+    )
+    workflow.add_edge("Profile_Extractor", "Embbeder_and_VectorStorage")
+    workflow.add_edge("Embbeder_and_VectorStorage", done)
+
+
+def build_resume_graph(load:Node, extract:Node, embed:Node, extract_jobs:Node, parallel:bool = True):
+    """
+    Job matching graph. Extract_Jobs only needs the preferred role and
+    location, so by default it runs alongside the whole resume branch
+    (Resume_Loader → Profile_Extractor → Embbeder_and_VectorStorage, compiled
+    as its own subgraph so the branch isn't held back by LangGraph's steps)
+    and Join_Results waits for both. parallel=False wires the original chain,
+    for comparison.
+    """
+    workflow = StateGraph(JobMatchingAgentState)
+    workflow.add_node("Extract_Jobs", timed("Extract_Jobs", extract_jobs))
+    workflow.add_node("Join_Results", join_results)
+
+    if parallel:
+        branch = StateGraph(JobMatchingAgentState, output_schema=ResumeProfileState)
+        _add_resume_nodes(branch, load, extract, embed, END)
+        branch.add_edge(START, "Resume_Loader")
+        workflow.add_node("Process_Resume", branch.compile())
+        workflow.add_edge(START, "Process_Resume")
+        workflow.add_edge(START, "Extract_Jobs")
+        workflow.add_edge(["Process_Resume", "Extract_Jobs"], "Join_Results")
+    else:
+        _add_resume_nodes(workflow, load, extract, embed, "Extract_Jobs")
+        workflow.add_edge(START, "Resume_Loader")
+        workflow.add_edge("Extract_Jobs", "Join_Results")
+
+    workflow.add_edge("Join_Results", END)
+    return workflow.compile()
@@ -1,14 +1,17 @@
-from io import BytesIO
 from langchain_community.document_loaders import PDFPlumberLoader
+import asyncio
 import os
-import pdfplumber
 from pinecone import Pinecone
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 from langchain_pinecone import PineconeVectorStore
-from langgraph.graph import StateGraph, START, END
-from scraper.job_scraper import LinkedInJobsScraper
+from scraper.job_scraper import LinkedInJobsScraper, ScraperConfig
+from scraper.ingest import fresh_jobs
+from scraper.search_store import default_search_store
 from state.resumeState import JobMatchingAgentState, ProfileSchema
-from db.database import supabase
+from db.database import default_database
+from db.resume_memo import default_resume_memo
+from resume_graph import build_resume_graph
+from pdf_extract import PdfLimitError, default_pdf_extractor
 
 embeddings = GoogleGenerativeAIEmbeddings(model="models/gemini-embedding-001",output_dimensionality=768)
 pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
@@ -23,22 +26,46 @@ async def loadResume(state:JobMatchingAgentState):
     """
     extract Raw Text
     """
+    memo = default_resume_memo()
+    # a resume uploaded with the request (/jobs/match-jobs) instead of the one in Supabase
+    pdf_bytes = state.get("resume_pdf")
     try:
-        print("Supabase is loading")
-        res=supabase.table("resume").select("path").eq("id",state["user_id"]).single().execute()
-        file_path=res.data["path"]
-        pdf_bytes = supabase.storage.from_("JobNexusBucket").download(file_path)
+        if pdf_bytes:
+            fingerprint = memo.record_upload(state["user_id"], "upload", pdf_bytes)
+        else:
+            print("Supabase is loading")
+            path = await default_database().resume_path(state["user_id"])
+            fingerprint = memo.fingerprint(state["user_id"], path)
+            if fingerprint is None:
+                pdf_bytes = await default_database().download_resume(path)
+                fingerprint = memo.record_upload(state["user_id"], path, pdf_bytes)
     except Exception as e:
         print(f"Something went wrong{e}")
         raise RuntimeError(f"Resume load failed or Resume not Uploaded")
-    raw_text = ""
-    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
-        for page in pdf.pages:
-            raw_text += page.extract_text() or ""
+
+    # same resume as last time: reuse its profile, and its embedding if it is the user's current one
+    profile = memo.profile(fingerprint.content_hash)
+    if profile is not None:
+        return {
+            "resume_hash":fingerprint.content_hash,
+            "embedded_hash":fingerprint.embedded_hash,
+            "extracted_data":profile,
+            "status":"STRUCTURED"
+        }
+    if not pdf_bytes:
+        # fingerprinted before, but its profile was never extracted
+        pdf_bytes = await default_database().download_resume(path)
+    # parsed on the PDF process pool so the parallel job search keeps running
+    try:
+        raw_text = await default_pdf_extractor().extract_text(pdf_bytes)
+    except PdfLimitError as e:
+        raise RuntimeError(f"Resume rejected: {e}")
     if not raw_text:
         raise RuntimeError("Cannot Parse resume pdf")
     return {
             "raw_text":raw_text,
+            "resume_hash":fingerprint.content_hash,
+            "embedded_hash":fingerprint.embedded_hash,
             "status":"TEXT_EXTRACTED"
         }
 
@@ -48,7 +75,8 @@ async def extract_profile(state:JobMatchingAgentState):
     """
 
     structuredmodel=model.with_structured_output(ProfileSchema)
-    result=structuredmodel.invoke(state["raw_text"])
+    result=await structuredmodel.ainvoke(state["raw_text"])
+    default_resume_memo().save_profile(state["resume_hash"], result)
     return {
         "extracted_data":result,
         "status":"STRUCTURED"
@@ -69,56 +97,67 @@ async def generate_embedding_and_store(state:JobMatchingAgentState):
         "role":profile.role
     }
 
-    embedding = vector_store.add_texts(
+    embedding = await vector_store.aadd_texts(
         texts=[semantic_text],
         metadatas=[metadata],
         ids=[str(state["user_id"])])
+    default_resume_memo().mark_embedded(state["user_id"], state["resume_hash"])
     return {
         "status": "EMBEDDING_GENERATED"
     }
 
 async def extract_jobs(state:JobMatchingAgentState):
     params = {"keywords" : state["prefered_role"], "location" : state["prefered_location"], "max_jobs" : 5}
-    
+
+    # answer from the ingestion worker's store when it has a fresh crawl of this search
+    stored = await asyncio.to_thread(fresh_jobs, **params)
+    if stored is None:
+        # otherwise any recently catalogued posting that matches the role and city
+        stored = await default_database().search_jobs(
+            params["keywords"], params["location"], params["max_jobs"], max_age=ScraperConfig.INGEST_MAX_AGE
+        )
+        if len(stored) < params["max_jobs"]:
+            stored = None
+    if stored is not None:
+        return {
+            "ScrapedJobs" : stored,
+            "status" : "COMPLETED"
+        }
+
+    # an incremental crawl asks for date order (sortBy=DD), so it is only used to refresh a search the
+    # ingestion worker already keeps; a search seen for the first time gets LinkedIn's relevance order
+    saved = await asyncio.to_thread(default_search_store().load, params["keywords"], params["location"])
     try:
         async with LinkedInJobsScraper() as client:
-            jobs = await client.scrape_jobs(**params)
-            
-            if isinstance(jobs, list):
-                jobs_data = jobs
-            elif isinstance(jobs, dict):
-                jobs_data = jobs
-            else:
-                jobs_data = []
-
-            return {
-                "ScrapedJobs" : jobs_data,
-                "status" : "COMPLETED"
-            }
+            jobs = await client.scrape_jobs(**params, incremental=saved.high_water_mark > 0)
     except Exception as e:
         return {
             "ScrapedJobs" : [],
             "status" : "FAILED"
         }
-            
-        
-
-workflow = StateGraph(JobMatchingAgentState)
 
+    # the scrape already succeeded; a catalog that can't be written only costs the next request a scrape
+    try:
+        await default_database().add_jobs(jobs)
+    except Exception as e:
+        print(f"Could not add scraped jobs to the catalog: {e}")
 
-workflow.add_node("Resume_Loader", loadResume)
-workflow.add_node("Profile_Extractor", extract_profile)
-workflow.add_node("Embbeder_and_VectorStorage", generate_embedding_and_store)
-workflow.add_node("Extract_Jobs", extract_jobs)
-
+    if isinstance(jobs, list):
+        jobs_data = jobs
+    elif isinstance(jobs, dict):
+        jobs_data = jobs
+    else:
+        jobs_data = []
 
-workflow.add_edge(START, "Resume_Loader")
-workflow.add_edge("Resume_Loader", "Profile_Extractor")
-workflow.add_edge("Profile_Extractor", "Embbeder_and_VectorStorage")
-workflow.add_edge("Embbeder_and_VectorStorage","Extract_Jobs")
-workflow.add_edge("Extract_Jobs", END)
+    return {
+        "ScrapedJobs" : jobs_data,
+        "status" : "COMPLETED"
+    }
+            
+        
 
-resume_subgraph = workflow.compile()
+# the job search runs alongside resume loading, extraction and embedding
+resume_subgraph = build_resume_graph(loadResume, extract_profile, generate_embedding_and_store, extract_jobs)
 
 resume_tool = resume_subgraph.as_tool(
     name="resume_processor",
@@ -1,14 +1,16 @@
 import asyncio
 import os
-import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional
 from pinecone import Pinecone
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 from langchain_pinecone import PineconeVectorStore
 from langgraph.graph import StateGraph, START, END
-from scraper.profile_scraper import LinkedInScraperConfig, LinkedInScraperService, StaffSearchParams
+from scraper.contact_cache import default_contact_cache, referral_key
+from scraper.contact_mapper import map_staff_records
+from scraper.profile_scraper import LinkedInScraperService, StaffSearchParams, session_configs
 from state.contactState import Contacts, ReferralState
 from langchain_core.prompts import PromptTemplate
-from db.database import supabase
+from db.database import default_database
 
 embeddings = GoogleGenerativeAIEmbeddings(model="models/gemini-embedding-001",output_dimensionality=768)
 
@@ -21,47 +23,78 @@ model = ChatGoogleGenerativeAI(
 
 
 
+# staff results per referral lookup from the agent tool
+REFERRAL_MAX_RESULTS = 1
+
+def _referral_key(state:ReferralState) -> str:
+    return referral_key(state["company_name"], state.get("search_term"), state.get("location"))
+
+
 async def findContacts(state:ReferralState):
     """
     Scrape linkedin profiles based on company For Referrals
     """
-    config = LinkedInScraperConfig(session_file="scraper/session.pkl", log_level=1)
+    cached = default_contact_cache(LinkedInScraperService.CONTACT_CACHE_TTL).get_contacts(
+        _referral_key(state), REFERRAL_MAX_RESULTS
+    )
+    if cached is not None:
+        # another user looked this up recently, skip the scrape and the LLM pass
+        return {
+            "rawContacts":[],
+            "contacts":[Contacts(**contact) for contact in cached],
+            "status":"FIND_CONTACTS"
+        }
+
     service = LinkedInScraperService()
-    service.initialize(config=config)
-    scraper = service.get_scraper()
+    # started at app startup; waits for that warm-up rather than logging in here
+    await service.ainitialize(session_configs())
     params = StaffSearchParams( 
             company_name=state["company_name"],
             search_term=state["search_term"],
             location=state["location"],
             extra_profile_data=True,
-            max_results=1)
-    loop = asyncio.get_event_loop()
-    results = await loop.run_in_executor(
-            None,
-            scraper.scrape_staff_to_dict,
-            params
-    )
+            max_results=REFERRAL_MAX_RESULTS)
+    # queued for the next free account in the pool
+    results = await service.scrape_staff(params)
     return {
         "rawContacts":results,
         "status":"FIND_CONTACTS"
     }
 
-async def getstructuredContacts(state:ReferralState):
+async def _structure_records(records:List[Dict[str, Any]]) -> List[Contacts]:
     """
-    Get Structured Output of the Contacts 
+    Contacts from staff records: mapped directly from staffspy's columns,
+    with one structured-output call per record that could not be mapped,
+    sent together with abatch
     """
+    contacts, unmapped = map_staff_records(records)
+    if not unmapped:
+        return contacts
     structuredmodel=model.with_structured_output(Contacts)
     template=PromptTemplate(template="""
     Extract all the details from the linkedin profile data 
     Data:{rawtext}""", 
     input_variables='rawtext')
+    prompts=[template.invoke({'rawtext':record}) for record in unmapped]
+    results=await structuredmodel.abatch(prompts, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Could not structure a contact: {result}")
+        elif isinstance(result, dict):
+            contacts.append(Contacts(**result))
+        elif result is not None:
+            contacts.append(result)
+    return contacts
 
-    prompt=template.invoke({'rawtext':state["rawContacts"]})
-    result=structuredmodel.invoke(prompt)
-    if isinstance(result, list):
-        contacts_list = [Contacts(**r) if isinstance(r, dict) else r for r in result]
-    else:
-        contacts_list = [Contacts(**result)] if isinstance(result, dict) else [result]
+async def getstructuredContacts(state:ReferralState):
+    """
+    Get Structured Output of the Contacts 
+    """
+    contacts_list = await _structure_records(state["rawContacts"])
+    if state["rawContacts"]:
+        default_contact_cache(LinkedInScraperService.CONTACT_CACHE_TTL).set_contacts(
+            _referral_key(state), REFERRAL_MAX_RESULTS, [contact.model_dump() for contact in contacts_list]
+        )
     return {
         "contacts":contacts_list,
         "status":"STRUCTURED"
@@ -73,19 +106,90 @@ async def store(state:ReferralState):
     store Contacts in Contact context layer
     """
     try:
-        links=supabase.table("contact").select("profile_link").eq("user_id",state["user_id"]).execute()
-        profile_links = {
-        row["profile_link"]
-        for row in (links.data or [])
-        }
-        
-        for contact in state["contacts"]:
-            if(not (contact.profile_link in profile_links)):
-                supabase.table("contact").insert({"id":str(uuid.uuid4()),"user_id":state["user_id"],**contact.model_dump()}).execute()
+        await default_database().add_contacts(state["user_id"], state["contacts"])
     except Exception as e:
         print("error",e)
         raise RuntimeError("error")
     
+MAX_BATCH_COMPANIES = 20
+
+async def _referrals_for_company(company_name:str, search_term:Optional[str], location:Optional[str], max_results:int) -> Dict[str, Any]:
+    key = referral_key(company_name, search_term, location)
+    cache = default_contact_cache(LinkedInScraperService.CONTACT_CACHE_TTL)
+    # a cached search for at least as many results is sliced, a smaller one is redone
+    cached = cache.get_contacts(key, max_results)
+    if cached is not None:
+        return {"company_name":company_name, "status":"CACHED", "contacts":[Contacts(**contact) for contact in cached]}
+
+    params = StaffSearchParams(
+            company_name=company_name,
+            search_term=search_term,
+            location=location,
+            extra_profile_data=True,
+            max_results=max_results)
+    records = await LinkedInScraperService().scrape_staff(params)
+    contacts = await _structure_records(records) if records else []
+    if records:
+        cache.set_contacts(key, max_results, [contact.model_dump() for contact in contacts])
+    return {"company_name":company_name, "status":"STRUCTURED", "contacts":contacts}
+
+async def iter_batch_referrals(
+    user_id,
+    company_names:List[str],
+    search_term:Optional[str] = None,
+    location:Optional[str] = None,
+    max_results:int = 1,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Referral search for several companies at once. Companies fan out
+    concurrently over the staff account pool (cached ones are answered
+    immediately) and one progress event is yielded per company as it
+    finishes: {"company_name", "status": CACHED/STRUCTURED/FAILED, "contacts"}.
+    All new contacts are then stored in one write and a final
+    {"status": "STORED", "stored": n} event is yielded.
+
+    Records staffspy's columns cannot map are structured with one abatch
+    per company rather than one for the whole batch, so each company's
+    event goes out when its own search finishes instead of waiting on the
+    slowest one. Closing the generator early (the client went away)
+    cancels the searches still running.
+    """
+    if len(company_names) > MAX_BATCH_COMPANIES:
+        raise ValueError(f"At most {MAX_BATCH_COMPANIES} companies per batch")
+    company_names = list(dict.fromkeys(name.strip() for name in company_names if name.strip()))
+    await LinkedInScraperService().ainitialize(session_configs())
+
+    async def run(company_name:str) -> Dict[str, Any]:
+        try:
+            return await _referrals_for_company(company_name, search_term, location, max_results)
+        except Exception as e:
+            print(f"Referral search for {company_name} failed: {e}")
+            return {"company_name":company_name, "status":"FAILED", "contacts":[], "detail":str(e)}
+
+    all_contacts:List[Contacts] = []
+    tasks = [asyncio.create_task(run(name)) for name in company_names]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            result = await finished
+            all_contacts.extend(result["contacts"])
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    stored = await default_database().add_contacts(user_id, all_contacts) if all_contacts else 0
+    yield {"status":"STORED", "stored":stored, "contacts":len(all_contacts)}
+
+async def find_batch_referrals(user_id, company_names:List[str], search_term:Optional[str] = None, location:Optional[str] = None) -> Dict[str, List[Contacts]]:
+    """
+    iter_batch_referrals without progress: contacts per company
+    """
+    referrals = {}
+    async for event in iter_batch_referrals(user_id, company_names, search_term, location):
+        if "company_name" in event:
+            referrals[event["company_name"]] = event["contacts"]
+    return referrals
+
 workflow = StateGraph(ReferralState)
 
 workflow.add_node("Find_Contacts",findContacts)
@@ -94,7 +198,12 @@ workflow.add_node("Store",store)
 
 
 workflow.add_edge(START,"Find_Contacts")
-workflow.add_edge("Find_Contacts","Structured_Contacts")
+# cache hits already carry structured contacts
+workflow.add_conditional_edges(
+    "Find_Contacts",
+    lambda state: "Store" if state.get("contacts") else "Structured_Contacts",
+    ["Structured_Contacts","Store"]
+)
 workflow.add_edge("Structured_Contacts","Store")
 workflow.add_edge("Store",END)
 
@@ -0,0 +1,52 @@
+import os
+from typing import Any, Dict, List, Optional
+
+from scraper.employee_cache import TTLCache, company_key
+
+
+def referral_key(company_name: str, search_term: Optional[str] = None, location: Optional[str] = None) -> str:
+    return "|".join(company_key(part or "") for part in (company_name, search_term, location))
+
+
+class ContactCache(TTLCache):
+    """
+    referral_key -> structured referral contacts (Contacts.model_dump()
+    dicts) and the max_results of the search that found them, so repeated
+    referral lookups asking for as many contacts or fewer skip both the
+    staff search and the LLM structuring pass
+    """
+
+    TABLE = "referral_contacts"
+    KEY_COLUMN = "referral_key"
+    VALUE_COLUMN = "contacts"
+
+    def key(self, name: str) -> str:
+        # callers pass referral_key(...), already normalized
+        return name
+
+    def get_contacts(self, key: str, max_results: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        The first `max_results` contacts cached under `key`; None if there
+        are none or they came from a search for fewer results
+        """
+        entry = self.get(key)
+        if not isinstance(entry, dict) or entry["max_results"] < max_results:
+            return None
+        return entry["contacts"][:max_results]
+
+    def set_contacts(self, key: str, max_results: int, contacts: List[Dict[str, Any]]) -> None:
+        self.set(key, {"max_results": max_results, "contacts": contacts})
+
+
+_default_cache: Optional[ContactCache] = None
+
+
+def default_contact_cache(ttl: float) -> ContactCache:
+    """
+    Process-wide cache; persisted with the other scraper caches when
+    SCRAPER_CACHE_PATH is set
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ContactCache(ttl, path=os.getenv("SCRAPER_CACHE_PATH"))
+    return _default_cache
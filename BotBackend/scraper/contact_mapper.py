@@ -0,0 +1,95 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from scraper.profile_scraper import HIDDEN_MEMBER_NAME
+from state.contactState import Contacts
+
+Record = Dict[str, Any]
+
+
+def _text(value: Any) -> Optional[str]:
+    # staffspy leaves missing columns as None (NaN when read back from a DataFrame)
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
+def _split_headline(headline: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    "Software Engineer at Google" -> ("Software Engineer", "Google")
+    """
+    if headline and " at " in headline:
+        position, company = headline.split(" at ", 1)
+        company = company.split("|")[0].strip()
+        return _text(position), _text(company)
+    return None, None
+
+
+def _profile_id(record: Record, profile_link: str) -> Optional[str]:
+    profile_id = _text(record.get("profile_id"))
+    if profile_id is None and "/in/" in profile_link:
+        profile_id = _text(profile_link.split("/in/", 1)[1].split("?")[0].strip("/"))
+    return profile_id
+
+
+def _skills(record: Record) -> List[str]:
+    skills = [_text(skill.get("name")) for skill in record.get("skills") or [] if isinstance(skill, dict)]
+    if not any(skills):
+        skills = [_text(record.get(f"top_skill_{i}")) for i in (1, 2, 3)]
+    return list(dict.fromkeys(skill for skill in skills if skill))
+
+
+def staff_record_to_contact(record: Record) -> Optional[Contacts]:
+    """
+    Contacts from one staffspy record (LinkedInAccountScraper.iter_staff)
+    without a model call. Position and company fall back to the headline
+    ("<position> at <company>") and the latest experience; None when the
+    record still lacks a name, profile link, position or company.
+    """
+    name = _text(record.get("name"))
+    profile_link = _text(record.get("profile_link"))
+    if name is None or name == HIDDEN_MEMBER_NAME or profile_link is None:
+        return None
+
+    headline = _text(record.get("headline"))
+    headline_position, headline_company = _split_headline(headline)
+    experiences = [exp for exp in record.get("experiences") or [] if isinstance(exp, dict)]
+    latest = experiences[0] if experiences else {}
+    position = _text(record.get("current_position")) or headline_position or _text(latest.get("title"))
+    company = _text(record.get("current_company")) or headline_company or _text(latest.get("company"))
+    if position is None or company is None:
+        return None
+
+    email = _text(record.get("connection_email")) or _text((record.get("emails_in_bio") or "").split(",")[0])
+    try:
+        return Contacts(
+            profile_link=profile_link,
+            profile_id=_profile_id(record, profile_link) or "",
+            name=name,
+            current_position=position,
+            current_company=company,
+            bio=_text(record.get("bio")) or headline or "",
+            email=email,
+            skills=_skills(record),
+        )
+    except ValidationError:
+        return None
+
+
+def map_staff_records(records: List[Record]) -> Tuple[List[Contacts], List[Record]]:
+    """
+    Split staff records into the contacts mapped deterministically and the
+    records left for the LLM. Hidden members and records without a profile
+    link are dropped: there is nothing to contact and nothing for a model to
+    recover.
+    """
+    contacts: List[Contacts] = []
+    unmapped: List[Record] = []
+    for record in records:
+        contact = staff_record_to_contact(record)
+        if contact is not None:
+            contacts.append(contact)
+        elif _text(record.get("profile_link")) and _text(record.get("name")) != HIDDEN_MEMBER_NAME:
+            unmapped.append(record)
+    return contacts, unmapped
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from scraper.write_behind import WriteBehind
+
+Records = List[Dict[str, Any]]
+
+
+def company_key(company_name: str) -> str:
+    return " ".join(company_name.lower().split())
+
+
+class TTLCache:
+    """
+    TTL + LRU map of normalized name -> JSON-able records, shared process-wide.
+    Concurrent lookups for the same name share one in-flight fetch. With
+    `path`, entries are also written to SQLite (TABLE), batched off the event
+    loop, and survive restarts: the newest `max_entries` unexpired rows are
+    loaded at startup, so get() never touches the database.
+    """
+
+    TABLE = ""
+    KEY_COLUMN = "key"
+    VALUE_COLUMN = "value"
+
+    def __init__(
+        self, ttl: float, max_entries: int = 1024, path: Optional[str] = None, flush_interval: float = 0.5
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Records]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._conn = None
+        self._writes: Optional[WriteBehind] = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE} (
+                    {self.KEY_COLUMN} TEXT PRIMARY KEY,
+                    {self.VALUE_COLUMN} TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+            rows = self._conn.execute(
+                f"SELECT {self.KEY_COLUMN}, {self.VALUE_COLUMN}, expires_at FROM {self.TABLE} "
+                "WHERE expires_at > ? ORDER BY expires_at DESC LIMIT ?",
+                (time.time(), max_entries),
+            ).fetchall()
+            # oldest first, so the LRU end holds the entries that expire soonest
+            for key, value, expires_at in reversed(rows):
+                self._entries[key] = (expires_at, json.loads(value))
+            self._writes = WriteBehind(self._write, flush_interval, name=f"{self.TABLE}-writer")
+
+    def key(self, name: str) -> str:
+        return company_key(name)
+
+    def get(self, name: str) -> Optional[Records]:
+        key = self.key(name)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, name: str, records: Records) -> None:
+        key = self.key(name)
+        expires_at = time.time() + self.ttl
+        self._entries[key] = (expires_at, records)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        if self._writes is not None:
+            self._writes.put(key, (key, records, expires_at))
+
+    def _write(self, rows: List[Tuple[str, Records, float]]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.TABLE} VALUES (?, ?, ?)",
+                [(key, json.dumps(records, ensure_ascii=False), expires_at) for key, records, expires_at in rows],
+            )
+            self._conn.commit()
+
+    async def get_or_fetch(
+        self, name: str, fetch: Callable[[], Awaitable[Optional[Records]]]
+    ) -> Records:
+        """
+        Cached records, or the result of `fetch()`; a None result (the page
+        could not be loaded) is returned as [] and not cached
+        """
+        cached = self.get(name)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        key = self.key(name)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            records = await fetch()
+            if records is not None:
+                self.set(name, records)
+            future.set_result(records or [])
+        except BaseException as e:
+            future.set_exception(e)
+            # mark retrieved so a failure with no waiters is not logged as unhandled
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        return records or []
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+        if self._writes is not None:
+            stats["writes"] = self._writes.stats()
+        return stats
+
+
+class EmployeeCache(TTLCache):
+    """
+    Company -> employee records for scrape_jobs(fetch_employees=True)
+    """
+
+    TABLE = "company_employees"
+    KEY_COLUMN = "company"
+    VALUE_COLUMN = "employees"
+
+
+_default_cache: Optional[EmployeeCache] = None
+
+
+def default_employee_cache(ttl: float) -> EmployeeCache:
+    """
+    Process-wide cache; persisted next to the HTTP cache when
+    SCRAPER_CACHE_PATH is set
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = EmployeeCache(ttl, path=os.getenv("SCRAPER_CACHE_PATH"))
+    return _default_cache
@@ -0,0 +1,168 @@
+import json
+from dataclasses import asdict, fields
+from functools import lru_cache
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional, only the Parquet export needs it
+    pa = None
+    pq = None
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(field.name for field in fields(cls))
+
+
+def job_record(job: Any) -> Dict[str, Any]:
+    """
+    Same dict as asdict(job), without asdict's deep copy of every value;
+    only the nested employee records are converted
+    """
+    record = {name: getattr(job, name) for name in _field_names(type(job))}
+    if record.get("employees"):
+        record["employees"] = [asdict(employee) for employee in record["employees"]]
+    return record
+
+
+class JsonlWriter:
+    """
+    Writes one job per line as it arrives, so nothing but the current record is held in memory
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._file = None
+
+    def __enter__(self) -> "JsonlWriter":
+        self._file = open(self.path, "w", encoding="utf-8")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._file.close()
+
+    def write(self, job: Any) -> None:
+        self._file.write(json.dumps(job_record(job), ensure_ascii=False))
+        self._file.write("\n")
+        self.count += 1
+
+
+class JsonArrayWriter(JsonlWriter):
+    """
+    Same incremental writing, but produces one JSON array (the save_results .json format),
+    one compact record per line
+    """
+
+    def __enter__(self) -> "JsonArrayWriter":
+        super().__enter__()
+        self._file.write("[")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._file.write("\n]\n" if self.count else "]\n")
+        super().__exit__(exc_type, exc_val, exc_tb)
+
+    def write(self, job: Any) -> None:
+        self._file.write(",\n" if self.count else "\n")
+        self._file.write(json.dumps(job_record(job), ensure_ascii=False))
+        self.count += 1
+
+
+def _arrow_schema():
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema(
+        [
+            ("title", pa.string()),
+            ("company", dictionary),
+            ("location", dictionary),
+            ("job_link", pa.string()),
+            ("posted_date", pa.string()),
+            ("description", pa.string()),
+            ("job_id", pa.string()),
+            ("posted_at", pa.float64()),
+            # nested employee records as a JSON string, most rows have none
+            ("employees", pa.string()),
+        ]
+    )
+
+
+def to_record_batch(jobs: List[Any]):
+    """
+    Arrow RecordBatch of jobs; company and location are dictionary-encoded
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required for Arrow/Parquet export")
+    schema = _arrow_schema()
+    columns = {name: [] for name in schema.names}
+    for job in jobs:
+        for name in schema.names:
+            if name == "employees":
+                columns[name].append(json.dumps([asdict(e) for e in job.employees]) if job.employees else None)
+            else:
+                columns[name].append(getattr(job, name))
+    return pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+class ParquetWriter:
+    """
+    Buffers `batch_size` jobs, then writes them as one Parquet row group
+    """
+
+    def __init__(self, path: str, batch_size: int = 5000):
+        if pq is None:
+            raise ImportError("pyarrow is required for Parquet export")
+        self.path = path
+        self.batch_size = batch_size
+        self.count = 0
+        self._buffer: List[Any] = []
+        self._writer: Optional["pq.ParquetWriter"] = None
+
+    def __enter__(self) -> "ParquetWriter":
+        self._writer = pq.ParquetWriter(self.path, _arrow_schema(), compression="zstd")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+        self._writer.close()
+
+    def write(self, job: Any) -> None:
+        self._buffer.append(job)
+        self.count += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._writer.write_batch(to_record_batch(self._buffer))
+            self._buffer = []
+
+
+def open_writer(path: str):
+    if path.endswith(".jsonl"):
+        return JsonlWriter(path)
+    if path.endswith(".parquet"):
+        return ParquetWriter(path)
+    return JsonArrayWriter(path)
+
+
+def export_jobs(jobs: Iterable[Any], path: str) -> int:
+    """
+    Write jobs to .jsonl, .parquet or (anything else) a JSON array, streaming; returns the count
+    """
+    with open_writer(path) as writer:
+        for job in jobs:
+            writer.write(job)
+    return writer.count
+
+
+async def export_jobs_stream(jobs: AsyncIterable[Any], path: str) -> int:
+    """
+    export_jobs for an async source such as a crawl that yields jobs as they finish
+    """
+    with open_writer(path) as writer:
+        async for job in jobs:
+            writer.write(job)
+    return writer.count
@@ -0,0 +1,287 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from scraper.write_behind import WriteBehind
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    body: str
+    fetched_at: float
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CacheBackend:
+    # get() does blocking I/O; ResponseCache.alookup runs it off the event loop
+    blocking = False
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        raise NotImplementedError
+
+    def set(self, entry: CachedResponse) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def write_stats(self) -> Dict[str, int]:
+        return {}
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU keyed by URL
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    def set(self, entry: CachedResponse) -> None:
+        self._entries[entry.url] = entry
+        self._entries.move_to_end(entry.url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    On-disk store that survives restarts and is shared by every worker on the
+    host. Writes are batched off the event loop (see WriteBehind), and rows
+    expired for more than `max_stale` seconds, too old to be worth
+    revalidating, are deleted at most every `prune_interval` seconds. get()
+    queries the database, so async callers go through ResponseCache.alookup;
+    len() is the row count as of the last write.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str,
+        max_stale: float = 7 * 24 * 60 * 60,
+        prune_interval: float = 60 * 60,
+        flush_interval: float = 0.5,
+    ):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_stale = max_stale
+        self.prune_interval = prune_interval
+        self._pruned_at = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS http_cache_expires_at ON http_cache (expires_at)")
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+        self._writes = WriteBehind(self._write, flush_interval, name="http-cache-writer")
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        pending = self._writes.get(url)
+        if pending is not None:
+            return pending
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, body, fetched_at, expires_at, etag, last_modified FROM http_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def set(self, entry: CachedResponse) -> None:
+        self._writes.put(entry.url, entry)
+
+    def _write(self, entries: List[CachedResponse]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (entry.url, entry.body, entry.fetched_at, entry.expires_at, entry.etag, entry.last_modified)
+                    for entry in entries
+                ],
+            )
+            self._conn.commit()
+            self._count = self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+        if time.time() - self._pruned_at >= self.prune_interval:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Delete entries expired more than `max_stale` seconds ago; returns how many
+        """
+        self._pruned_at = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM http_cache WHERE expires_at < ?", (self._pruned_at - self.max_stale,)
+            )
+            self._conn.commit()
+            self._count -= cursor.rowcount
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        self._writes.flush()
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache")
+            self._conn.commit()
+            self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def write_stats(self) -> Dict[str, int]:
+        return self._writes.stats()
+
+    def close(self) -> None:
+        self._writes.close()
+        self._conn.close()
+
+
+class ResponseCache:
+    """
+    TTL cache for raw page bodies. Search-result pages and job-detail pages
+    get separate TTLs; any other URL is not cached. Expired entries are kept
+    so their ETag/Last-Modified can be sent back as a conditional request.
+    """
+
+    def __init__(self, backend: CacheBackend, search_ttl: float, detail_ttl: float):
+        self.backend = backend
+        self.search_ttl = search_ttl
+        self.detail_ttl = detail_ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale_served = 0
+        self.stores = 0
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        if "/jobs-guest/jobs/api/seeMoreJobPostings/search" in url:
+            return self.search_ttl
+        if "/jobs/view/" in url:
+            return self.detail_ttl
+        return None
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """
+        Return the stored entry (fresh or expired) for a cacheable URL and
+        count a hit only when it is fresh
+        """
+        if self.ttl_for(url) is None:
+            return None
+        return self._record(self.backend.get(url))
+
+    async def alookup(self, url: str) -> Optional[CachedResponse]:
+        """
+        lookup() for the event loop: a blocking backend is read in a worker
+        thread
+        """
+        if self.ttl_for(url) is None:
+            return None
+        if self.backend.blocking:
+            return self._record(await asyncio.to_thread(self.backend.get, url))
+        return self._record(self.backend.get(url))
+
+    def _record(self, entry: Optional[CachedResponse]) -> Optional[CachedResponse]:
+        if entry is not None and entry.is_fresh():
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+    def store(self, url: str, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        ttl = self.ttl_for(url)
+        if ttl is None:
+            return
+        now = time.time()
+        self.backend.set(CachedResponse(url, body, now, now + ttl, etag, last_modified))
+        self.stores += 1
+
+    def revalidate(self, entry: CachedResponse) -> None:
+        """
+        The server answered 304: the stored body is current for another TTL
+        """
+        ttl = self.ttl_for(entry.url) or 0
+        now = time.time()
+        entry.fetched_at = now
+        entry.expires_at = now + ttl
+        self.backend.set(entry)
+        self.revalidated += 1
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "revalidated": self.revalidated,
+            "stale_served": self.stale_served,
+            "stores": self.stores,
+            "entries": len(self.backend),
+        }
+        writes = self.backend.write_stats()
+        if writes:
+            stats["writes"] = writes
+        return stats
+
+
+_default_cache: Optional[ResponseCache] = None
+
+
+def default_response_cache(search_ttl: float, detail_ttl: float) -> ResponseCache:
+    """
+    Process-wide cache shared by every scraper instance. Set
+    SCRAPER_CACHE_PATH to persist it in SQLite, otherwise it lives in memory.
+    """
+    global _default_cache
+    if _default_cache is None:
+        path = os.getenv("SCRAPER_CACHE_PATH")
+        backend = SQLiteCacheBackend(path) if path else MemoryCacheBackend()
+        _default_cache = ResponseCache(backend, search_ttl, detail_ttl)
+    return _default_cache
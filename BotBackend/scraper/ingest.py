@@ -0,0 +1,165 @@
+"""
+Background ingestion: periodically crawls the most popular (role, location)
+pairs into the search store so request paths can answer from it instead of
+scraping LinkedIn live.
+
+    python -m scraper.ingest --targets ingest_targets.json --concurrency 2
+    python -m scraper.ingest --once
+
+Targets are a JSON list of {"keywords", "location", "popularity"}; the
+`max_searches` most popular are crawled each cycle. The API process only sees
+the results when both share SCRAPER_INDEX_PATH and JOB_CATALOG_PATH.
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from db.job_catalog import JobCatalog, default_job_catalog
+from scraper.job_scraper import JobData, LinkedInJobsScraper, ScraperConfig, create_session_pool, job_from_dict
+from scraper.rate_limiter import HostRateLimiter, default_rate_limiter
+from scraper.search_store import SearchStore, default_search_store
+from scraper.session_pool import close_shared_pool, start_shared_pool
+
+
+@dataclass
+class IngestTarget:
+    keywords: str
+    location: str
+    popularity: float = 0.0
+
+
+def load_targets(path: Optional[str] = None) -> List[IngestTarget]:
+    """
+    Targets from `path` (or INGEST_TARGETS_PATH), else ScraperConfig.INGEST_TARGETS
+    """
+    path = path or os.getenv("INGEST_TARGETS_PATH")
+    if path:
+        with open(path, encoding="utf-8") as f:
+            return [IngestTarget(**target) for target in json.load(f)]
+    return [IngestTarget(keywords, location, popularity) for keywords, location, popularity in ScraperConfig.INGEST_TARGETS]
+
+
+def rank_targets(targets: List[IngestTarget], limit: int) -> List[IngestTarget]:
+    return sorted(targets, key=lambda target: target.popularity, reverse=True)[:limit]
+
+
+def fresh_jobs(
+    keywords: str,
+    location: str,
+    max_jobs: int,
+    max_age: float = ScraperConfig.INGEST_MAX_AGE,
+    store: Optional[SearchStore] = None,
+) -> Optional[List[JobData]]:
+    """
+    Up to `max_jobs` stored jobs for the search, or None when it was never
+    crawled, is older than `max_age` seconds or holds fewer than `max_jobs`
+    """
+    saved = (store if store is not None else default_search_store()).load(keywords, location)
+    if not saved.jobs or time.time() - saved.refreshed_at > max_age or len(saved.jobs) < max_jobs:
+        return None
+    return [job_from_dict(job) for job in saved.jobs[:max_jobs]]
+
+
+class IngestionCrawler:
+    """
+    Crawls targets incrementally into a search store (and the job catalog), `concurrency` searches
+    at a time. All crawls share one rate limiter so the worker as a whole
+    stays within REQUESTS_PER_SECOND.
+    """
+
+    def __init__(
+        self,
+        targets: List[IngestTarget],
+        concurrency: int = ScraperConfig.INGEST_CONCURRENCY,
+        max_jobs: int = ScraperConfig.INGEST_MAX_JOBS,
+        max_searches: int = ScraperConfig.INGEST_MAX_SEARCHES,
+        search_store: Optional[SearchStore] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        catalog: Optional[JobCatalog] = None,
+    ):
+        self.targets = targets
+        self.concurrency = concurrency
+        self.max_jobs = max_jobs
+        self.max_searches = max_searches
+        self.search_store = search_store if search_store is not None else default_search_store()
+        self.catalog = catalog if catalog is not None else default_job_catalog()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else default_rate_limiter(
+            ScraperConfig.REQUESTS_PER_SECOND, ScraperConfig.REQUEST_BURST
+        )
+        self.runs = 0
+        self.last_run: Dict[str, float] = {}
+
+    async def _crawl(self, target: IngestTarget, semaphore: asyncio.Semaphore) -> Optional[int]:
+        async with semaphore:
+            try:
+                async with LinkedInJobsScraper(rate_limiter=self.rate_limiter, search_store=self.search_store) as scraper:
+                    jobs = await scraper.scrape_jobs(
+                        target.keywords, target.location, max_jobs=self.max_jobs, incremental=True
+                    )
+                await asyncio.to_thread(self.catalog.add_jobs, jobs)
+                return len(jobs)
+            except Exception as e:
+                print(f"Ingestion of '{target.keywords}' in '{target.location}' failed: {e}")
+                return None
+
+    async def run_once(self) -> Dict[str, float]:
+        started = time.perf_counter()
+        targets = rank_targets(self.targets, self.max_searches)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        counts = await asyncio.gather(*(self._crawl(target, semaphore) for target in targets))
+        pruned_jobs = await asyncio.to_thread(self.catalog.prune, ScraperConfig.JOB_MAX_AGE)
+        pruned_searches = await asyncio.to_thread(self.search_store.prune, ScraperConfig.JOB_MAX_AGE)
+        self.runs += 1
+        self.last_run = {
+            "searches": len(targets),
+            "failed": sum(1 for count in counts if count is None),
+            "jobs": sum(count for count in counts if count is not None),
+            "pruned_jobs": pruned_jobs,
+            "pruned_searches": pruned_searches,
+            "seconds": round(time.perf_counter() - started, 2),
+        }
+        print(f"Ingestion run {self.runs}: {self.last_run}")
+        return self.last_run
+
+    async def run_forever(self, interval: float = ScraperConfig.INGEST_INTERVAL) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(interval)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--targets", default=None, help="JSON list of {keywords, location, popularity}")
+    parser.add_argument("--concurrency", type=int, default=ScraperConfig.INGEST_CONCURRENCY)
+    parser.add_argument("--max-jobs", type=int, default=ScraperConfig.INGEST_MAX_JOBS)
+    parser.add_argument("--max-searches", type=int, default=ScraperConfig.INGEST_MAX_SEARCHES)
+    parser.add_argument("--interval", type=float, default=ScraperConfig.INGEST_INTERVAL)
+    parser.add_argument("--once", action="store_true")
+    args = parser.parse_args()
+    for variable in ("SCRAPER_INDEX_PATH", "JOB_CATALOG_PATH"):
+        if not os.getenv(variable):
+            print(f"{variable} is not set, ingested jobs are only kept in this process.")
+
+    crawler = IngestionCrawler(
+        load_targets(args.targets),
+        concurrency=args.concurrency,
+        max_jobs=args.max_jobs,
+        max_searches=args.max_searches,
+    )
+    # one keep-alive session for every crawl, as under the API
+    await start_shared_pool(create_session_pool())
+    try:
+        if args.once:
+            await crawler.run_once()
+        else:
+            await crawler.run_forever(args.interval)
+    finally:
+        await close_shared_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
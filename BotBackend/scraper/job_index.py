@@ -0,0 +1,183 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from scraper.write_behind import WriteBehind
+
+JOB_ID_PATTERNS = [
+    re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)"),
+    re.compile(r"[?&]currentJobId=(\d+)"),
+    re.compile(r"urn:li:jobPosting:(\d+)"),
+]
+
+
+def canonical_job_id(url: str) -> Optional[str]:
+    """
+    LinkedIn's numeric posting ID, whatever host, slug or tracking params
+    the link carries, e.g. uk.linkedin.com/jobs/view/ml-engineer-at-x-4123?trk=.. -> "4123"
+    """
+    for pattern in JOB_ID_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
+
+
+class JobIndex:
+    """
+    Remembers which postings have been seen, and their description once
+    fetched. With `description_ttl`, descriptions older than that many
+    seconds are not returned, so they get fetched again.
+    """
+
+    description_ttl: Optional[float] = None
+
+    def _fresh(self, described_at: Optional[float]) -> bool:
+        return self.description_ttl is None or (
+            described_at is not None and time.time() - described_at < self.description_ttl
+        )
+
+    def seen(self, job_id: str) -> bool:
+        raise NotImplementedError
+
+    def get_description(self, job_id: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def add(self, job_id: str, description: Optional[str] = None) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryJobIndex(JobIndex):
+    """
+    LRU-bounded index: past `max_entries` postings the least recently
+    seen ones are forgotten
+    """
+
+    def __init__(self, max_entries: int = 20_000, description_ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.description_ttl = description_ttl
+        # job_id -> (description, when it was fetched)
+        self._entries: "OrderedDict[str, Tuple[Optional[str], Optional[float]]]" = OrderedDict()
+
+    def seen(self, job_id: str) -> bool:
+        return job_id in self._entries
+
+    def get_description(self, job_id: str) -> Optional[str]:
+        entry = self._entries.get(job_id)
+        if entry is None or not self._fresh(entry[1]):
+            return None
+        self._entries.move_to_end(job_id)
+        return entry[0]
+
+    def add(self, job_id: str, description: Optional[str] = None) -> None:
+        if description is not None or job_id not in self._entries:
+            self._entries[job_id] = (description, time.time() if description is not None else None)
+        self._entries.move_to_end(job_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteJobIndex(JobIndex):
+    """
+    Persistent index so postings stay known across crawls and restarts.
+    Lookups go through an in-process set first; writes are batched off the
+    event loop (see WriteBehind).
+    """
+
+    def __init__(self, path: str, description_ttl: Optional[float] = None, flush_interval: float = 0.5):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.description_ttl = description_ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                job_id TEXT PRIMARY KEY,
+                description TEXT,
+                first_seen REAL NOT NULL,
+                described_at REAL
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(seen_jobs)")}
+        if "described_at" not in columns:
+            # indexes created before descriptions expired; theirs count from first_seen
+            self._conn.execute("ALTER TABLE seen_jobs ADD COLUMN described_at REAL")
+        self._conn.commit()
+        self._seen = {row[0] for row in self._conn.execute("SELECT job_id FROM seen_jobs")}
+        self._writes = WriteBehind(self._write, flush_interval, name="job-index-writer")
+
+    def seen(self, job_id: str) -> bool:
+        return job_id in self._seen
+
+    def get_description(self, job_id: str) -> Optional[str]:
+        if job_id not in self._seen:
+            return None
+        pending = self._writes.get(job_id)
+        if pending is not None and pending[1] is not None:
+            return pending[1] if self._fresh(pending[3]) else None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT description, COALESCE(described_at, first_seen) FROM seen_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None or not self._fresh(row[1]):
+            return None
+        return row[0]
+
+    def add(self, job_id: str, description: Optional[str] = None) -> None:
+        if description is None and job_id in self._seen:
+            return
+        now = time.time()
+        self._writes.put(job_id, (job_id, description, now, now if description is not None else None))
+        self._seen.add(job_id)
+
+    def _write(self, rows: List[Tuple[str, Optional[str], float, Optional[float]]]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO seen_jobs (job_id, description, first_seen, described_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET
+                    description = COALESCE(excluded.description, description),
+                    described_at = COALESCE(excluded.described_at, described_at)
+                """,
+                rows,
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def close(self) -> None:
+        self._writes.close()
+        self._conn.close()
+
+
+_default_index: Optional[JobIndex] = None
+
+
+def default_job_index(description_ttl: Optional[float] = None) -> JobIndex:
+    """
+    Process-wide index shared by every scraper instance. Set
+    SCRAPER_INDEX_PATH to persist it in SQLite, otherwise it lives in memory.
+    """
+    global _default_index
+    if _default_index is None:
+        path = os.getenv("SCRAPER_INDEX_PATH")
+        _default_index = (
+            SQLiteJobIndex(path, description_ttl) if path else MemoryJobIndex(description_ttl=description_ttl)
+        )
+    return _default_index
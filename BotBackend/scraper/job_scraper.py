@@ -1,14 +1,31 @@
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 import aiohttp
 from bs4 import BeautifulSoup
 import asyncio
-import random
-import json
+import sys
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from urllib.parse import quote
-
-
-@dataclass
+from scraper.export import export_jobs
+from scraper.employee_cache import EmployeeCache, default_employee_cache
+from scraper.job_index import JobIndex, canonical_job_id, default_job_index
+from scraper.http_cache import CachedResponse, ResponseCache, default_response_cache
+from scraper.parsers import ParserBackend, get_parser_backend
+from scraper.posted_date import parse_posted_date
+from scraper.session_pool import SessionPool, get_shared_pool
+from scraper.search_store import SavedSearch, SearchStore, default_search_store
+from scraper.rate_limiter import (
+    AdaptiveConcurrencyController,
+    HostConcurrencyController,
+    HostRateLimiter,
+    default_concurrency_controller,
+    default_rate_limiter,
+)
+
+
+@dataclass(slots=True)
 class EmployeeData:
     name: str
     title: str
@@ -19,7 +36,7 @@ class EmployeeData:
     phone: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobData:
     title: str
     company: str
@@ -27,16 +44,69 @@ class JobData:
     job_link: str
     posted_date: str
     description: Optional[str] = None
+    job_id: Optional[str] = None
+    # posted_date as a Unix timestamp, anchored to when the card was fetched
+    posted_at: Optional[float] = None
     employees: List[EmployeeData] = field(default_factory=list)
 
+    @property
+    def key(self) -> str:
+        return self.job_id or self.job_link
+
+
+def job_from_dict(data: Dict[str, Any]) -> JobData:
+    employees = [EmployeeData(**employee) for employee in data.get("employees") or []]
+    return JobData(
+        **{
+            **data,
+            "company": sys.intern(data["company"]),
+            "location": sys.intern(data["location"]),
+            "employees": employees,
+        }
+    )
+
 
 class ScraperConfig:
     BASE_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+    PEOPLE_SEARCH_URL = "https://www.linkedin.com/search/results/people/"
     JOBS_PER_PAGE = 25
-    MIN_DELAY = 2
-    MAX_DELAY = 5
     RATE_LIMIT_DELAY = 30
+    # a throttle asking for a longer pause than this fails the request instead
+    MAX_COOLDOWN = 60
     RATE_LIMIT_THRESHOLD = 10
+    REQUESTS_PER_SECOND = 2.0
+    REQUEST_BURST = 5
+    MAX_CONCURRENT_REQUESTS = 5
+    INITIAL_CONCURRENCY = 2
+    MAX_RETRIES = 3
+    THROTTLE_STATUSES = (429, 999)
+    CACHE_SEARCH_TTL = 15 * 60
+    CACHE_DETAIL_TTL = 24 * 60 * 60
+    PARSER_BACKEND = "lxml"
+    SAVED_SEARCH_LIMIT = 200
+    CONNECTOR_LIMIT = 20
+    CONNECTOR_LIMIT_PER_HOST = 10
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 30
+    REQUEST_TIMEOUT = 30
+    EMPLOYEE_CACHE_TTL = 24 * 60 * 60
+    # postings older than this are dropped from saved searches and the job catalog
+    JOB_MAX_AGE = 30 * 24 * 60 * 60
+    INGEST_CONCURRENCY = 2
+    INGEST_MAX_JOBS = 50
+    INGEST_MAX_SEARCHES = 20
+    INGEST_INTERVAL = 60 * 60
+    INGEST_MAX_AGE = 6 * 60 * 60
+    # how often the API process prunes its job catalog and saved searches
+    PRUNE_INTERVAL = 60 * 60
+    # (keywords, location, popularity) crawled when no targets file is given
+    INGEST_TARGETS = [
+        ("Software Engineer", "London", 10),
+        ("Data Scientist", "London", 8),
+        ("AI/ML Engineer", "London", 8),
+        ("Software Engineer", "Bangalore", 7),
+        ("Frontend Developer", "Remote", 5),
+    ]
 
     HEADERS = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -49,88 +119,241 @@ class ScraperConfig:
     }
 
 
+def create_session_pool() -> SessionPool:
+    return SessionPool(
+        headers=ScraperConfig.HEADERS,
+        limit=ScraperConfig.CONNECTOR_LIMIT,
+        limit_per_host=ScraperConfig.CONNECTOR_LIMIT_PER_HOST,
+        dns_cache_ttl=ScraperConfig.DNS_CACHE_TTL,
+        keepalive_timeout=ScraperConfig.KEEPALIVE_TIMEOUT,
+        total_timeout=ScraperConfig.REQUEST_TIMEOUT,
+    )
+
+
 class LinkedInJobsScraper:
-    def __init__(self):
+    def __init__(
+        self,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        max_concurrency: Optional[int] = None,
+        controller: Optional[AdaptiveConcurrencyController] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        parser: Union[str, ParserBackend] = ScraperConfig.PARSER_BACKEND,
+        index: Optional[JobIndex] = None,
+        search_store: Optional[SearchStore] = None,
+        session_pool: Optional[SessionPool] = None,
+        employee_cache: Optional[EmployeeCache] = None,
+    ):
+        self.employee_cache = (
+            employee_cache if employee_cache is not None else default_employee_cache(ScraperConfig.EMPLOYEE_CACHE_TTL)
+        )
         self.session = None
+        self.pool: Optional[SessionPool] = None
+        self._pool = session_pool
+        self._owned_pool: Optional[SessionPool] = None
+        self.index = index if index is not None else default_job_index(ScraperConfig.CACHE_DETAIL_TTL)
+        self.search_store = search_store if search_store is not None else default_search_store()
+        self.dedup_stats = {"duplicate_cards": 0, "seen_skipped": 0, "descriptions_reused": 0}
+        self.parser = get_parser_backend(parser) if isinstance(parser, str) else parser
+        self.cache = None
+        if use_cache:
+            self.cache = cache if cache is not None else default_response_cache(
+                ScraperConfig.CACHE_SEARCH_TTL, ScraperConfig.CACHE_DETAIL_TTL
+            )
+        self.rate_limiter = rate_limiter if rate_limiter is not None else default_rate_limiter(
+            ScraperConfig.REQUESTS_PER_SECOND, ScraperConfig.REQUEST_BURST
+        )
+        self.max_concurrency = max_concurrency or ScraperConfig.MAX_CONCURRENT_REQUESTS
+        # RATE_LIMIT_THRESHOLD healthy responses in a row earn one more slot;
+        # RATE_LIMIT_DELAY is the cooldown when a throttle carries no Retry-After
+        settings = dict(
+            initial_limit=min(ScraperConfig.INITIAL_CONCURRENCY, self.max_concurrency),
+            min_limit=1,
+            max_limit=self.max_concurrency,
+            increase_after=ScraperConfig.RATE_LIMIT_THRESHOLD,
+            default_cooldown=ScraperConfig.RATE_LIMIT_DELAY,
+            max_cooldown=ScraperConfig.MAX_COOLDOWN,
+        )
+        # controllers are shared per host by the whole process unless the
+        # caller passes one or asks for its own max_concurrency
+        self.controller = controller
+        self.controllers = (
+            HostConcurrencyController(**settings)
+            if max_concurrency is not None
+            else default_concurrency_controller(**settings)
+        )
 
     async def __aenter__(self):
-        self.session = await self._setup_session()
+        # reuse the process-wide pool when the app started one, else own a session for this block
+        self.pool = self._pool or get_shared_pool()
+        if self.pool is None:
+            self.pool = self._owned_pool = create_session_pool()
+        self.session = await self.pool.start()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
-
-    async def _setup_session(self) -> aiohttp.ClientSession:
-        timeout = aiohttp.ClientTimeout(total=30)
-        connector = aiohttp.TCPConnector(limit=10)
-        return aiohttp.ClientSession(
-            timeout=timeout,
-            connector=connector,
-            headers=ScraperConfig.HEADERS
-        )
+        if self._owned_pool:
+            await self._owned_pool.close()
+            self._owned_pool = None
+        self.session = None
 
-    def _build_search_url(self, keywords: str, location: str, start: int = 0) -> str:
+    def _build_search_url(self, keywords: str, location: str, start: int = 0, newest_first: bool = False) -> str:
         params = {"keywords": keywords, "location": location, "start": start}
+        if newest_first:
+            # results default to relevance order; DD sorts them by date posted
+            params["sortBy"] = "DD"
         return f"{ScraperConfig.BASE_URL}?{'&'.join(f'{k}={quote(str(v))}' for k, v in params.items())}"
 
+    def controller_for(self, url: str) -> AdaptiveConcurrencyController:
+        return self.controller if self.controller is not None else self.controllers.controller_for(url)
+
     def _clean_job_url(self, url: str) -> str:
         return url.split("?")[0] if "?" in url else url
 
-    async def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
         try:
-            async with self.session.get(url, allow_redirects=True) as response:
-                if "authwall" in str(response.url):
-                    print(f"LinkedIn requires login for {url}. Aborting fetch.")
-                    return None
-                if response.status != 200:
-                    print(f"Failed to fetch page: Status {response.status} for URL: {url}")
-                    return None
-                text = await response.text()
-                return BeautifulSoup(text, "html.parser")
-        except aiohttp.ClientError as e:
-            print(f"Request failed for {url}: {str(e)}")
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
             return None
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    async def _fetch_html(self, url: str) -> Optional[str]:
+        text, _ = await self._fetch_html_at(url)
+        return text
+
+    async def _fetch_html_at(self, url: str) -> Tuple[Optional[str], float]:
+        """
+        Serve the page from the response cache while fresh; otherwise fetch it
+        (conditionally, if an expired copy is cached) and fall back to the
+        expired copy when the fetch fails. Also returns when the body was
+        fetched, which relative dates in it are measured from.
+        """
+        cached = await self.cache.alookup(url) if self.cache else None
+        if cached and cached.is_fresh():
+            return cached.body, cached.fetched_at
+
+        fetched_at = time.time()
+        text = await self._fetch_text(url, cached)
+        if text is None and cached:
+            print(f"Serving stale cached copy of {url}")
+            self.cache.stale_served += 1
+            return cached.body, cached.fetched_at
+        return text, fetched_at
+
+    async def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+        text = await self._fetch_html(url)
+        if text is None:
+            return None
+        return BeautifulSoup(text, "html.parser")
+
+    async def _fetch_text(self, url: str, cached: Optional[CachedResponse] = None) -> Optional[str]:
+        """
+        Fetch a page body through the host's adaptive controller. 429/999
+        shrink the concurrency limit and pause requests for Retry-After (or
+        RATE_LIMIT_DELAY), and give up on the page when that is longer than
+        MAX_COOLDOWN; throttles, 5xx and connection errors are retried up to
+        MAX_RETRIES times before giving up on the page. An authwall redirect
+        is a miss for that page only: it is not retried and does not pause
+        the host, since waiting does not make a login page go away.
+        """
+        controller = self.controller_for(url)
+        headers = cached.conditional_headers() if cached else None
+        backoff = 0
+        for attempt in range(ScraperConfig.MAX_RETRIES + 1):
+            if attempt:
+                controller.retries += 1
+            if backoff:
+                # waited out without a slot, so other requests aren't held up
+                await asyncio.sleep(backoff)
+                backoff = 0
+            await controller.acquire()
+            try:
+                await self.rate_limiter.acquire(url)
+                async with self.session.get(url, allow_redirects=True, headers=headers) as response:
+                    if "authwall" in str(response.url):
+                        print(f"LinkedIn requires login for {url}. Aborting fetch.")
+                        controller.on_failure()
+                        return None
+                    if response.status in ScraperConfig.THROTTLE_STATUSES:
+                        retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                        print(f"Rate limited (status {response.status}) for {url}, backing off (attempt {attempt + 1}).")
+                        if not controller.on_throttle(retry_after):
+                            print(f"Cooldown requested for {url} is over MAX_COOLDOWN, giving up.")
+                            return None
+                        continue
+                    if response.status == 304 and cached:
+                        controller.on_success()
+                        self.cache.revalidate(cached)
+                        return cached.body
+                    if response.status >= 500:
+                        print(f"Server error: Status {response.status} for URL: {url} (attempt {attempt + 1})")
+                        controller.on_failure()
+                        backoff = 2 ** attempt
+                        continue
+                    if response.status != 200:
+                        print(f"Failed to fetch page: Status {response.status} for URL: {url}")
+                        controller.on_failure()
+                        return None
+                    text = await response.text()
+                    controller.on_success()
+                    if self.cache:
+                        self.cache.store(
+                            url, text, response.headers.get("ETag"), response.headers.get("Last-Modified")
+                        )
+                    return text
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Request failed for {url}: {str(e)} (attempt {attempt + 1})")
+                controller.on_failure()
+                backoff = 2 ** attempt
+            finally:
+                await controller.release()
+        print(f"Giving up on {url} after {ScraperConfig.MAX_RETRIES + 1} attempts.")
+        return None
+
+    def metrics(self) -> Dict[str, Any]:
+        metrics: Dict[str, Any] = dict(self.controller_for(ScraperConfig.BASE_URL).metrics())
+        if self.cache:
+            metrics["cache"] = self.cache.stats()
+        metrics["dedup"] = {**self.dedup_stats, "indexed": len(self.index)}
+        if self.pool:
+            metrics["session"] = self.pool.stats()
+        metrics["employees"] = self.employee_cache.stats()
+        return metrics
 
     async def _fetch_job_description(self, job_url: str) -> str:
-        soup = await self._fetch_page(job_url)
-        if not soup:
+        text = await self._fetch_html(job_url)
+        if text is None:
             return "N/A"
-        
-        selectors = [
-            "div.show-more-less-html__markup",
-            "div.description__text",
-            "div[class*='description']",
-            "article",
-        ]
-        for selector in selectors:
-            desc_div = soup.select_one(selector)
-            if desc_div:
-                return desc_div.get_text(separator="\n", strip=True)
-        return "N/A"
-
-    def _extract_job_data(self, job_card: BeautifulSoup) -> Optional[JobData]:
-        try:
-            title = job_card.find("h3", class_="base-search-card__title").text.strip()
-            company = job_card.find("h4", class_="base-search-card__subtitle").text.strip()
-            location = job_card.find("span", class_="job-search-card__location").text.strip()
-            job_link = self._clean_job_url(job_card.find("a", class_="base-card__full-link")["href"])
-            posted_date_tag = job_card.find("time", class_="job-search-card__listdate")
-            posted_date = posted_date_tag.text.strip() if posted_date_tag else "N/A"
-
-            return JobData(title=title, company=company, location=location, job_link=job_link, posted_date=posted_date)
-        except Exception as e:
-            print(f"Failed to extract job data: {str(e)}")
-            return None
+        return self.parser.parse_description(text) or "N/A"
+
+    def _build_job(self, fields: Dict[str, str], fetched_at: float) -> JobData:
+        # the same few companies and locations repeat across thousands of cards
+        return JobData(
+            title=fields["title"],
+            company=sys.intern(fields["company"]),
+            location=sys.intern(fields["location"]),
+            job_link=self._clean_job_url(fields["job_link"]),
+            posted_date=fields["posted_date"],
+            job_id=canonical_job_id(fields["job_link"]),
+            posted_at=parse_posted_date(fields["posted_date"], fetched_at, fields.get("posted_datetime")),
+        )
 
-    async def _scrape_employees_for_company(self, company_name: str, max_employees: int = 5) -> List[EmployeeData]:
+    async def _scrape_employees_for_company(
+        self, company_name: str, max_employees: int = 5
+    ) -> Optional[List[EmployeeData]]:
         print(f"Attempting to scrape employees for '{company_name}'.")
-        search_url = f"https://www.linkedin.com/search/results/people/?keywords={quote(company_name)}"
+        search_url = f"{ScraperConfig.PEOPLE_SEARCH_URL}?keywords={quote(company_name)}"
         
         soup = await self._fetch_page(search_url)
         if not soup:
             print(f"Could not load search results for employees at '{company_name}'. Login is likely required.")
-            return []
+            return None
 
         employees = []
         # Selector for people search results. Highly likely to change and requires login for accuracy.
@@ -159,71 +382,192 @@ class LinkedInJobsScraper:
         print(f"Found {len(employees)} potential employee(s) for {company_name}.")
         return employees
 
+    async def _employees_for_company(self, company_name: str) -> List[EmployeeData]:
+        async def fetch() -> Optional[List[Dict[str, Any]]]:
+            employees = await self._scrape_employees_for_company(company_name)
+            return None if employees is None else [asdict(employee) for employee in employees]
+
+        records = await self.employee_cache.get_or_fetch(company_name, fetch)
+        return [EmployeeData(**record) for record in records]
+
+    async def scrape_jobs_iter(
+        self,
+        keywords: str,
+        location: str,
+        max_jobs: int = 5,
+        fetch_descriptions: bool = True,
+        skip_seen: bool = False,
+        known: Optional[SavedSearch] = None,
+    ) -> AsyncIterator[JobData]:
+        """
+        Yield a snapshot of each JobData as soon as its card is parsed
+        (description None), then yield it again once its description has been
+        fetched. Description fetches start while later pages are still being
+        paged through; closing the generator cancels outstanding work.
+
+        Postings are deduplicated by canonical job ID within the crawl, and
+        descriptions already in the job index are reused instead of fetched.
+        With `skip_seen`, postings indexed by earlier crawls are skipped too.
+
+        With `known` (a saved search), results are requested newest first,
+        its postings are skipped and paging stops at the first page that has
+        nothing new.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        pending: Set[asyncio.Task] = set()
+        done = object()
+        crawl_seen: Set[str] = set()
+
+        async def fetch_description(job: JobData) -> None:
+            known = self.index.get_description(job.job_id) if job.job_id else None
+            if known is not None:
+                self.dedup_stats["descriptions_reused"] += 1
+                job.description = known
+            else:
+                job.description = await self._fetch_job_description(job.job_link)
+                if job.job_id and job.description != "N/A":
+                    self.index.add(job.job_id, job.description)
+            await queue.put(job)
+
+        async def crawl() -> None:
+            found = 0
+            start = 0
+            try:
+                while found < max_jobs:
+                    url = self._build_search_url(keywords, location, start, newest_first=known is not None)
+                    text, fetched_at = await self._fetch_html_at(url)
+                    if text is None:
+                        break
+
+                    job_cards = self.parser.parse_cards(text)
+                    if not job_cards:
+                        print("No more job cards found.")
+                        break
+
+                    page_new = 0
+                    for fields in job_cards:
+                        job_data = self._build_job(fields, fetched_at)
+                        if job_data.key in crawl_seen:
+                            self.dedup_stats["duplicate_cards"] += 1
+                            continue
+                        crawl_seen.add(job_data.key)
+                        if known is not None and known.known(job_data.job_id, job_data.job_link):
+                            continue
+                        page_new += 1
+                        if job_data.job_id:
+                            if skip_seen and self.index.seen(job_data.job_id):
+                                self.dedup_stats["seen_skipped"] += 1
+                                continue
+                            self.index.add(job_data.job_id)
+                        found += 1
+                        await queue.put(replace(job_data))
+                        if fetch_descriptions:
+                            task = asyncio.create_task(fetch_description(job_data))
+                            pending.add(task)
+                            task.add_done_callback(pending.discard)
+                        if found >= max_jobs:
+                            break
+
+                    print(f"Scraped {found} jobs...")
+                    if known is not None and page_new == 0:
+                        print("Page only has previously seen postings, stopping.")
+                        break
+                    start += ScraperConfig.JOBS_PER_PAGE
+                if pending:
+                    print(f"\nWaiting on descriptions for {len(pending)} jobs...")
+                    await asyncio.gather(*list(pending))
+            finally:
+                await queue.put(done)
+
+        crawler = asyncio.create_task(crawl())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                yield item
+            await crawler
+        finally:
+            for task in [crawler, *pending]:
+                task.cancel()
+
     async def scrape_jobs(
-        self, keywords: str, location: str, max_jobs: int = 5, fetch_descriptions: bool = True, fetch_employees: bool = False
+        self,
+        keywords: str,
+        location: str,
+        max_jobs: int = 5,
+        fetch_descriptions: bool = True,
+        fetch_employees: bool = False,
+        skip_seen: bool = False,
+        incremental: bool = False,
     ) -> List[JobData]:
-        all_jobs = []
-        start = 0
-
-        while len(all_jobs) < max_jobs:
-            url = self._build_search_url(keywords, location, start)
-            soup = await self._fetch_page(url)
-            if not soup:
-                break
-            
-            job_cards = soup.find_all("div", class_="base-card")
-            if not job_cards:
-                print("No more job cards found.")
-                break
-                
-            for card in job_cards:
-                job_data = self._extract_job_data(card)
-                if job_data:
-                    all_jobs.append(job_data)
-                    if len(all_jobs) >= max_jobs:
-                        break
-                        
-            print(f"Scraped {len(all_jobs)} jobs...")
-            start += ScraperConfig.JOBS_PER_PAGE
-            await asyncio.sleep(random.uniform(ScraperConfig.MIN_DELAY, ScraperConfig.MAX_DELAY))
-        
-        jobs_to_process = all_jobs[:max_jobs]
+        """
+        With `incremental`, only postings newer than this search's saved
+        results are crawled (see scrape_jobs_iter `known`); the new jobs are
+        merged with the saved ones, most recently posted first, and saved
+        back, and the first `max_jobs` of the merged list are returned.
+        """
+        # the store may be SQLite; its reads and writes run in a worker thread
+        saved = await asyncio.to_thread(self.search_store.load, keywords, location) if incremental else None
+
+        # keyed by posting so the description update replaces the card snapshot in place
+        collected: Dict[str, JobData] = {}
+        async for job in self.scrape_jobs_iter(keywords, location, max_jobs, fetch_descriptions, skip_seen, saved):
+            collected[job.key] = job
+        jobs_to_process = list(collected.values())
 
-        if fetch_descriptions:
-            print(f"\nFetching descriptions for {len(jobs_to_process)} jobs...")
-            for i, job in enumerate(jobs_to_process, 1):
-                print(f"Fetching description {i}/{len(jobs_to_process)}: {job.title}")
-                job.description = await self._fetch_job_description(job.job_link)
-                await asyncio.sleep(random.uniform(ScraperConfig.MIN_DELAY, ScraperConfig.MAX_DELAY))
-        
         if fetch_employees:
-            print(f"\nFetching employees for unique companies...")
             unique_companies = list({job.company for job in jobs_to_process})
-            company_employee_map = {}
-            for i, company_name in enumerate(unique_companies, 1):
-                print(f"Scraping employees for company {i}/{len(unique_companies)}: {company_name}")
-                employees = await self._scrape_employees_for_company(company_name)
-                company_employee_map[company_name] = employees
-                await asyncio.sleep(random.uniform(ScraperConfig.MIN_DELAY, ScraperConfig.MAX_DELAY))
+            print(f"\nFetching employees for {len(unique_companies)} unique companies...")
+            # lookups run together; _fetch_page keeps them under the controller and rate limiter
+            employee_lists = await asyncio.gather(
+                *(self._employees_for_company(company_name) for company_name in unique_companies)
+            )
+            company_employee_map = dict(zip(unique_companies, employee_lists))
 
             for job in jobs_to_process:
                 job.employees = company_employee_map.get(job.company, [])
-                
+
+        if saved is not None:
+            print(f"Incremental crawl found {len(jobs_to_process)} new jobs, {len(saved.jobs)} saved.")
+            jobs_to_process = (await self._save_search(keywords, location, jobs_to_process, saved))[:max_jobs]
+
+        print(f"Scraper metrics: {self.metrics()}")
         return jobs_to_process
 
+    async def _save_search(
+        self, keywords: str, location: str, new_jobs: List[JobData], saved: SavedSearch
+    ) -> List[JobData]:
+        merged = new_jobs + [job_from_dict(job) for job in saved.jobs]
+        # freshest first, expired postings dropped; undated ones are kept after the dated
+        cutoff = time.time() - ScraperConfig.JOB_MAX_AGE
+        merged = [job for job in merged if job.posted_at is None or job.posted_at >= cutoff]
+        merged.sort(key=lambda job: (job.posted_at is None, -(job.posted_at or 0)))
+        merged = merged[:ScraperConfig.SAVED_SEARCH_LIMIT]
+        job_ids = [int(job.job_id) for job in merged if job.job_id and job.job_id.isdigit()]
+        await asyncio.to_thread(
+            self.search_store.save,
+            keywords,
+            location,
+            SavedSearch(
+                jobs=[asdict(job) for job in merged],
+                high_water_mark=max(job_ids + [saved.high_water_mark]),
+                refreshed_at=time.time(),
+            ),
+        )
+        return merged
+
     async def save_results(self, jobs: List[JobData], filename: str = "linkedin_jobs.json") -> None:
+        """
+        Stream jobs to `filename`: .jsonl one job per line, .parquet in Arrow
+        batches (needs pyarrow), anything else a JSON array
+        """
         if not jobs:
             print("No jobs to save.")
             return
-            
-        with open(filename, "w", encoding="utf-8") as f:
-            # Convert dataclasses to dicts for JSON serialization
-            json_output = [vars(job) for job in jobs]
-            for job_dict in json_output:
-                job_dict['employees'] = [vars(emp) for emp in job_dict['employees']]
-            
-            json.dump(json_output, f, indent=2, ensure_ascii=False)
-        print(f"Saved {len(jobs)} jobs to {filename}")
+
+        count = export_jobs(jobs, filename)
+        print(f"Saved {count} jobs to {filename}")
 
 
 async def main():
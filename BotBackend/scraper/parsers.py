@@ -0,0 +1,210 @@
+import re
+from typing import Dict, List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:  # lxml is optional, the BeautifulSoup backends cover it
+    etree = None
+    lxml_html = None
+
+
+DESCRIPTION_SELECTORS = [
+    "div.show-more-less-html__markup",
+    "div.description__text",
+    "div[class*='description']",
+    "article",
+]
+DESCRIPTION_CLASS_PATTERN = re.compile("description|show-more-less-html__markup")
+# a regex, not class_="base-card": newer bs4 strainers compare plain strings
+# against the whole class attribute ("base-card relative w-full ...")
+CARD_CLASS_PATTERN = re.compile(r"(^|\s)base-card(\s|$)")
+
+
+class ParserBackend:
+    """
+    Turns raw LinkedIn HTML into job-card field dicts (title, company,
+    location, job_link, posted_date and, when the card has one, the <time>
+    tag's posted_datetime) and description text
+    """
+
+    name = "base"
+
+    def parse_cards(self, text: str) -> List[Dict[str, str]]:
+        raise NotImplementedError
+
+    def parse_description(self, text: str) -> Optional[str]:
+        raise NotImplementedError
+
+
+class SoupParserBackend(ParserBackend):
+    """
+    Full BeautifulSoup tree with html.parser, the reference implementation
+    """
+
+    name = "soup"
+    features = "html.parser"
+
+    def _cards_soup(self, text: str) -> BeautifulSoup:
+        return BeautifulSoup(text, self.features)
+
+    def _description_soup(self, text: str) -> BeautifulSoup:
+        return BeautifulSoup(text, self.features)
+
+    def _card_fields(self, job_card) -> Optional[Dict[str, str]]:
+        try:
+            posted_date_tag = job_card.find("time", class_="job-search-card__listdate")
+            fields = {
+                "title": job_card.find("h3", class_="base-search-card__title").text.strip(),
+                "company": job_card.find("h4", class_="base-search-card__subtitle").text.strip(),
+                "location": job_card.find("span", class_="job-search-card__location").text.strip(),
+                "job_link": job_card.find("a", class_="base-card__full-link")["href"],
+                "posted_date": posted_date_tag.text.strip() if posted_date_tag else "N/A",
+            }
+            if posted_date_tag and posted_date_tag.get("datetime"):
+                fields["posted_datetime"] = posted_date_tag["datetime"]
+            return fields
+        except Exception as e:
+            print(f"Failed to extract job data: {str(e)}")
+            return None
+
+    def parse_cards(self, text: str) -> List[Dict[str, str]]:
+        cards = []
+        for job_card in self._cards_soup(text).find_all("div", class_="base-card"):
+            fields = self._card_fields(job_card)
+            if fields:
+                cards.append(fields)
+        return cards
+
+    def _select_description(self, soup: BeautifulSoup) -> Optional[str]:
+        for selector in DESCRIPTION_SELECTORS:
+            desc_div = soup.select_one(selector)
+            if desc_div:
+                return desc_div.get_text(separator="\n", strip=True)
+        return None
+
+    def parse_description(self, text: str) -> Optional[str]:
+        return self._select_description(self._description_soup(text))
+
+
+class StrainedSoupParserBackend(SoupParserBackend):
+    """
+    BeautifulSoup restricted by SoupStrainer to `div.base-card` on search
+    pages and to description divs on job pages, so the rest of the document
+    is never built into a tree. Uses lxml as the tokenizer when available.
+    """
+
+    name = "strained"
+    features = "lxml" if etree is not None else "html.parser"
+
+    def _cards_soup(self, text: str) -> BeautifulSoup:
+        return BeautifulSoup(text, self.features, parse_only=SoupStrainer("div", class_=CARD_CLASS_PATTERN))
+
+    def _description_soup(self, text: str) -> BeautifulSoup:
+        return BeautifulSoup(
+            text, self.features, parse_only=SoupStrainer("div", class_=DESCRIPTION_CLASS_PATTERN)
+        )
+
+    def parse_description(self, text: str) -> Optional[str]:
+        # pages whose description is only in an <article> need the full tree
+        return super().parse_description(text) or self._select_description(BeautifulSoup(text, self.features))
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+class LxmlParserBackend(ParserBackend):
+    """
+    lxml.html with precompiled XPath: one tree per page, one lookup per card field
+    """
+
+    name = "lxml"
+
+    def __init__(self):
+        if etree is None:
+            raise ImportError("lxml is not installed")
+        self._cards = etree.XPath("//" + _class_xpath("div", "base-card"))
+        self._fields = {
+            "title": etree.XPath(".//" + _class_xpath("h3", "base-search-card__title")),
+            "company": etree.XPath(".//" + _class_xpath("h4", "base-search-card__subtitle")),
+            "location": etree.XPath(".//" + _class_xpath("span", "job-search-card__location")),
+            "posted_date": etree.XPath(".//" + _class_xpath("time", "job-search-card__listdate")),
+        }
+        self._link = etree.XPath(".//" + _class_xpath("a", "base-card__full-link") + "/@href")
+        self._descriptions = [
+            etree.XPath("//" + _class_xpath("div", "show-more-less-html__markup")),
+            etree.XPath("//" + _class_xpath("div", "description__text")),
+            etree.XPath("//div[contains(@class, 'description')]"),
+            etree.XPath("//article"),
+        ]
+
+    def _root(self, text: str):
+        if not text or not text.strip():
+            return None
+        try:
+            return lxml_html.fromstring(text)
+        except (etree.ParserError, ValueError):
+            return None
+
+    def _card_fields(self, job_card) -> Optional[Dict[str, str]]:
+        fields = {}
+        for key, xpath in self._fields.items():
+            found = xpath(job_card)
+            if not found:
+                if key == "posted_date":
+                    fields[key] = "N/A"
+                    continue
+                print(f"Failed to extract job data: missing {key}")
+                return None
+            fields[key] = found[0].text_content().strip()
+            if key == "posted_date" and found[0].get("datetime"):
+                fields["posted_datetime"] = found[0].get("datetime")
+        link = self._link(job_card)
+        if not link:
+            print("Failed to extract job data: missing job_link")
+            return None
+        fields["job_link"] = link[0]
+        return fields
+
+    def parse_cards(self, text: str) -> List[Dict[str, str]]:
+        root = self._root(text)
+        if root is None:
+            return []
+        cards = []
+        for job_card in self._cards(root):
+            fields = self._card_fields(job_card)
+            if fields:
+                cards.append(fields)
+        return cards
+
+    def parse_description(self, text: str) -> Optional[str]:
+        root = self._root(text)
+        if root is None:
+            return None
+        for xpath in self._descriptions:
+            found = xpath(root)
+            if found:
+                return "\n".join(part.strip() for part in found[0].itertext() if part.strip())
+        return None
+
+
+PARSER_BACKENDS = {
+    SoupParserBackend.name: SoupParserBackend,
+    StrainedSoupParserBackend.name: StrainedSoupParserBackend,
+    LxmlParserBackend.name: LxmlParserBackend,
+}
+
+
+def get_parser_backend(name: str) -> ParserBackend:
+    """
+    Build a backend by name, falling back to the BeautifulSoup path when
+    the requested one cannot be used (e.g. lxml missing)
+    """
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend {name!r}, expected one of {sorted(PARSER_BACKENDS)}")
+    try:
+        return PARSER_BACKENDS[name]()
+    except ImportError as e:
+        print(f"Parser backend {name!r} unavailable ({e}), falling back to BeautifulSoup.")
+        return SoupParserBackend()
@@ -0,0 +1,42 @@
+import re
+from datetime import datetime, timezone
+from typing import Optional
+
+RELATIVE_PATTERN = re.compile(r"(\d+)\+?\s*(second|minute|hour|day|week|month|year)s?\s+ago")
+UNIT_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 60 * 60,
+    "day": 24 * 60 * 60,
+    "week": 7 * 24 * 60 * 60,
+    "month": 30 * 24 * 60 * 60,
+    "year": 365 * 24 * 60 * 60,
+}
+JUST_NOW = ("just now", "today", "moments ago")
+
+
+def parse_posted_date(text: Optional[str], fetched_at: float, datetime_attr: Optional[str] = None) -> Optional[float]:
+    """
+    Unix timestamp for a card's posted date. Relative text ("2 days ago",
+    "Reposted 3 hours ago", "30+ days ago") is anchored to `fetched_at`, the
+    time the page was fetched, not the time it is parsed; the <time datetime>
+    attribute is used when the text can't be read. None if neither can.
+    """
+    if text:
+        lowered = text.lower()
+        match = RELATIVE_PATTERN.search(lowered)
+        if match:
+            return fetched_at - int(match.group(1)) * UNIT_SECONDS[match.group(2)]
+        if any(phrase in lowered for phrase in JUST_NOW):
+            return fetched_at
+        if "yesterday" in lowered:
+            return fetched_at - UNIT_SECONDS["day"]
+    if datetime_attr:
+        try:
+            posted = datetime.fromisoformat(datetime_attr.strip())
+        except ValueError:
+            return None
+        if posted.tzinfo is None:
+            posted = posted.replace(tzinfo=timezone.utc)
+        return min(posted.timestamp(), fetched_at)
+    return None
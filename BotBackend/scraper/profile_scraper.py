@@ -1,18 +1,33 @@
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterator, Union
 from pathlib import Path
+import os
 from dataclasses import dataclass
 from enum import Enum
-import pandas as pd
-from staffspy import LinkedInAccount, SolverType, DriverType, BrowserType
 import asyncio
+import time
+from scraper.staff_pool import StaffScraperPool
+
+# staffspy (and the pandas it imports at module level) is loaded on first
+# login, not at app import; this only shortens startup, pandas is still in
+# the process once an account logs in
+if TYPE_CHECKING:
+    import pandas as pd
+    from staffspy import LinkedInAccount, DriverType, BrowserType
+
+HIDDEN_MEMBER_NAME = "LinkedIn Member"
+
+
+class AccountBlockedError(RuntimeError):
+    pass
+
 
 class LinkedInScraperConfig:
     def __init__(
         self,
         session_file: str = "session.pkl",
         log_level: int = 1,
-        driver_type: Optional[DriverType] = None,
-        browser_type: Optional[BrowserType] = None,
+        driver_type: Optional["DriverType"] = None,
+        browser_type: Optional["BrowserType"] = None,
         executable_path: Optional[str] = None
     ):
         self.session_file = session_file
@@ -22,8 +37,10 @@ class LinkedInScraperConfig:
         self.executable_path = executable_path
 
 
-    def getDriverConfig(self) -> Optional[DriverType]:
+    def getDriverConfig(self) -> Optional["DriverType"]:
         if self.executable_path and self.browser_type:
+            from staffspy import DriverType
+
             return DriverType(
                 browser_type=self.browser_type,
                 executable_path=self.executable_path
@@ -53,10 +70,12 @@ class StaffSearchParams:
 class LinkedInAccountScraper:
     def __init__(self, config: LinkedInScraperConfig) -> None:
         self.config = config
-        self.account : Optional[LinkedInAccount] = None
+        self.account : Optional["LinkedInAccount"] = None
         self.isInitialized = False
 
-    def init_account(self) -> LinkedInAccount:
+    def init_account(self) -> "LinkedInAccount":
+        from staffspy import LinkedInAccount
+
         driverConf = self.config.getDriverConfig()
 
         args = {
@@ -75,12 +94,20 @@ class LinkedInAccountScraper:
         if not self.isInitialized or self.account is None:
             self.init_account()
 
+    @property
+    def blocked(self) -> bool:
+        """
+        LinkedIn answered a search with a 429; the account can't search
+        again until it logs in anew
+        """
+        return self.account is not None and self.account.on_block
+
 
 
     def scrape_staff(
         self, 
         params: StaffSearchParams
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         self.ensure_initialized()
         
         staff_df = self.account.scrape_staff(
@@ -95,59 +122,179 @@ class LinkedInAccountScraper:
         
         return staff_df
     
+    def iter_staff(self, params: StaffSearchParams) -> Iterator[Dict[str, Any]]:
+        """
+        Staff records as plain dicts, without building a DataFrame. Same rows
+        and order as scrape_staff (hidden "LinkedIn Member" profiles last) and
+        missing numbers stay None instead of becoming NaN. This is not a
+        stream: staffspy finishes the whole search before the first record is
+        yielded, only the per-record conversion is deferred. Raises
+        AccountBlockedError once LinkedIn has put the account on cooldown.
+        """
+        self.ensure_initialized()
+        if self.account.on_block:
+            # staffspy only logs this; raise so the pool rests the account
+            raise AccountBlockedError("LinkedIn account is on cooldown after a 429, it needs a new login")
+        try:
+            # the scraper LinkedInAccount.scrape_staff wraps; not public API,
+            # so a staffspy release that moves it gets the DataFrame path
+            from staffspy.linkedin.linkedin import LinkedInScraper
+        except ImportError:
+            LinkedInScraper = None
+        if LinkedInScraper is None:
+            staff_df = self.scrape_staff(params)
+            if staff_df is None:
+                raise AccountBlockedError("LinkedIn account is on cooldown after a 429, it needs a new login")
+            yield from staff_df.to_dict("records")
+            return
+
+        li_scraper = LinkedInScraper(self.account.session)
+        staff = li_scraper.scrape_staff(
+            company_name=params.company_name,
+            search_term=params.search_term,
+            location=params.location,
+            extra_profile_data=params.extra_profile_data,
+            max_results=params.max_results,
+            block=params.block,
+            connect=params.connect
+        )
+        if getattr(li_scraper, "on_block", False):
+            self.account.on_block = True
+
+        hidden = []
+        for member in staff:
+            if member.name == HIDDEN_MEMBER_NAME:
+                hidden.append(member)
+            else:
+                yield member.to_dict()
+        for member in hidden:
+            yield member.to_dict()
+    
     def scrape_staff_to_dict(
         self, 
         params: StaffSearchParams
     ) -> List[Dict[str, Any]]:
  
-        df = self.scrape_staff(params)
-        return df.to_dict('records') if not df.empty else []
+        return list(self.iter_staff(params))
     
     def close(self):
 
         if self.account:
 
-            self._is_initialized = False
+            self.isInitialized = False
             self.account = None
 
 
+def session_configs(session_files: Optional[str] = None, log_level: int = 1) -> List[LinkedInScraperConfig]:
+    """
+    One config per comma-separated session file, from `session_files` or
+    LINKEDIN_SESSION_FILES, defaulting to the single scraper/session.pkl
+    """
+    session_files = session_files or os.getenv("LINKEDIN_SESSION_FILES") or "scraper/session.pkl"
+    return [
+        LinkedInScraperConfig(session_file=path.strip(), log_level=log_level)
+        for path in session_files.split(",")
+        if path.strip()
+    ]
+
+
 class LinkedInScraperService:
 
+    DISPATCH_STRATEGY = "least_loaded"
+    MAX_QUEUED_SEARCHES = 100
+    REQUEST_INTERVAL = 5.0
+    FAILURE_COOLDOWN = 60.0
+    # how long structured referral contacts are reused across users
+    CONTACT_CACHE_TTL = 24 * 60 * 60
     
     _instance: Optional['LinkedInScraperService'] = None
     _scraper: Optional[LinkedInAccountScraper] = None
+    _pool: Optional[StaffScraperPool] = None
+    _init_task: Optional[asyncio.Task] = None
+    cold_start_seconds: Optional[float] = None
+    account_warm_up: Dict[str, Optional[float]] = {}
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
     
-    def initialize(self, config: LinkedInScraperConfig):
-
-        if self._scraper is None:
-            self._scraper = LinkedInAccountScraper(config)
-            self._scraper.init_account()
+    def initialize(self, config: Union[LinkedInScraperConfig, List[LinkedInScraperConfig]]):
+        """
+        Pool one account per config. Accounts log in lazily on their own
+        worker thread, so this never blocks the event loop.
+        """
+        if self._pool is None:
+            configs = config if isinstance(config, list) else [config]
+            scrapers = [LinkedInAccountScraper(account_config) for account_config in configs]
+            self._scraper = scrapers[0]
+            self._pool = StaffScraperPool(
+                scrapers,
+                strategy=self.DISPATCH_STRATEGY,
+                max_queue=self.MAX_QUEUED_SEARCHES,
+                request_interval=self.REQUEST_INTERVAL,
+                failure_cooldown=self.FAILURE_COOLDOWN,
+            )
     
+    async def ainitialize(self, config: Union[LinkedInScraperConfig, List[LinkedInScraperConfig]]) -> None:
+        """
+        Create the pool and log every account in off the event loop. Callers
+        that arrive while this is running wait on the same initialization; a
+        failed one is retried by the next caller.
+        """
+        task = self._init_task
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            self._init_task = asyncio.create_task(self._warm_up(config))
+        await asyncio.shield(self._init_task)
+
+    async def _warm_up(self, config: Union[LinkedInScraperConfig, List[LinkedInScraperConfig]]) -> None:
+        started = time.perf_counter()
+        self.initialize(config)
+        self.account_warm_up = await self.get_pool().warm_up()
+        self.cold_start_seconds = round(time.perf_counter() - started, 3)
+        print(f"LinkedIn scraper service ready in {self.cold_start_seconds}s (accounts: {self.account_warm_up})")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cold_start_seconds": self.cold_start_seconds,
+            "account_warm_up": self.account_warm_up,
+            "pool": self._pool.stats() if self._pool else None,
+        }
+
     def get_scraper(self) -> LinkedInAccountScraper:
 
         if self._scraper is None:
             raise RuntimeError("Scraper not initialized. Call initialize() first.")
         return self._scraper
+
+    def get_pool(self) -> StaffScraperPool:
+
+        if self._pool is None:
+            raise RuntimeError("Scraper not initialized. Call initialize() first.")
+        return self._pool
+
+    async def scrape_staff(self, params: StaffSearchParams) -> List[Dict[str, Any]]:
+        """
+        Run a staff search on the next free account
+        """
+        return await self.get_pool().scrape(params)
     
     def shutdown(self):
 
-        if self._scraper:
-            self._scraper.close()
-            self._scraper = None
+        if self._init_task and not self._init_task.done():
+            self._init_task.cancel()
+        self._init_task = None
+        if self._pool:
+            self._pool.close()
+            self._pool = None
+        self._scraper = None
 
 
 async def main():
-    config = LinkedInScraperConfig(session_file="session.pkl", log_level=1)
     service = LinkedInScraperService()
-    service.initialize(config=config)
 
     try:
-        scraper = service.get_scraper()
+        await service.ainitialize(session_configs())
         params = StaffSearchParams(
             company_name="Google",
             search_term="software engineer",
@@ -156,12 +303,7 @@ async def main():
             max_results=10
         )
 
-        loop = asyncio.get_event_loop()
-        results = await loop.run_in_executor(
-            None,
-            scraper.scrape_staff_to_dict,
-            params
-        )
+        results = await service.scrape_staff(params)
 
         print(f"Found {len(results)} people")
 
@@ -0,0 +1,232 @@
+import asyncio
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """
+    Async token bucket: refills `rate` tokens per second up to `capacity`.
+    Its lock belongs to the event loop that last used it, so one bucket
+    keeps working across successive asyncio.run() calls
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _lock_for_loop(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._lock = loop, asyncio.Lock()
+        return self._lock
+
+    def _refill(self, now: float) -> None:
+        if self._updated_at is not None:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        async with self._lock_for_loop():
+            while True:
+                self._refill(loop.time())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class HostRateLimiter:
+    """
+    Keeps one TokenBucket per host so every request to the same host shares a budget
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.capacity)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        await self.bucket_for(url).acquire()
+
+
+_default_limiter: Optional[HostRateLimiter] = None
+
+
+def default_rate_limiter(rate: float, capacity: int) -> HostRateLimiter:
+    """
+    Process-wide limiter shared by every scraper instance, so concurrent
+    requests together stay within one budget per host; `rate` and
+    `capacity` only apply on the first call
+    """
+    global _default_limiter
+    if _default_limiter is None:
+        _default_limiter = HostRateLimiter(rate, capacity)
+    elif (rate, capacity) != (_default_limiter.rate, _default_limiter.capacity):
+        print(
+            f"default_rate_limiter: ignoring rate={rate} capacity={capacity}, the shared limiter "
+            f"was created with rate={_default_limiter.rate} capacity={_default_limiter.capacity}"
+        )
+    return _default_limiter
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD limit on in-flight requests: the limit grows by one after
+    `increase_after` healthy responses in a row and is cut by
+    `backoff_factor` on every throttle signal, which also pauses all new
+    requests until the cooldown (Retry-After or `default_cooldown`) expires.
+    Cooldowns are capped at `max_cooldown`; on_throttle() returns False when
+    the server asked for longer, and the request should fail instead of
+    waiting. Like TokenBucket, it rebinds to whichever event loop uses it;
+    slots still held by a previous loop are released, since that loop can
+    no longer release them.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        increase_after: int,
+        default_cooldown: float,
+        backoff_factor: float = 0.5,
+        max_cooldown: float = float("inf"),
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= max_limit")
+        self.limit = max(min_limit, min(initial_limit, max_limit))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_after = increase_after
+        self.default_cooldown = default_cooldown
+        self.backoff_factor = backoff_factor
+        self.max_cooldown = max_cooldown
+        self.in_flight = 0
+        self.successes = 0
+        self.throttled = 0
+        self.failures = 0
+        self.retries = 0
+        self._streak = 0
+        self._cooldown_until = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _cond(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._condition = loop, asyncio.Condition()
+            self.in_flight = 0
+        return self._condition
+
+    def _now(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    async def acquire(self) -> None:
+        cond = self._cond()
+        while True:
+            remaining = self._cooldown_until - self._now()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+                continue
+            async with cond:
+                if self.in_flight < self.limit and self._cooldown_until <= self._now():
+                    self.in_flight += 1
+                    return
+                if self.in_flight >= self.limit:
+                    await cond.wait()
+
+    async def release(self) -> None:
+        cond = self._cond()
+        async with cond:
+            self.in_flight -= 1
+            cond.notify_all()
+
+    def on_success(self) -> None:
+        self.successes += 1
+        self._streak += 1
+        if self._streak >= self.increase_after and self.limit < self.max_limit:
+            self.limit += 1
+            self._streak = 0
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> bool:
+        self.throttled += 1
+        self._streak = 0
+        self.limit = max(self.min_limit, int(self.limit * self.backoff_factor))
+        cooldown = retry_after if retry_after is not None else self.default_cooldown
+        self._cooldown_until = max(self._cooldown_until, self._now() + min(cooldown, self.max_cooldown))
+        return cooldown <= self.max_cooldown
+
+    def on_failure(self) -> None:
+        self.failures += 1
+        self._streak = 0
+
+    def metrics(self) -> Dict[str, float]:
+        try:
+            cooldown_remaining = max(0.0, self._cooldown_until - self._now())
+        except RuntimeError:
+            cooldown_remaining = 0.0
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "successes": self.successes,
+            "throttled": self.throttled,
+            "failures": self.failures,
+            "retries": self.retries,
+            "cooldown_remaining": round(cooldown_remaining, 2),
+        }
+
+
+class HostConcurrencyController:
+    """
+    Keeps one AdaptiveConcurrencyController per host, created on first use
+    with the same settings, so every request to the same host shares its
+    limit and cooldown
+    """
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self._controllers: Dict[str, AdaptiveConcurrencyController] = {}
+
+    def controller_for(self, url: str) -> AdaptiveConcurrencyController:
+        host = urlsplit(url).netloc
+        controller = self._controllers.get(host)
+        if controller is None:
+            controller = AdaptiveConcurrencyController(**self.settings)
+            self._controllers[host] = controller
+        return controller
+
+
+_default_controllers: Optional[HostConcurrencyController] = None
+
+
+def default_concurrency_controller(**settings) -> HostConcurrencyController:
+    """
+    Process-wide per-host controllers shared by every scraper instance;
+    `settings` only apply on the first call
+    """
+    global _default_controllers
+    if _default_controllers is None:
+        _default_controllers = HostConcurrencyController(**settings)
+    elif settings != _default_controllers.settings:
+        print(
+            f"default_concurrency_controller: ignoring {settings}, the shared controllers "
+            f"were created with {_default_controllers.settings}"
+        )
+    return _default_controllers
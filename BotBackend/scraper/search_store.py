@@ -0,0 +1,135 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+
+def search_key(keywords: str, location: str) -> str:
+    return f"{' '.join(keywords.lower().split())}|{' '.join(location.lower().split())}"
+
+
+@dataclass
+class SavedSearch:
+    """
+    What an incremental crawl remembers about one (keywords, location) pair:
+    the jobs it returned (newest first, as dicts) and the highest numeric
+    job ID it has seen. IDs increase with posting time, so with results
+    sorted by date any ID at or below the mark was already crawled.
+    """
+
+    jobs: List[Dict[str, Any]] = field(default_factory=list)
+    high_water_mark: int = 0
+    refreshed_at: float = 0.0
+    _keys: Optional[Set[str]] = field(default=None, repr=False, compare=False)
+
+    def known(self, job_id: Optional[str], job_link: str) -> bool:
+        if self.high_water_mark and job_id and job_id.isdigit() and int(job_id) <= self.high_water_mark:
+            return True
+        if self._keys is None:
+            self._keys = {job.get("job_id") or job["job_link"] for job in self.jobs}
+        return (job_id or job_link) in self._keys
+
+
+class SearchStore:
+    def load(self, keywords: str, location: str) -> SavedSearch:
+        raise NotImplementedError
+
+    def save(self, keywords: str, location: str, saved: SavedSearch) -> None:
+        raise NotImplementedError
+
+    def prune(self, max_age: float) -> int:
+        """
+        Drop searches not refreshed within `max_age` seconds; returns how many
+        """
+        raise NotImplementedError
+
+
+class MemorySearchStore(SearchStore):
+    def __init__(self):
+        self._searches: Dict[str, SavedSearch] = {}
+
+    def load(self, keywords: str, location: str) -> SavedSearch:
+        return self._searches.get(search_key(keywords, location)) or SavedSearch()
+
+    def save(self, keywords: str, location: str, saved: SavedSearch) -> None:
+        self._searches[search_key(keywords, location)] = saved
+
+    def prune(self, max_age: float) -> int:
+        cutoff = time.time() - max_age
+        stale = [key for key, saved in self._searches.items() if saved.refreshed_at < cutoff]
+        for key in stale:
+            del self._searches[key]
+        return len(stale)
+
+
+class SQLiteSearchStore(SearchStore):
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS saved_searches (
+                search_key TEXT PRIMARY KEY,
+                jobs TEXT NOT NULL,
+                high_water_mark INTEGER NOT NULL,
+                refreshed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS saved_searches_refreshed_at ON saved_searches (refreshed_at)")
+        self._conn.commit()
+
+    def load(self, keywords: str, location: str) -> SavedSearch:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT jobs, high_water_mark, refreshed_at FROM saved_searches WHERE search_key = ?",
+                (search_key(keywords, location),),
+            ).fetchone()
+        if not row:
+            return SavedSearch()
+        return SavedSearch(jobs=json.loads(row[0]), high_water_mark=row[1], refreshed_at=row[2])
+
+    def save(self, keywords: str, location: str, saved: SavedSearch) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO saved_searches VALUES (?, ?, ?, ?)",
+                (
+                    search_key(keywords, location),
+                    json.dumps(saved.jobs, ensure_ascii=False),
+                    saved.high_water_mark,
+                    saved.refreshed_at or time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def prune(self, max_age: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM saved_searches WHERE refreshed_at < ?", (time.time() - max_age,))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_default_store: Optional[SearchStore] = None
+
+
+def default_search_store() -> SearchStore:
+    """
+    Process-wide store, kept next to the job index in SQLite when
+    SCRAPER_INDEX_PATH is set, otherwise in memory
+    """
+    global _default_store
+    if _default_store is None:
+        path = os.getenv("SCRAPER_INDEX_PATH")
+        _default_store = SQLiteSearchStore(path) if path else MemorySearchStore()
+    return _default_store
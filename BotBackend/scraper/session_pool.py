@@ -0,0 +1,120 @@
+from typing import Dict, Optional
+import aiohttp
+
+
+class SessionPool:
+    """
+    One aiohttp ClientSession over a keep-alive TCPConnector with a DNS
+    cache. A trace config counts new vs reused connections so pooling can be
+    verified from stats().
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        limit: int = 20,
+        limit_per_host: int = 10,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30,
+        total_timeout: float = 30,
+    ):
+        self.headers = headers
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.total_timeout = total_timeout
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            self.requests += 1
+
+        async def on_connection_create_end(session, ctx, params):
+            self.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.connections_reused += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx, params):
+            self.dns_cache_misses += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace
+
+    @property
+    def is_open(self) -> bool:
+        return self.session is not None and not self.session.closed
+
+    async def start(self) -> aiohttp.ClientSession:
+        if not self.is_open:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.total_timeout),
+                connector=connector,
+                headers=self.headers,
+                trace_configs=[self._trace_config()],
+            )
+        return self.session
+
+    async def close(self) -> None:
+        if self.is_open:
+            await self.session.close()
+        self.session = None
+
+    def stats(self) -> Dict[str, float]:
+        connections = self.connections_created + self.connections_reused
+        return {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "reuse_ratio": round(self.connections_reused / connections, 3) if connections else 0.0,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+        }
+
+
+_shared_pool: Optional[SessionPool] = None
+
+
+def get_shared_pool() -> Optional[SessionPool]:
+    """
+    The process-wide pool if one was started (see main.py lifespan)
+    """
+    if _shared_pool is not None and _shared_pool.is_open:
+        return _shared_pool
+    return None
+
+
+async def start_shared_pool(pool: SessionPool) -> SessionPool:
+    global _shared_pool
+    await close_shared_pool()
+    await pool.start()
+    _shared_pool = pool
+    return pool
+
+
+async def close_shared_pool() -> None:
+    global _shared_pool
+    if _shared_pool is not None:
+        await _shared_pool.close()
+        _shared_pool = None
@@ -0,0 +1,211 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+STRATEGIES = ("least_loaded", "round_robin")
+
+
+class AccountWorker:
+    """
+    One LinkedIn account (a LinkedInAccountScraper or anything with
+    scrape_staff_to_dict/close) on its own thread. The account is only ever
+    touched from that thread, one search at a time, and rests for a cooldown
+    after each search (longer, doubling, after failures). An account LinkedIn
+    has blocked (scraper.blocked) rests for `max_cooldown` and is closed, so
+    its next search logs in again.
+    """
+
+    def __init__(self, name: str, scraper: Any, request_interval: float, failure_cooldown: float, max_cooldown: float):
+        self.name = name
+        self.scraper = scraper
+        self.request_interval = request_interval
+        self.failure_cooldown = failure_cooldown
+        self.max_cooldown = max_cooldown
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"staff-{name}")
+        self.busy = False
+        self.cooldown_until = 0.0
+        self.completed = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.blocks = 0
+
+    def available(self, now: float) -> bool:
+        return not self.busy and now >= self.cooldown_until
+
+    async def run(self, params: Any) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        try:
+            records = await loop.run_in_executor(self.executor, self.scraper.scrape_staff_to_dict, params)
+        except Exception:
+            self.failures += 1
+            self.consecutive_failures += 1
+            backoff = self.failure_cooldown * 2 ** (self.consecutive_failures - 1)
+            self.cooldown_until = time.monotonic() + min(backoff, self.max_cooldown)
+            await self._reset_if_blocked()
+            raise
+        self.completed += 1
+        self.consecutive_failures = 0
+        self.cooldown_until = time.monotonic() + self.request_interval
+        await self._reset_if_blocked()
+        return records
+
+    async def _reset_if_blocked(self) -> None:
+        if not getattr(self.scraper, "blocked", False):
+            return
+        self.blocks += 1
+        self.cooldown_until = time.monotonic() + self.max_cooldown
+        print(f"Account {self.name} was blocked by LinkedIn, resting it {self.max_cooldown:.0f}s before a new login.")
+        await asyncio.get_running_loop().run_in_executor(self.executor, self.scraper.close)
+
+    async def warm_up(self) -> float:
+        """
+        Log the account in on its own thread ahead of the first search;
+        returns the seconds it took
+        """
+        started = time.perf_counter()
+        ensure_initialized = getattr(self.scraper, "ensure_initialized", None)
+        if ensure_initialized is not None:
+            await asyncio.get_running_loop().run_in_executor(self.executor, ensure_initialized)
+        return time.perf_counter() - started
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.scraper.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "busy": self.busy,
+            "completed": self.completed,
+            "failures": self.failures,
+            "blocks": self.blocks,
+            "cooldown_remaining": round(max(0.0, self.cooldown_until - time.monotonic()), 2),
+        }
+
+
+class StaffScraperPool:
+    """
+    Dispatches staff searches across several accounts. Searches wait in a
+    bounded queue (scrape() blocks the caller once `max_queue` are waiting)
+    and go to the next free account, either round-robin or least-loaded
+    (fewest searches so far), skipping accounts that are cooling down.
+    """
+
+    def __init__(
+        self,
+        scrapers: List[Any],
+        strategy: str = "least_loaded",
+        max_queue: int = 100,
+        request_interval: float = 5.0,
+        failure_cooldown: float = 60.0,
+        max_cooldown: float = 15 * 60.0,
+    ):
+        if not scrapers:
+            raise ValueError("StaffScraperPool needs at least one account")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown dispatch strategy {strategy!r}, expected one of {STRATEGIES}")
+        self.workers = [
+            AccountWorker(str(i), scraper, request_interval, failure_cooldown, max_cooldown)
+            for i, scraper in enumerate(scrapers)
+        ]
+        self.strategy = strategy
+        self.max_queue = max_queue
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._next = 0
+        self._running: set = set()
+
+    def _ensure_started(self) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._changed = asyncio.Event()
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def scrape(self, params: Any) -> List[Dict[str, Any]]:
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((params, future))
+        return await future
+
+    def _pick(self, now: float) -> Optional[AccountWorker]:
+        free = [worker for worker in self.workers if worker.available(now)]
+        if not free:
+            return None
+        if self.strategy == "least_loaded":
+            return min(free, key=lambda worker: worker.completed + worker.failures)
+        for offset in range(len(self.workers)):
+            worker = self.workers[(self._next + offset) % len(self.workers)]
+            if worker in free:
+                self._next = (self._next + offset + 1) % len(self.workers)
+                return worker
+        return None
+
+    async def _acquire(self) -> AccountWorker:
+        while True:
+            self._changed.clear()
+            now = time.monotonic()
+            worker = self._pick(now)
+            if worker is not None:
+                worker.busy = True
+                return worker
+            # wake when a search finishes or the earliest cooldown ends
+            resting = [worker.cooldown_until - now for worker in self.workers if not worker.busy]
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=min(resting) if resting else None)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _dispatch(self) -> None:
+        while True:
+            params, future = await self._queue.get()
+            if future.done():
+                # the caller went away while queued
+                continue
+            worker = await self._acquire()
+            task = asyncio.create_task(self._run(worker, params, future))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, worker: AccountWorker, params: Any, future: asyncio.Future) -> None:
+        try:
+            records = await worker.run(params)
+            if not future.done():
+                future.set_result(records)
+        except Exception as e:
+            print(f"Staff search on account {worker.name} failed: {e}")
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            worker.busy = False
+            self._changed.set()
+
+    async def warm_up(self) -> Dict[str, Optional[float]]:
+        """
+        Log every account in concurrently; seconds per account, None for
+        accounts that failed (they log in again on their first search)
+        """
+        results = await asyncio.gather(*(worker.warm_up() for worker in self.workers), return_exceptions=True)
+        timings: Dict[str, Optional[float]] = {}
+        for worker, result in zip(self.workers, results):
+            if isinstance(result, BaseException):
+                print(f"Warm-up of account {worker.name} failed: {result}")
+                timings[worker.name] = None
+            else:
+                timings[worker.name] = round(result, 3)
+        return timings
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "strategy": self.strategy,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "accounts": {worker.name: worker.stats() for worker in self.workers},
+        }
+
+    def close(self) -> None:
+        for task in [self._dispatcher, *self._running]:
+            if task is not None:
+                task.cancel()
+        self._dispatcher = None
+        for worker in self.workers:
+            worker.close()
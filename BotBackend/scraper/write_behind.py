@@ -0,0 +1,113 @@
+import atexit
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class WriteBehind:
+    """
+    Keyed write-behind buffer for the SQLite stores. put() only records the
+    value; a background thread hands everything put since the last flush to
+    `write(values)` at most every `interval` seconds, so callers on the event
+    loop never wait on an INSERT or a commit. A key put again before the
+    flush keeps only its latest value, and get() sees values that are not
+    written yet. A batch whose write fails is put back and retried on the
+    next flush (a key put again meanwhile keeps its newer value); after
+    `max_retries` failed attempts in a row the batch is dropped and counted.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[Any]], None],
+        interval: float = 0.5,
+        name: str = "write-behind",
+        max_retries: int = 3,
+    ):
+        self.write = write
+        self.interval = interval
+        self.name = name
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[Hashable, Any] = {}
+        self._writing: Dict[Hashable, Any] = {}
+        self._wake = threading.Event()
+        self._closed = False
+        self.flushes = 0
+        self.failures = 0
+        self.dropped = 0
+        self._attempts = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        # whatever is still pending at interpreter exit is written, not dropped
+        atexit.register(self.close)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._pending[key] = value
+        self._wake.set()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._pending.get(key)
+            return value if value is not None else self._writing.get(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": len(self),
+            "flushes": self.flushes,
+            "failures": self.failures,
+            "dropped": self.dropped,
+        }
+
+    def flush(self) -> None:
+        """
+        Write everything put so far, on the calling thread
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                self._writing, self._pending = self._pending, {}
+            try:
+                self.write(list(self._writing.values()))
+                self.flushes += 1
+                self._attempts = 0
+            except Exception as e:
+                self.failures += 1
+                self._attempts += 1
+                if self._attempts >= self.max_retries:
+                    print(f"{self.name}: dropping {len(self._writing)} rows after {self._attempts} failed writes: {e}")
+                    self.dropped += len(self._writing)
+                    self._attempts = 0
+                else:
+                    print(f"{self.name}: write of {len(self._writing)} rows failed, retrying: {e}")
+                    with self._lock:
+                        # values put since the batch was taken are newer and win
+                        self._pending = {**self._writing, **self._pending}
+                    self._wake.set()
+            finally:
+                with self._lock:
+                    self._writing = {}
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait()
+            self._wake.clear()
+            if not self._closed:
+                # let writes arriving close together share one commit
+                time.sleep(self.interval)
+            self.flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        atexit.unregister(self.close)
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List, cast
+from dataclasses import asdict
 import asyncio
 import os
-import tempfile
 from pathlib import Path
 import sys
 
@@ -12,7 +13,13 @@ backend_dir = current_file.parent.parent.parent  # Goes from apis -> server -> b
 sys.path.insert(0, str(backend_dir))
 
 
+from db.database import default_database
+from pdf_extract import MAX_PDF_BYTES, default_pdf_extractor
 from resumeagent import resume_subgraph
+from scraper.job_scraper import LinkedInJobsScraper
+from server.apis.sse import sse_event
+from scraper.session_pool import get_shared_pool
+from scraper.profile_scraper import LinkedInScraperService
 from state.resumeState import JobMatchingAgentState, ProfileSchema
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
@@ -42,19 +49,17 @@ async def match_jobs_from_resume(
 ):
     if not resume_file.filename or not resume_file.filename.endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
-    
-    temp_file_path = None
+
+    # kept in memory and handed to the PDF extraction pool; reading one byte
+    # past the cap is enough to reject oversized uploads
+    content = await resume_file.read(MAX_PDF_BYTES + 1)
+    if len(content) > MAX_PDF_BYTES:
+        raise HTTPException(status_code=413, detail=f"Resume must be at most {MAX_PDF_BYTES // (1024 * 1024)} MB")
+
     try:
-        # Create a temporary file to store the uploaded resume
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-        content = await resume_file.read()
-        temp_file.write(content)
-        temp_file.close()
-        temp_file_path = temp_file.name
-        
         input_state = {
             "user_id": user_id,
-            "file_path": temp_file_path,
+            "resume_pdf": content,
             "prefered_role": prefered_role,
             "prefered_location": prefered_location,
             "raw_text": "",             
@@ -90,11 +95,6 @@ async def match_jobs_from_resume(
             status_code=500,
             detail=f"Error processing resume: {str(e)}"
         )
-    
-    finally:
-        # Clean up temporary file
-        if temp_file_path and os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
 
 
 @router.post("/match-jobs-existing", response_model=JobSearchResponse)
@@ -117,12 +117,14 @@ async def match_jobs_from_existing_resume(request: JobSearchRequest):
     
     if not os.path.exists(request.file_path):
         raise HTTPException(status_code=404, detail="Resume file not found")
+    if os.path.getsize(request.file_path) > MAX_PDF_BYTES:
+        raise HTTPException(status_code=413, detail=f"Resume must be at most {MAX_PDF_BYTES // (1024 * 1024)} MB")
     
     try:
         # Prepare input state for the agent - only required fields
         input_state = {
             "user_id": request.user_id,
-            "file_path": request.file_path,
+            "resume_pdf": await asyncio.to_thread(Path(request.file_path).read_bytes),
             "prefered_role": request.prefered_role,
             "prefered_location": request.prefered_location
         }
@@ -156,6 +158,53 @@ async def match_jobs_from_existing_resume(request: JobSearchRequest):
         )
 
 
+@router.get("/match-jobs/stream")
+async def stream_matching_jobs(prefered_role: str, prefered_location: str, max_jobs: int = 5):
+    """
+    Stream jobs as Server-Sent Events while LinkedIn is still being scraped.
+
+    Events:
+    - job: a job card was parsed (description is still null)
+    - description: the same job (same job_link) with its description filled in
+    - error: scraping failed, detail in data
+    - done: scraping finished, data carries job_count
+    """
+    if not 1 <= max_jobs <= 100:
+        raise HTTPException(status_code=400, detail="max_jobs must be between 1 and 100")
+
+    async def events():
+        job_count = 0
+        try:
+            async with LinkedInJobsScraper() as scraper:
+                async for job in scraper.scrape_jobs_iter(prefered_role, prefered_location, max_jobs=max_jobs):
+                    if job.description is None:
+                        job_count += 1
+                        yield sse_event("job", asdict(job))
+                    else:
+                        yield sse_event("description", asdict(job))
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Error scraping jobs: {str(e)}"})
+        yield sse_event("done", {"job_count": job_count})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/scraper/stats")
+async def scraper_stats():
+    """Connection reuse counters of the shared scraper session pool, staff account pool, cold-start time, database call timings and PDF extraction counters"""
+    pool = get_shared_pool()
+    return {
+        "session_pool": pool.stats() if pool else None,
+        "staff_scraper": LinkedInScraperService().stats(),
+        "database": default_database().stats(),
+        "pdf_extractor": default_pdf_extractor().stats(),
+    }
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint for the jobs router"""
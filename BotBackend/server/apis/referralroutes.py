@@ -0,0 +1,65 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from typing import List, Optional
+
+from reviewerAgent import MAX_BATCH_COMPANIES, iter_batch_referrals
+from server.apis.sse import sse_event
+
+router = APIRouter(prefix="/referrals", tags=["referrals"])
+
+
+class BatchReferralRequest(BaseModel):
+    user_id: str
+    company_names: List[str]
+    search_term: Optional[str] = None
+    location: Optional[str] = None
+    max_results: int = 1
+
+
+@router.post("/batch/stream")
+async def stream_batch_referrals(request: BatchReferralRequest):
+    """
+    Search referrals at several companies at once, streamed as Server-Sent
+    Events while the searches run concurrently.
+
+    Events:
+    - company: one company finished, data carries company_name, status
+      (CACHED, STRUCTURED or FAILED) and its contacts
+    - stored: every new contact was written in one insert, data carries stored
+    - error: the batch failed, detail in data
+    - done: the batch finished
+    """
+    if not 1 <= len(request.company_names) <= MAX_BATCH_COMPANIES:
+        raise HTTPException(status_code=400, detail=f"company_names must have between 1 and {MAX_BATCH_COMPANIES} entries")
+    if not 1 <= request.max_results <= 50:
+        raise HTTPException(status_code=400, detail="max_results must be between 1 and 50")
+
+    async def events():
+        try:
+            async for event in iter_batch_referrals(
+                request.user_id,
+                request.company_names,
+                request.search_term,
+                request.location,
+                request.max_results,
+            ):
+                if event["status"] == "STORED":
+                    yield sse_event("stored", event)
+                else:
+                    yield sse_event("company", {**event, "contacts": [contact.model_dump() for contact in event["contacts"]]})
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Error finding referrals: {str(e)}"})
+        yield sse_event("done", {})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/health")
+async def health_check():
+    """Health check endpoint for the referrals router"""
+    return {"status": "healthy", "service": "referrals"}
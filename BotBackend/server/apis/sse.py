@@ -0,0 +1,9 @@
+import json
+from typing import Any
+
+
+def sse_event(event: str, data: Any) -> str:
+    """
+    One Server-Sent Events message, `data` serialized as JSON
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
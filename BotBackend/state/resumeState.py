@@ -1,4 +1,5 @@
-from typing import Any, Dict, Literal, Optional, TypedDict,List
+import operator
+from typing import Annotated, Any, Dict, Literal, Optional, Tuple, TypedDict,List
 
 from pydantic import BaseModel, Field
 
@@ -18,11 +19,19 @@ class ProfileSchema(BaseModel):
 
 class JobMatchingAgentState(TypedDict):
     user_id:str
+    # PDF uploaded with the request; loaded from Supabase when absent
+    resume_pdf: Optional[bytes]
     raw_text: str
+    # sha256 of the resume PDF and of the resume embedded for the user (db/resume_memo.py)
+    resume_hash: str
+    embedded_hash: Optional[str]
     extracted_data: ProfileSchema
     prefered_location:str
     prefered_role:str
     ScrapedJobs:Dict
+    # node -> (start, end) perf_counter seconds, merged across parallel branches
+    timings:Annotated[Dict[str, Tuple[float, float]], operator.or_]
+    timing_breakdown:Dict[str, float]
     
     status:Literal[
         "STARTING",
@@ -33,3 +42,11 @@ class JobMatchingAgentState(TypedDict):
         "FAILED"
     ]
 
+class ResumeProfileState(TypedDict):
+    """
+    What the resume branch hands back to the job matching graph
+    """
+    resume_hash: str
+    embedded_hash: Optional[str]
+    extracted_data: ProfileSchema
+    timings:Annotated[Dict[str, Tuple[float, float]], operator.or_]